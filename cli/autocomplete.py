@@ -59,6 +59,19 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--load-balancing',
+            '--channels-per-replica',
+            '--stream-window',
+            '--max-attempts',
+            '--retry-backoff',
+            '--outlier-failures',
+            '--outlier-latency-factor',
+            '--outlier-ejection-time',
+            '--circuit-breaker-failures',
+            '--circuit-breaker-reset-time',
+            '--hedge-endpoints',
+            '--hedge-percentile',
+            '--hedge-budget',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -66,7 +79,12 @@ ac_table = {
             '--py-modules',
             '--port-in',
             '--host-in',
+            '--disable-uds',
+            '--uds-dir',
+            '--fused-executors',
             '--native',
+            '--executor-pool',
+            '--executor-pool-size',
             '--entrypoint',
             '--docker-kwargs',
             '--pull-latest',
@@ -74,6 +92,9 @@ ac_table = {
             '--gpus',
             '--host',
             '--port-jinad',
+            '--compress',
+            '--compress-min-bytes',
+            '--compress-min-ratio',
             '--quiet-remote-logs',
             '--upload-files',
             '--disable-remote',
@@ -96,6 +117,8 @@ ac_table = {
             '--uses-before-address',
             '--uses-after-address',
             '--connection-list',
+            '--merge-top-k-by',
+            '--merge-top-k-descending',
         ],
         'flow': [
             '--help',
@@ -110,9 +133,25 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--load-balancing',
+            '--channels-per-replica',
+            '--stream-window',
+            '--max-attempts',
+            '--retry-backoff',
+            '--outlier-failures',
+            '--outlier-latency-factor',
+            '--outlier-ejection-time',
+            '--circuit-breaker-failures',
+            '--circuit-breaker-reset-time',
+            '--hedge-endpoints',
+            '--hedge-percentile',
+            '--hedge-budget',
             '--uses',
             '--env',
             '--inspect',
+            '--head-bypass',
+            '--in-process',
+            '--fuse',
         ],
         'ping': ['--help', '--timeout', '--retries'],
         'gateway': [
@@ -128,6 +167,19 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--load-balancing',
+            '--channels-per-replica',
+            '--stream-window',
+            '--max-attempts',
+            '--retry-backoff',
+            '--outlier-failures',
+            '--outlier-latency-factor',
+            '--outlier-ejection-time',
+            '--circuit-breaker-failures',
+            '--circuit-breaker-reset-time',
+            '--hedge-endpoints',
+            '--hedge-percentile',
+            '--hedge-budget',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -135,8 +187,16 @@ ac_table = {
             '--py-modules',
             '--port-in',
             '--host-in',
+            '--disable-uds',
+            '--uds-dir',
+            '--fused-executors',
             '--native',
+            '--executor-pool',
+            '--executor-pool-size',
             '--prefetch',
+            '--prefetch-adaptive',
+            '--results-in-order',
+            '--reorder-buffer-size',
             '--title',
             '--description',
             '--cors',
@@ -144,6 +204,9 @@ ac_table = {
             '--no-debug-endpoints',
             '--no-crud-endpoints',
             '--expose-endpoints',
+            '--bulk-request-size',
+            '--bulk-prefetch',
+            '--bulk-max-document-size',
             '--uvicorn-kwargs',
             '--compress',
             '--compress-min-bytes',
@@ -152,8 +215,21 @@ ac_table = {
             '--host',
             '--proxy',
             '--port-expose',
+            '--response-cache',
+            '--response-cache-size',
+            '--response-cache-invalidate-on',
+            '--max-inflight-requests',
+            '--max-inflight-bytes',
+            '--max-inflight-requests-per-client',
+            '--max-inflight-bytes-per-client',
+            '--admission-queue-size',
+            '--admission-queue-timeout',
+            '--stats-interval',
             '--graph-description',
             '--deployments-addresses',
+            '--deployments-worker-addresses',
+            '--deployments-in-process',
+            '--deployments-fused',
             '--daemon',
             '--runtime-backend',
             '--runtime',
@@ -170,6 +246,8 @@ ac_table = {
             '--uses-before-address',
             '--uses-after-address',
             '--connection-list',
+            '--merge-top-k-by',
+            '--merge-top-k-descending',
         ],
         'hub new': [
             '--help',
@@ -214,6 +292,19 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--load-balancing',
+            '--channels-per-replica',
+            '--stream-window',
+            '--max-attempts',
+            '--retry-backoff',
+            '--outlier-failures',
+            '--outlier-latency-factor',
+            '--outlier-ejection-time',
+            '--circuit-breaker-failures',
+            '--circuit-breaker-reset-time',
+            '--hedge-endpoints',
+            '--hedge-percentile',
+            '--hedge-budget',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -221,7 +312,12 @@ ac_table = {
             '--py-modules',
             '--port-in',
             '--host-in',
+            '--disable-uds',
+            '--uds-dir',
+            '--fused-executors',
             '--native',
+            '--executor-pool',
+            '--executor-pool-size',
             '--entrypoint',
             '--docker-kwargs',
             '--pull-latest',
@@ -229,6 +325,9 @@ ac_table = {
             '--gpus',
             '--host',
             '--port-jinad',
+            '--compress',
+            '--compress-min-bytes',
+            '--compress-min-ratio',
             '--quiet-remote-logs',
             '--upload-files',
             '--disable-remote',
@@ -251,6 +350,8 @@ ac_table = {
             '--uses-before-address',
             '--uses-after-address',
             '--connection-list',
+            '--merge-top-k-by',
+            '--merge-top-k-descending',
         ],
         'deployment': [
             '--help',
@@ -265,6 +366,19 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--load-balancing',
+            '--channels-per-replica',
+            '--stream-window',
+            '--max-attempts',
+            '--retry-backoff',
+            '--outlier-failures',
+            '--outlier-latency-factor',
+            '--outlier-ejection-time',
+            '--circuit-breaker-failures',
+            '--circuit-breaker-reset-time',
+            '--hedge-endpoints',
+            '--hedge-percentile',
+            '--hedge-budget',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -272,7 +386,12 @@ ac_table = {
             '--py-modules',
             '--port-in',
             '--host-in',
+            '--disable-uds',
+            '--uds-dir',
+            '--fused-executors',
             '--native',
+            '--executor-pool',
+            '--executor-pool-size',
             '--entrypoint',
             '--docker-kwargs',
             '--pull-latest',
@@ -280,6 +399,9 @@ ac_table = {
             '--gpus',
             '--host',
             '--port-jinad',
+            '--compress',
+            '--compress-min-bytes',
+            '--compress-min-ratio',
             '--quiet-remote-logs',
             '--upload-files',
             '--disable-remote',
@@ -302,6 +424,8 @@ ac_table = {
             '--uses-before-address',
             '--uses-after-address',
             '--connection-list',
+            '--merge-top-k-by',
+            '--merge-top-k-descending',
             '--uses-before',
             '--uses-after',
             '--external',
@@ -315,6 +439,13 @@ ac_table = {
             '--https',
             '--asyncio',
             '--results-as-docarray',
+            '--grpc-streams',
+            '--gateway-addresses',
+            '--streams-load-balancing',
+            '--request-builders',
+            '--request-builders-pool',
+            '--request-queue-size',
+            '--preserve-order',
             '--protocol',
         ],
         'export-api': ['--help', '--yaml-path', '--json-path', '--schema-path'],
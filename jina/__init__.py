@@ -64,7 +64,7 @@ __version__ = '3.0.0'
 
 # do not change this line manually
 # this is managed by proto/build-proto.sh and updated on every execution
-__proto_version__ = '0.1.8'
+__proto_version__ = '0.1.11'
 try:
     __docarray_version__ = _docarray.__version__
 except AttributeError as e:
@@ -108,6 +108,7 @@ __docker_host__ = 'host.docker.internal'
 __default_executor__ = 'BaseExecutor'
 __default_reducer_executor__ = 'ReducerExecutor'
 __default_endpoint__ = '/default'
+__protobuf_media_type__ = 'application/x-protobuf'
 __ready_msg__ = 'ready and listening'
 __stop_msg__ = 'terminated'
 __unset_msg__ = '(unset)'
@@ -132,6 +133,7 @@ _names_with_underscore = [
     '__uptime__',
     '__root_dir__',
     '__default_endpoint__',
+    '__protobuf_media_type__',
     '__default_executor__',
     '__num_args_executor_func__',
     '__unset_msg__',
@@ -1,6 +1,6 @@
 """Module wrapping the Client of Jina."""
 import argparse
-from typing import overload, Optional, Union, TYPE_CHECKING
+from typing import overload, List, Optional, Union, TYPE_CHECKING
 
 __all__ = ['Client']
 
@@ -17,12 +17,19 @@ if TYPE_CHECKING:
 def Client(
     *,
     asyncio: Optional[bool] = False,
+    gateway_addresses: Optional[List[str]] = None,
+    grpc_streams: Optional[int] = 1,
     host: Optional[str] = '0.0.0.0',
     https: Optional[bool] = False,
     port: Optional[int] = None,
+    preserve_order: Optional[bool] = False,
     protocol: Optional[str] = 'GRPC',
     proxy: Optional[bool] = False,
+    request_builders: Optional[int] = 0,
+    request_builders_pool: Optional[str] = 'THREAD',
+    request_queue_size: Optional[int] = 16,
     results_as_docarray: Optional[bool] = False,
+    streams_load_balancing: Optional[str] = 'ROUND_ROBIN',
     **kwargs
 ) -> Union[
     'AsyncWebSocketClient',
@@ -35,12 +42,23 @@ def Client(
     """Create a Client. Client is how user interact with Flow
 
     :param asyncio: If set, then the input and output of this Client work in an asynchronous manner.
+    :param gateway_addresses: The addresses `host:port` of the gateway replicas the gRPC streams are spread across, at least one stream is opened to every address. By default all the streams go to `--host` and `--port`.
+    :param grpc_streams: The number of gRPC channels the client opens, each with its own stream to the gateway. The requests are spread across the streams, so that the client is not bound to a single connection.
     :param host: The host address of the runtime, by default it is 0.0.0.0.
     :param https: If set, connect to gateway using https
     :param port: The port of the Gateway, which the client should connect to.
+    :param preserve_order: If set, the responses are returned in the order of the requests, even when the Flow or the streams complete them out of order.
     :param protocol: Communication protocol between server and client.
     :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
+    :param request_builders: The number of threads or processes building and serializing the requests ahead of the stream, so that converting the inputs to Documents does not hold back the client. 0 builds every request when it is sent.
+    :param request_builders_pool: The pool building the requests when `--request-builders` is set:
+              - THREAD: a thread pool, suited for inputs whose conversion releases the GIL, like NumPy arrays
+              - PROCESS: a pool of processes forked from the client, suited for inputs converted by Python code
+    :param request_queue_size: The maximum number of serialized requests built ahead of the stream when `--request-builders` is set. It bounds the memory used by the requests waiting to be sent.
     :param results_as_docarray: If set, return results as DocArray instead of Request.
+    :param streams_load_balancing: The strategy used to select the gRPC stream of each request when there are several:
+              - ROUND_ROBIN: streams take turns in a fixed order
+              - LEAST_OUTSTANDING: the stream with the fewest requests waiting for a response is chosen
     :return: the new Client object
 
     .. # noqa: DAR202
@@ -13,6 +13,8 @@ from jina.logging.predefined import default_logger
 from jina.parsers import set_client_cli_parser
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from jina.clients.request import GeneratorSourceType
     from jina.types.request import Request, Response
 
@@ -104,7 +106,11 @@ class BaseClient(ABC):
         else:
             self._inputs_length = None
 
-        if inspect.isasyncgen(self.inputs):
+        if _kwargs.get('request_builders', 0) > 0:
+            from jina.clients.request.parallel import request_generator
+
+            return request_generator(pool=self._get_request_builders_pool(), **_kwargs)
+        elif inspect.isasyncgen(self.inputs):
             from jina.clients.request.asyncio import request_generator
 
             return request_generator(**_kwargs)
@@ -113,6 +119,19 @@ class BaseClient(ABC):
 
             return request_generator(**_kwargs)
 
+    def _get_request_builders_pool(self) -> 'Executor':
+        from jina.enums import ExecutorPoolType
+
+        if self.args.request_builders_pool == ExecutorPoolType.PROCESS:
+            from jina.helper import start_process_pool
+
+            # fork all processes now, gRPC does not support forking once its threads are running
+            return start_process_pool(self.args.request_builders)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            return ThreadPoolExecutor(max_workers=self.args.request_builders)
+
     @property
     def inputs(self) -> 'InputType':
         """
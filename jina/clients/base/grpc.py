@@ -1,18 +1,164 @@
 import asyncio
-from contextlib import nullcontext
-from typing import TYPE_CHECKING, Optional
+import inspect
+from collections import deque
+from contextlib import AsyncExitStack, nullcontext
+from typing import TYPE_CHECKING, AsyncIterator, Deque, List, Optional
 
 import grpc
 
 from jina.clients.base import BaseClient
 from jina.clients.helper import callback_exec
+from jina.enums import LoadBalancingType
 from jina.excepts import BadClient, BadClientInput
 from jina.logging.profile import ProgressBar
 from jina.proto import jina_pb2_grpc
 from jina.serve.networking import GrpcConnectionPool
+from jina.serve.stream.helper import AsyncRequestsIterator
 
 if TYPE_CHECKING:
     from jina.clients.base import InputType, CallbackFnType
+    from jina.types.request import Request, Response
+
+
+class _MultiStreamCall:
+    """Spreads the requests over the bidirectional streams of several channels and merges their responses"""
+
+    class _EndOfStream:
+        pass
+
+    def __init__(
+        self,
+        stubs: List[jina_pb2_grpc.JinaRPCStub],
+        load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+    ):
+        """
+        :param stubs: the stubs of the channels, one stream is opened on every one
+        :param load_balancing: the strategy used to select the stream of each request
+        """
+        self._stubs = stubs
+        self._load_balancing = load_balancing
+        self._queues = [asyncio.Queue() for _ in stubs]
+        # the requests sent on every stream and not answered yet
+        self._pending = [0] * len(stubs)
+        self._next = 0
+
+    def _pick(self) -> int:
+        start = self._next
+        self._next = (self._next + 1) % len(self._stubs)
+        if self._load_balancing == LoadBalancingType.LEAST_OUTSTANDING:
+            # starting from the round robin choice spreads the ties
+            return min(
+                ((start + k) % len(self._stubs) for k in range(len(self._stubs))),
+                key=lambda i: self._pending[i],
+            )
+        return start
+
+    async def _stream_requests(self, idx: int) -> AsyncIterator['Request']:
+        queue = self._queues[idx]
+        while True:
+            request = await queue.get()
+            if request is self._EndOfStream:
+                return
+            yield request
+
+    async def _dispatch(self, requests, results: asyncio.Queue):
+        try:
+            async for request in AsyncRequestsIterator(iterator=requests):
+                idx = self._pick()
+                self._pending[idx] += 1
+                self._queues[idx].put_nowait(request)
+        except Exception as ex:
+            results.put_nowait(ex)
+        finally:
+            for queue in self._queues:
+                queue.put_nowait(self._EndOfStream)
+
+    async def _read_responses(self, idx: int, call, results: asyncio.Queue):
+        try:
+            async for response in call:
+                self._pending[idx] -= 1
+                results.put_nowait(response)
+        except Exception as ex:
+            results.put_nowait(ex)
+        finally:
+            results.put_nowait(self._EndOfStream)
+
+    async def __call__(self, requests) -> AsyncIterator['Response']:
+        """
+        Streams the requests and yields the responses in the order they are received from any stream
+
+        :param requests: the requests, a blocking or an async iterator
+        :yield: the responses
+        """
+        results = asyncio.Queue()
+        calls = [
+            stub.Call(self._stream_requests(idx))
+            for idx, stub in enumerate(self._stubs)
+        ]
+        tasks = [asyncio.create_task(self._dispatch(requests, results))] + [
+            asyncio.create_task(self._read_responses(idx, call, results))
+            for idx, call in enumerate(calls)
+        ]
+        try:
+            streams_left = len(calls)
+            while streams_left:
+                result = await results.get()
+                if result is self._EndOfStream:
+                    streams_left -= 1
+                elif isinstance(result, Exception):
+                    raise result
+                else:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            for call in calls:
+                call.cancel()
+
+
+def _record_request_ids(requests, request_ids: Deque[str]):
+    """
+    Records the ids of the requests in the order they are sent, keeping the iterator blocking or async
+
+    :param requests: the requests, a blocking or an async iterator
+    :param request_ids: the ids of the requests sent and not answered yet
+    :return: the requests
+    """
+    if inspect.isasyncgen(requests) or hasattr(requests, '__aiter__'):
+
+        async def _async_requests():
+            async for request in requests:
+                request_ids.append(request.header.request_id)
+                yield request
+
+        return _async_requests()
+
+    def _requests():
+        for request in requests:
+            request_ids.append(request.header.request_id)
+            yield request
+
+    return _requests()
+
+
+async def _in_request_order(
+    responses: AsyncIterator['Response'], request_ids: Deque[str]
+) -> AsyncIterator['Response']:
+    """
+    Holds back the responses received before the responses to earlier requests
+
+    :param responses: the responses in the order they are received
+    :param request_ids: the ids of the requests in the order they are sent
+    :yield: the responses in the order of the requests
+    """
+    held_back = {}
+    async for response in responses:
+        held_back[response.header.request_id] = response
+        while request_ids and request_ids[0] in held_back:
+            yield held_back.pop(request_ids.popleft())
+    # the responses whose request id was changed on the way are not held back forever
+    for response in held_back.values():
+        yield response
 
 
 class GRPCBaseClient(BaseClient):
@@ -32,13 +178,48 @@ class GRPCBaseClient(BaseClient):
         try:
             self.inputs = inputs
             req_iter = self._get_requests(**kwargs)
-            async with GrpcConnectionPool.get_grpc_channel(
-                f'{self.args.host}:{self.args.port}',
-                asyncio=True,
-                https=self.args.https,
-            ) as channel:
-                stub = jina_pb2_grpc.JinaRPCStub(channel)
-                self.logger.debug(f'connected to {self.args.host}:{self.args.port}')
+            addresses = getattr(self.args, 'gateway_addresses', None) or [
+                f'{self.args.host}:{self.args.port}'
+            ]
+            num_streams = max(getattr(self.args, 'grpc_streams', 1), len(addresses))
+            options = None
+            if num_streams > len(addresses):
+                # channels with the same target share their connection unless the subchannel pool is local
+                options = GrpcConnectionPool.get_default_grpc_options() + [
+                    ('grpc.use_local_subchannel_pool', 1)
+                ]
+            async with AsyncExitStack() as channels:
+                stubs = []
+                for idx in range(num_streams):
+                    channel = await channels.enter_async_context(
+                        GrpcConnectionPool.get_grpc_channel(
+                            addresses[idx % len(addresses)],
+                            options=options,
+                            asyncio=True,
+                            https=self.args.https,
+                        )
+                    )
+                    stubs.append(jina_pb2_grpc.JinaRPCStub(channel))
+                self.logger.debug(
+                    f'connected to {", ".join(addresses)} with {num_streams} streams'
+                )
+
+                request_ids = deque()
+                if getattr(self.args, 'preserve_order', False):
+                    req_iter = _record_request_ids(req_iter, request_ids)
+                if len(stubs) > 1:
+                    responses = _MultiStreamCall(
+                        stubs,
+                        getattr(
+                            self.args,
+                            'streams_load_balancing',
+                            LoadBalancingType.ROUND_ROBIN,
+                        ),
+                    )(req_iter)
+                else:
+                    responses = stubs[0].Call(req_iter)
+                if getattr(self.args, 'preserve_order', False):
+                    responses = _in_request_order(responses, request_ids)
 
                 cm1 = (
                     ProgressBar(total_length=self._inputs_length)
@@ -47,7 +228,7 @@ class GRPCBaseClient(BaseClient):
                 )
 
                 with cm1 as p_bar:
-                    async for resp in stub.Call(req_iter):
+                    async for resp in responses:
                         callback_exec(
                             response=resp,
                             on_error=on_error,
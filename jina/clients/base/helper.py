@@ -2,6 +2,7 @@ import asyncio
 from typing import TYPE_CHECKING
 from abc import ABC, abstractmethod
 
+from jina import __protobuf_media_type__
 from jina.types.request import Request
 from jina.importer import ImportExtensions
 from jina.types.request.data import DataRequest
@@ -69,12 +70,34 @@ class AioHttpClientlet(ABC):
 class HTTPClientlet(AioHttpClientlet):
     """HTTP Client to be used with the streamer"""
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # the requests are sent as serialized protos until the gateway turns one down
+        self.binary = True
+
     async def send_message(self, request: 'Request'):
         """Sends a POST request to the server
 
-        :param request: request as dict
+        The request is sent as a serialized `DataRequestProto`, a gateway that only accepts JSON answers it with an
+        error and the request is sent again as JSON, like all the following ones.
+
+        :param request: request object
         :return: send post message
         """
+        if self.binary:
+            response = await self.session.post(
+                url=self.url,
+                data=request.to_bytes(),
+                headers={
+                    'Content-Type': __protobuf_media_type__,
+                    'Accept': __protobuf_media_type__,
+                },
+            ).__aenter__()
+            if response.status not in (415, 422):
+                return response
+            self.binary = False
+            response.release()
+
         req_dict = request.to_dict()
         req_dict['exec_endpoint'] = req_dict['header']['exec_endpoint']
 
@@ -2,6 +2,7 @@ import asyncio
 from contextlib import nullcontext, AsyncExitStack
 from typing import Optional, TYPE_CHECKING
 
+from jina import __protobuf_media_type__
 from jina.clients.base.helper import HTTPClientlet
 from jina.clients.base import BaseClient
 from jina.clients.helper import callback_exec
@@ -76,22 +77,26 @@ class HTTPBaseClient(BaseClient):
                 async for response in streamer.stream(request_iterator):
                     r_status = response.status
 
-                    r_str = await response.json()
-                    if r_status == 404:
-                        raise BadClient(f'no such endpoint {url}')
-                    elif r_status < 200 or r_status > 300:
-                        raise ValueError(r_str)
-
-                    da = None
-                    if 'data' in r_str and r_str['data'] is not None:
-                        from docarray import DocumentArray
-
-                        da = DocumentArray.from_dict(r_str['data'])
-                        del r_str['data']
-
-                    resp = DataRequest(r_str)
-                    if da is not None:
-                        resp.data.docs = da
+                    if response.content_type == __protobuf_media_type__:
+                        # the shed requests come back with an error status, like the failed ones
+                        resp = DataRequest(await response.read())
+                    else:
+                        r_str = await response.json()
+                        if r_status == 404:
+                            raise BadClient(f'no such endpoint {url}')
+                        elif r_status < 200 or r_status > 300:
+                            raise ValueError(r_str)
+
+                        da = None
+                        if 'data' in r_str and r_str['data'] is not None:
+                            from docarray import DocumentArray
+
+                            da = DocumentArray.from_dict(r_str['data'])
+                            del r_str['data']
+
+                        resp = DataRequest(r_str)
+                        if da is not None:
+                            resp.data.docs = da
 
                     callback_exec(
                         response=resp,
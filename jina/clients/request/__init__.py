@@ -42,6 +42,8 @@ def request_generator(
     data_type: DataInputType = DataInputType.AUTO,
     target_executor: Optional[str] = None,
     parameters: Optional[Dict] = None,
+    timeout: Optional[float] = None,
+    priority: Optional[int] = None,
     **kwargs,  # do not remove this, add on purpose to suppress unknown kwargs
 ) -> Iterator['Request']:
     """Generate a request iterator.
@@ -53,6 +55,8 @@ def request_generator(
             or an iterator over possible Document content (set to text, blob and buffer).
     :param parameters: a dictionary of parameters to be sent to the executor
     :param target_executor: a regex string. Only matching Executors will process the request.
+    :param timeout: the number of seconds after which each request is dropped if it was not processed yet
+    :param priority: the priority of the requests, a saturated gateway admits the requests with a higher priority first
     :param kwargs: additional arguments
     :yield: request
     """
@@ -63,7 +67,11 @@ def request_generator(
         if data is None:
             # this allows empty inputs, i.e. a data request with only parameters
             yield _new_data_request(
-                endpoint=exec_endpoint, target=target_executor, parameters=parameters
+                endpoint=exec_endpoint,
+                target=target_executor,
+                parameters=parameters,
+                timeout=timeout,
+                priority=priority,
             )
         else:
             if not isinstance(data, Iterable):
@@ -76,6 +84,8 @@ def request_generator(
                     endpoint=exec_endpoint,
                     target=target_executor,
                     parameters=parameters,
+                    timeout=timeout,
+                    priority=priority,
                 )
 
     except Exception as ex:
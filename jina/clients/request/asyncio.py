@@ -19,6 +19,8 @@ async def request_generator(
     data_type: DataInputType = DataInputType.AUTO,
     target_executor: Optional[str] = None,
     parameters: Optional[Dict] = None,
+    timeout: Optional[float] = None,
+    priority: Optional[int] = None,
     **kwargs,  # do not remove this, add on purpose to suppress unknown kwargs
 ) -> AsyncIterator['Request']:
     """An async :function:`request_generator`.
@@ -30,6 +32,8 @@ async def request_generator(
             or an iterator over possible Document content (set to text, blob and buffer).
     :param parameters: the kwargs that will be sent to the executor
     :param target_executor: a regex string. Only matching Executors will process the request.
+    :param timeout: the number of seconds after which each request is dropped if it was not processed yet
+    :param priority: the priority of the requests, a saturated gateway admits the requests with a higher priority first
     :param kwargs: additional arguments
     :yield: request
     """
@@ -40,7 +44,11 @@ async def request_generator(
         if data is None:
             # this allows empty inputs, i.e. a data request with only parameters
             yield _new_data_request(
-                endpoint=exec_endpoint, target=target_executor, parameters=parameters
+                endpoint=exec_endpoint,
+                target=target_executor,
+                parameters=parameters,
+                timeout=timeout,
+                priority=priority,
             )
         else:
             with ImportExtensions(required=True):
@@ -54,6 +62,8 @@ async def request_generator(
                     endpoint=exec_endpoint,
                     target=target_executor,
                     parameters=parameters,
+                    timeout=timeout,
+                    priority=priority,
                 )
     except Exception as ex:
         # must be handled here, as grpc channel wont handle Python exception
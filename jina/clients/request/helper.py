@@ -1,4 +1,7 @@
 """Module for helper functions for clients."""
+import math
+import time
+import uuid
 from typing import Tuple
 
 from docarray import DocumentArray, Document
@@ -9,9 +12,9 @@ from jina.types.request.data import DataRequest
 
 
 def _new_data_request_from_batch(
-    _kwargs, batch, data_type, endpoint, target, parameters
+    _kwargs, batch, data_type, endpoint, target, parameters, timeout=None, priority=None
 ):
-    req = _new_data_request(endpoint, target, parameters)
+    req = _new_data_request(endpoint, target, parameters, timeout, priority)
 
     # add docs fields
     _add_docs(req, batch, data_type, _kwargs)
@@ -19,7 +22,7 @@ def _new_data_request_from_batch(
     return req
 
 
-def _new_data_request(endpoint, target, parameters):
+def _new_data_request(endpoint, target, parameters, timeout=None, priority=None):
     req = DataRequest()
 
     # set up header
@@ -27,6 +30,11 @@ def _new_data_request(endpoint, target, parameters):
         req.header.exec_endpoint = endpoint
     if target:
         req.header.target_executor = target
+    if timeout:
+        # the header holds the deadline as epoch milliseconds
+        req.header.deadline_ms = math.ceil((time.time() + timeout) * 1000)
+    if priority:
+        req.header.priority = priority
     # add parameters field
     if parameters:
         req.parameters = parameters
@@ -62,6 +70,17 @@ def _new_doc_from_data(
 
 
 def _add_docs(req, batch, data_type, _kwargs):
+    import numpy as np
+
+    if (
+        isinstance(batch, np.ndarray)
+        and batch.ndim > 1
+        and batch.size > 0
+        and data_type in (DataInputType.AUTO, DataInputType.CONTENT)
+    ):
+        _add_ndarray_docs(req, batch, _kwargs)
+        return
+
     da = DocumentArray()
     for content in batch:
         if isinstance(content, tuple) and len(content) == 2:
@@ -74,6 +93,43 @@ def _add_docs(req, batch, data_type, _kwargs):
     req.data.docs = da
 
 
+def _add_ndarray_docs(req, batch, _kwargs):
+    from docarray.proto import docarray_pb2
+
+    from jina.proto.serializer import encode_length_delimited as _field
+
+    # every row becomes the tensor of a Document, the Documents are encoded by hand instead of building one per row,
+    # the fields they share are encoded once from a Document built with the same kwargs
+    template = Document(**_kwargs).to_protobuf()
+    template.ClearField('id')
+    shared_fields = template.SerializeToString()
+    dense_fields = docarray_pb2.DenseNdArrayProto(
+        shape=batch.shape[1:], dtype=batch.dtype.str
+    ).SerializeToString()
+    tensor_fields = docarray_pb2.NdArrayProto(cls_name='numpy').SerializeToString()
+
+    docs = []
+    for row in batch:
+        dense = dense_fields + _field(
+            docarray_pb2.DenseNdArrayProto.BUFFER_FIELD_NUMBER, row.tobytes()
+        )
+        tensor = tensor_fields + _field(
+            docarray_pb2.NdArrayProto.DENSE_FIELD_NUMBER, dense
+        )
+        doc = b''.join(
+            [
+                shared_fields,
+                _field(
+                    docarray_pb2.DocumentProto.ID_FIELD_NUMBER,
+                    uuid.uuid1().hex.encode(),
+                ),
+                _field(docarray_pb2.DocumentProto.TENSOR_FIELD_NUMBER, tensor),
+            ]
+        )
+        docs.append(_field(docarray_pb2.DocumentArrayProto.DOCS_FIELD_NUMBER, doc))
+    req.set_serialized_docs(b''.join(docs))
+
+
 def _add_control_propagate(req, kwargs):
     from jina.proto import jina_pb2
 
@@ -0,0 +1,114 @@
+"""Module for requests generator building the requests in a pool."""
+import asyncio
+import inspect
+from collections import deque
+from concurrent.futures import Executor
+from typing import AsyncIterator, Deque, Iterable, Optional, Dict, TYPE_CHECKING
+
+from jina.clients.request.helper import _new_data_request_from_batch, _new_data_request
+from jina.enums import DataInputType
+from jina.helper import batch_iterator
+from jina.importer import ImportExtensions
+from jina.logging.predefined import default_logger
+from jina.serve.stream.helper import AsyncRequestsIterator
+from jina.types.request.data import DataRequest
+
+if TYPE_CHECKING:
+    from jina.clients.request import GeneratorSourceType
+    from jina.types.request import Request
+
+
+def _build_request(_kwargs: Dict, batch, *args) -> bytes:
+    # runs in the pool, only the serialized request travels back from a process
+    return _new_data_request_from_batch(_kwargs, batch, *args).to_bytes()
+
+
+async def _batches(data: 'GeneratorSourceType', request_size: int) -> AsyncIterator:
+    if inspect.isasyncgen(data):
+        with ImportExtensions(required=True):
+            import aiostream
+
+        async for batch in aiostream.stream.chunks(data, request_size):
+            yield batch
+    else:
+        if not isinstance(data, Iterable):
+            data = [data]
+        # the inputs may block, they are read outside of the event loop
+        async for batch in AsyncRequestsIterator(
+            iterator=batch_iterator(data, request_size)
+        ):
+            yield batch
+
+
+async def request_generator(
+    exec_endpoint: str,
+    data: 'GeneratorSourceType',
+    pool: Executor,
+    request_queue_size: int = 16,
+    request_size: int = 0,
+    data_type: DataInputType = DataInputType.AUTO,
+    target_executor: Optional[str] = None,
+    parameters: Optional[Dict] = None,
+    timeout: Optional[float] = None,
+    priority: Optional[int] = None,
+    **kwargs,  # do not remove this, add on purpose to suppress unknown kwargs
+) -> AsyncIterator['Request']:
+    """A :function:`request_generator` building and serializing the requests in a pool, ahead of the stream.
+
+    The requests are yielded in the order of the inputs, at most ``request_queue_size`` of them are built before the
+    stream takes them.
+
+    :param exec_endpoint: the endpoint string, by convention starts with `/`
+    :param data: the data to use in the request
+    :param pool: the thread or process pool building the requests, it is shut down when the generator ends
+    :param request_queue_size: the maximum number of requests built ahead of the stream
+    :param request_size: the number of Documents per request
+    :param data_type: if ``data`` is an iterator over self-contained document, i.e. :class:`DocumentSourceType`;
+            or an iterator over possible Document content (set to text, blob and buffer).
+    :param parameters: the kwargs that will be sent to the executor
+    :param target_executor: a regex string. Only matching Executors will process the request.
+    :param timeout: the number of seconds after which each request is dropped if it was not processed yet
+    :param priority: the priority of the requests, a saturated gateway admits the requests with a higher priority first
+    :param kwargs: additional arguments
+    :yield: request
+    """
+
+    built: Deque['asyncio.Future'] = deque()
+    try:
+        if data is None:
+            # this allows empty inputs, i.e. a data request with only parameters
+            yield _new_data_request(
+                endpoint=exec_endpoint,
+                target=target_executor,
+                parameters=parameters,
+                timeout=timeout,
+                priority=priority,
+            )
+        else:
+            loop = asyncio.get_running_loop()
+            async for batch in _batches(data, request_size):
+                built.append(
+                    loop.run_in_executor(
+                        pool,
+                        _build_request,
+                        kwargs,
+                        batch,
+                        data_type,
+                        exec_endpoint,
+                        target_executor,
+                        parameters,
+                        timeout,
+                        priority,
+                    )
+                )
+                if len(built) >= max(1, request_queue_size):
+                    yield DataRequest(await built.popleft())
+            while built:
+                yield DataRequest(await built.popleft())
+    except Exception as ex:
+        # must be handled here, as grpc channel wont handle Python exception
+        default_logger.critical(f'inputs is not valid! {ex!r}', exc_info=True)
+    finally:
+        for future in built:
+            future.cancel()
+        pool.shutdown(wait=False)
@@ -126,6 +126,21 @@ class PollingType(BetterEnum):
         return self.value == 2
 
 
+class LoadBalancingType(BetterEnum):
+    """The strategy used to select a replica when sending requests to a Deployment."""
+
+    ROUND_ROBIN = 0  #: replicas take turns in a fixed order
+    LEAST_OUTSTANDING = 1  #: the replica with the fewest in-flight requests is chosen
+    EWMA = 2  #: power of two choices, weighted by EWMA latency and in-flight requests
+
+
+class ExecutorPoolType(BetterEnum):
+    """The pool used to run the synchronous endpoints of an Executor."""
+
+    THREAD = 0  #: endpoints run in a thread pool of the worker process
+    PROCESS = 1  #: endpoints run in a pool of processes forked from the worker process
+
+
 class LogVerbosity(BetterEnum):
     """Verbosity level of the logger."""
 
@@ -73,6 +73,10 @@ class BadRequestType(TypeError, BaseJinaExeception):
     """Exception when can not construct a request object from given data."""
 
 
+class BadRequestCompression(ValueError, BaseJinaExeception):
+    """Exception when a compressed request can not be decompressed or is not accepted."""
+
+
 class BadImageNameError(Exception, BaseJinaExeception):
     """Exception when an image name can not be found either local & remote"""
 
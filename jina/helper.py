@@ -61,6 +61,8 @@ __all__ = [
 
 
 if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
     from docarray import DocumentArray
 
 T = TypeVar('T')
@@ -1201,6 +1203,52 @@ async def run_in_threadpool(func: Callable, executor=None, *args, **kwargs):
     )
 
 
+# the barrier every process of a pool started by `start_process_pool` waits on before it takes other tasks
+_pool_start_barrier = None
+
+
+def _init_pool_process(barrier, initializer: Optional[Callable], initargs: Tuple):
+    global _pool_start_barrier
+    _pool_start_barrier = barrier
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _wait_for_pool_processes():
+    _pool_start_barrier.wait()
+
+
+def start_process_pool(
+    max_workers: int,
+    initializer: Optional[Callable] = None,
+    initargs: Tuple = (),
+) -> 'ProcessPoolExecutor':
+    """Create a process pool and start all its processes before returning it.
+
+    A `ProcessPoolExecutor` starts its processes on demand, so they would be forked later, once the threads of gRPC are
+    running, which gRPC does not support. One task per process is submitted and every task waits on a barrier until
+    all the processes are started.
+
+    :param max_workers: the number of processes of the pool
+    :param initializer: Optional callable run in every process when it starts
+    :param initargs: the arguments of the initializer
+    :return: the process pool with all its processes running
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    barrier = multiprocessing.Barrier(max_workers)
+    pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_pool_process,
+        initargs=(barrier, initializer, initargs),
+    )
+    futures = [pool.submit(_wait_for_pool_processes) for _ in range(max_workers)]
+    for future in futures:
+        future.result()
+    return pool
+
+
 def run_async(func, *args, **kwargs):
     """Generalized asyncio.run for jupyter notebook.
 
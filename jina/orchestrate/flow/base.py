@@ -6,7 +6,9 @@ import json
 import multiprocessing
 import os
 import re
+import shutil
 import sys
+import tempfile
 import threading
 import time
 import uuid
@@ -54,6 +56,7 @@ from jina.parsers import (
     set_gateway_parser,
     set_deployment_parser,
     set_client_cli_parser,
+    set_pod_parser,
 )
 from jina.parsers.flow import set_flow_parser
 from jina.orchestrate.deployments import Deployment
@@ -75,6 +78,22 @@ if TYPE_CHECKING:
     from jina.orchestrate.flow.asyncio import AsyncFlow
 
 GATEWAY_NAME = 'gateway'
+# the connection settings given to the Flow apply to the connection pool of the gateway
+_GATEWAY_CONNECTION_ARGS = (
+    'load_balancing',
+    'channels_per_replica',
+    'stream_window',
+    'max_attempts',
+    'retry_backoff',
+    'outlier_failures',
+    'outlier_latency_factor',
+    'outlier_ejection_time',
+    'circuit_breaker_failures',
+    'circuit_breaker_reset_time',
+    'hedge_endpoints',
+    'hedge_percentile',
+    'hedge_budget',
+)
 FALLBACK_PARSERS = [
     set_gateway_parser(),
     set_deployment_parser(),
@@ -92,23 +111,41 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         self,
         *,
         asyncio: Optional[bool] = False,
+        gateway_addresses: Optional[List[str]] = None,
+        grpc_streams: Optional[int] = 1,
         host: Optional[str] = '0.0.0.0',
         https: Optional[bool] = False,
         port: Optional[int] = None,
+        preserve_order: Optional[bool] = False,
         protocol: Optional[str] = 'GRPC',
         proxy: Optional[bool] = False,
+        request_builders: Optional[int] = 0,
+        request_builders_pool: Optional[str] = 'THREAD',
+        request_queue_size: Optional[int] = 16,
         results_as_docarray: Optional[bool] = False,
+        streams_load_balancing: Optional[str] = 'ROUND_ROBIN',
         **kwargs,
     ):
         """Create a Flow. Flow is how Jina streamlines and scales Executors. This overloaded method provides arguments from `jina client` CLI.
 
         :param asyncio: If set, then the input and output of this Client work in an asynchronous manner.
+        :param gateway_addresses: The addresses `host:port` of the gateway replicas the gRPC streams are spread across, at least one stream is opened to every address. By default all the streams go to `--host` and `--port`.
+        :param grpc_streams: The number of gRPC channels the client opens, each with its own stream to the gateway. The requests are spread across the streams, so that the client is not bound to a single connection.
         :param host: The host address of the runtime, by default it is 0.0.0.0.
         :param https: If set, connect to gateway using https
         :param port: The port of the Gateway, which the client should connect to.
+        :param preserve_order: If set, the responses are returned in the order of the requests, even when the Flow or the streams complete them out of order.
         :param protocol: Communication protocol between server and client.
         :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
+        :param request_builders: The number of threads or processes building and serializing the requests ahead of the stream, so that converting the inputs to Documents does not hold back the client. 0 builds every request when it is sent.
+        :param request_builders_pool: The pool building the requests when `--request-builders` is set:
+              - THREAD: a thread pool, suited for inputs whose conversion releases the GIL, like NumPy arrays
+              - PROCESS: a pool of processes forked from the client, suited for inputs converted by Python code
+        :param request_queue_size: The maximum number of serialized requests built ahead of the stream when `--request-builders` is set. It bounds the memory used by the requests waiting to be sent.
         :param results_as_docarray: If set, return results as DocArray instead of Request.
+        :param streams_load_balancing: The strategy used to select the gRPC stream of each request when there are several:
+              - ROUND_ROBIN: streams take turns in a fixed order
+              - LEAST_OUTSTANDING: the stream with the fewest requests waiting for a response is chosen
 
         .. # noqa: DAR202
         .. # noqa: DAR101
@@ -122,6 +159,14 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     def __init__(
         self,
         *,
+        admission_queue_size: Optional[int] = 100,
+        admission_queue_timeout: Optional[float] = 0.1,
+        bulk_max_document_size: Optional[int] = 16777216,
+        bulk_prefetch: Optional[int] = 10,
+        bulk_request_size: Optional[int] = 100,
+        channels_per_replica: Optional[int] = 1,
+        circuit_breaker_failures: Optional[int] = 10,
+        circuit_breaker_reset_time: Optional[float] = 5.0,
         compress: Optional[str] = 'NONE',
         compress_min_bytes: Optional[int] = 1024,
         compress_min_ratio: Optional[float] = 1.1,
@@ -130,31 +175,61 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         daemon: Optional[bool] = False,
         default_swagger_ui: Optional[bool] = False,
         deployments_addresses: Optional[str] = '{}',
+        deployments_fused: Optional[str] = '{}',
+        deployments_in_process: Optional[str] = '{}',
+        deployments_worker_addresses: Optional[str] = '{}',
         description: Optional[str] = None,
+        disable_uds: Optional[bool] = False,
         env: Optional[dict] = None,
+        executor_pool: Optional[str] = 'THREAD',
+        executor_pool_size: Optional[int] = 1,
         expose_endpoints: Optional[str] = None,
         expose_public: Optional[bool] = False,
+        fused_executors: Optional[str] = '{}',
         graph_description: Optional[str] = '{}',
+        hedge_budget: Optional[float] = 0.05,
+        hedge_endpoints: Optional[List[str]] = None,
+        hedge_percentile: Optional[float] = 95.0,
         host: Optional[str] = '0.0.0.0',
         host_in: Optional[str] = '0.0.0.0',
+        load_balancing: Optional[str] = 'ROUND_ROBIN',
         log_config: Optional[str] = None,
+        max_attempts: Optional[int] = 3,
+        max_inflight_bytes: Optional[int] = 0,
+        max_inflight_bytes_per_client: Optional[int] = 0,
+        max_inflight_requests: Optional[int] = 0,
+        max_inflight_requests_per_client: Optional[int] = 0,
+        merge_top_k_by: Optional[str] = None,
+        merge_top_k_descending: Optional[bool] = False,
         name: Optional[str] = 'gateway',
         native: Optional[bool] = False,
         no_crud_endpoints: Optional[bool] = False,
         no_debug_endpoints: Optional[bool] = False,
+        outlier_ejection_time: Optional[float] = 10.0,
+        outlier_failures: Optional[int] = 5,
+        outlier_latency_factor: Optional[float] = 10.0,
         polling: Optional[str] = 'ANY',
         port_expose: Optional[int] = None,
         port_in: Optional[int] = None,
         prefetch: Optional[int] = 0,
+        prefetch_adaptive: Optional[bool] = False,
         protocol: Optional[str] = 'GRPC',
         proxy: Optional[bool] = False,
         py_modules: Optional[List[str]] = None,
         quiet: Optional[bool] = False,
         quiet_error: Optional[bool] = False,
+        reorder_buffer_size: Optional[int] = 100,
         replicas: Optional[int] = 1,
+        response_cache: Optional[dict] = None,
+        response_cache_invalidate_on: Optional[List] = ['/index', '/update', '/delete'],
+        response_cache_size: Optional[int] = 1000,
+        results_in_order: Optional[bool] = False,
+        retry_backoff: Optional[float] = 0.05,
         runtime_backend: Optional[str] = 'PROCESS',
         runtime_cls: Optional[str] = 'GRPCGatewayRuntime',
         shards: Optional[int] = 1,
+        stats_interval: Optional[float] = 0,
+        stream_window: Optional[int] = 64,
         timeout_ctrl: Optional[int] = 60,
         timeout_ready: Optional[int] = 600000,
         title: Optional[str] = None,
@@ -170,6 +245,14 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     ):
         """Create a Flow. Flow is how Jina streamlines and scales Executors. This overloaded method provides arguments from `jina gateway` CLI.
 
+        :param admission_queue_size: The maximum number of requests waiting to be let into the Flow, when it is full the requests with the lowest `priority` are shed.
+        :param admission_queue_timeout: The seconds a request waits to be let into the Flow before it is shed, 0 sheds the requests beyond the caps right away.
+        :param bulk_max_document_size: The maximum size in bytes of a Document streamed to the /bulk endpoint, a JSON line or a serialized Document. A larger Document is rejected with a 413 error, 0 means no limit.
+        :param bulk_prefetch: The number of requests of a stream to the /bulk endpoint that are in flight at once. It bounds the memory used by the stream on the gateway, whatever the size of the upload.
+        :param bulk_request_size: The number of Documents per request when the Documents streamed to the /bulk endpoint are batched, a client can override it with the `request_size` query parameter.
+        :param channels_per_replica: The number of gRPC channels opened to every replica of a Deployment. Every channel is a separate HTTP/2 connection, more channels raise the number of concurrent requests a replica can take under high load.
+        :param circuit_breaker_failures: The number of consecutive failed requests to a Deployment after which requests fail fast without being sent. 0 disables it.
+        :param circuit_breaker_reset_time: The seconds requests fail fast after the circuit breaker of a Deployment opened, then a trial request is let through.
         :param compress: The compress algorithm used over the entire Flow.
 
               Note that this is not necessarily effective,
@@ -181,14 +264,37 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param daemon: The Pod attempts to terminate all of its Runtime child processes/threads on existing. setting it to true basically tell the Pod do not wait on the Runtime when closing
         :param default_swagger_ui: If set, the default swagger ui is used for `/docs` endpoint.
         :param deployments_addresses: dictionary JSON with the input addresses of each Deployment
+        :param deployments_fused: dictionary JSON with the Deployments whose Executors run in the worker of each Deployment, in order
+        :param deployments_in_process: dictionary JSON with the arguments of each Deployment whose Executor runs inside the Gateway
+        :param deployments_worker_addresses: dictionary JSON with the addresses of the replicas of each Deployment whose head is bypassed
         :param description: The description of this HTTP server. It will be used in automatics docs such as Swagger UI.
+        :param disable_uds: If set, the runtime does not listen on a Unix domain socket next to `--port-in`. Runtimes on the same host then talk to it over TCP instead of the socket.
         :param env: The map of environment variables that are available inside runtime
+        :param executor_pool: The pool used to run the synchronous endpoints of the Executor:
+              - THREAD: a thread pool, suited for I/O-bound endpoints or endpoints releasing the GIL
+              - PROCESS: a pool of forked processes, suited for CPU-bound endpoints that do not change the Executor state
+        :param executor_pool_size: The number of threads or processes running the synchronous endpoints of the Executor. An endpoint only runs concurrently if it declares a limit with `@requests(concurrency=...)`.
         :param expose_endpoints: A JSON string that represents a map from executor endpoints (`@requests(on=...)`) to HTTP endpoints.
         :param expose_public: If set, expose the public IP address to remote when necessary, by default it exposesprivate IP address, which only allows accessing under the same network/subnet. Important to set this to true when the Pod will receive input connections from remote Pods
+        :param fused_executors: dictionary JSON with the arguments of the Executors of the Deployments that run after `--uses` in this runtime, in order. It is set by the Flow when fusing Deployments.
         :param graph_description: Routing graph for the gateway
+        :param hedge_budget: The maximum ratio of duplicated requests to the requests of the hedged endpoints.
+        :param hedge_endpoints: The endpoints whose requests are duplicated to another replica when the first replica is slow, the first response is taken. Only idempotent endpoints like `/search` should be hedged.
+        :param hedge_percentile: The percentile of the recent latencies of a Deployment after which a request to a hedged endpoint is duplicated.
         :param host: The host address of the runtime, by default it is 0.0.0.0.
         :param host_in: The host address for binding to, by default it is 0.0.0.0
+        :param load_balancing: The strategy used to select a replica of a Deployment for each request:
+              - ROUND_ROBIN: replicas take turns in a fixed order
+              - LEAST_OUTSTANDING: the replica with the fewest in-flight requests is chosen
+              - EWMA: two random replicas are compared, the one with the lower latency EWMA weighted by its in-flight requests is chosen
         :param log_config: The YAML config of the logger used in this object.
+        :param max_attempts: The number of attempts to send a request to an unavailable Deployment, every retry goes to another replica if there is one.
+        :param max_inflight_bytes: The maximum size in bytes of the requests the gateway lets into the Flow at once. 0 means no cap.
+        :param max_inflight_bytes_per_client: The maximum size in bytes of the requests of a single client host the gateway lets into the Flow at once. 0 means no cap.
+        :param max_inflight_requests: The maximum number of requests the gateway lets into the Flow at once, the requests beyond it are queued briefly and then shed with a RESOURCE_EXHAUSTED error. 0 means no cap.
+        :param max_inflight_requests_per_client: The maximum number of requests of a single client host the gateway lets into the Flow at once. 0 means no cap.
+        :param merge_top_k_by: The name of the score (e.g. `cosine`) by which the head merges the matches returned by the shards. If set, the matches of every Document are merged with a heap and cut to the `top_k` given in the parameters, instead of reducing the results of all shards.
+        :param merge_top_k_descending: If set, higher scores are better when merging the matches with `--merge-top-k-by`.
         :param name: The name of this object.
 
           This will be used in the following places:
@@ -202,7 +308,10 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param no_crud_endpoints: If set, /index, /search, /update, /delete endpoints are removed from HTTP interface.
 
                   Any executor that has `@requests(on=...)` bind with those values will receive data requests.
-        :param no_debug_endpoints: If set, /status /post endpoints are removed from HTTP interface.
+        :param no_debug_endpoints: If set, /status /stats /post endpoints are removed from HTTP interface.
+        :param outlier_ejection_time: The seconds an ejected replica does not receive requests before it is probed.
+        :param outlier_failures: The number of consecutive failures after which a replica stops receiving requests until it answers a STATUS probe again. 0 disables it.
+        :param outlier_latency_factor: A replica whose latency EWMA is above this factor times the median latency of the other replicas stops receiving requests until it answers a STATUS probe again. 0 disables it.
         :param polling: The polling strategy of the Deployment and its endpoints (when `shards>1`).
               Can be defined for all endpoints of a Deployment or by endpoint.
               Define per Deployment:
@@ -216,6 +325,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param prefetch: Number of requests fetched from the client before feeding into the first Executor.
 
               Used to control the speed of data input into a Flow. 0 disables prefetch (disabled by default)
+        :param prefetch_adaptive: If set, the number of requests in flight is tuned from their latency, it grows as long as the latency does not.
+
+              `--prefetch` then bounds the window, 0 leaves it unbounded
         :param protocol: Communication protocol between server and client.
         :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
         :param py_modules: The customized python modules need to be imported before loading the executor
@@ -226,10 +338,22 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
           `Executor cookbook <https://docs.jina.ai/fundamentals/executor/repository-structure/>`__
         :param quiet: If set, then no log will be emitted from this object.
         :param quiet_error: If set, then exception stack information will not be added to the log
+        :param reorder_buffer_size: The maximum number of requests of a stream in flight or held back when `--results-in-order` is set.
+
+              No new request is read from the client while the buffer is full, a slow request stalls the stream instead of growing the buffer
         :param replicas: The number of replicas in the deployment
+        :param response_cache: The endpoints whose responses are cached by the gateway, with the time to live of the cached responses in seconds. Only idempotent endpoints should be cached, a cached response is returned without reaching the Executors.
+        :param response_cache_invalidate_on: The endpoints that drop all the responses cached by the gateway when they are called.
+        :param response_cache_size: The maximum number of responses cached by the gateway, the least recently used response is evicted beyond it.
+        :param results_in_order: If set, the responses of a stream are returned in the order of its requests instead of the order they complete in.
+
+              The responses completing early are held back in a reorder buffer bounded by `--reorder-buffer-size`
+        :param retry_backoff: The base delay in seconds before retrying a request, it doubles with every retry and is randomly jittered.
         :param runtime_backend: The parallel backend of the runtime inside the Pod
         :param runtime_cls: The runtime class to run inside the Pod
         :param shards: The number of shards in the deployment running at the same time. For more details check https://docs.jina.ai/fundamentals/flow/topology/
+        :param stats_interval: The seconds between two logs of the statistics of the gateway, like the requests in flight per replica and the hits of the response cache. 0 disables the periodic logs. The HTTP gateway also serves them at `/stats`.
+        :param stream_window: The maximum number of requests in flight on the long-lived bidirectional stream of every channel to a replica. The requests are pipelined over the stream instead of being sent in their own unary call, 0 disables the stream.
         :param timeout_ctrl: The timeout in milliseconds of the control request, -1 for waiting forever
         :param timeout_ready: The timeout in milliseconds of a Pod waits for the runtime to be ready, -1 for waiting forever
         :param title: The title of this HTTP server. It will be used in automatics docs such as Swagger UI.
@@ -264,13 +388,29 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     def __init__(
         self,
         *,
+        channels_per_replica: Optional[int] = 1,
+        circuit_breaker_failures: Optional[int] = 10,
+        circuit_breaker_reset_time: Optional[float] = 5.0,
         env: Optional[dict] = None,
+        fuse: Optional[bool] = False,
+        head_bypass: Optional[bool] = False,
+        hedge_budget: Optional[float] = 0.05,
+        hedge_endpoints: Optional[List[str]] = None,
+        hedge_percentile: Optional[float] = 95.0,
+        in_process: Optional[bool] = False,
         inspect: Optional[str] = 'COLLECT',
+        load_balancing: Optional[str] = 'ROUND_ROBIN',
         log_config: Optional[str] = None,
+        max_attempts: Optional[int] = 3,
         name: Optional[str] = None,
+        outlier_ejection_time: Optional[float] = 10.0,
+        outlier_failures: Optional[int] = 5,
+        outlier_latency_factor: Optional[float] = 10.0,
         polling: Optional[str] = 'ANY',
         quiet: Optional[bool] = False,
         quiet_error: Optional[bool] = False,
+        retry_backoff: Optional[float] = 0.05,
+        stream_window: Optional[int] = 64,
         timeout_ctrl: Optional[int] = 60,
         uses: Optional[str] = None,
         workspace: Optional[str] = None,
@@ -278,11 +418,25 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     ):
         """Create a Flow. Flow is how Jina streamlines and scales Executors. This overloaded method provides arguments from `jina flow` CLI.
 
+        :param channels_per_replica: The number of gRPC channels opened to every replica of a Deployment. Every channel is a separate HTTP/2 connection, more channels raise the number of concurrent requests a replica can take under high load.
+        :param circuit_breaker_failures: The number of consecutive failed requests to a Deployment after which requests fail fast without being sent. 0 disables it.
+        :param circuit_breaker_reset_time: The seconds requests fail fast after the circuit breaker of a Deployment opened, then a trial request is let through.
         :param env: The map of environment variables that are available inside runtime
+        :param fuse: If set, the linear chains of Deployments with a single shard, a single replica, no `uses_before`/`uses_after` and no container are fused: the first Deployment of a chain runs all their Executors back to back on the same request, the other Deployments are not started. The routes of the response still report every Executor. The fused Deployments can not be scaled or updated while the Flow is running.
+        :param head_bypass: If set, the Gateway sends the requests of the Deployments with a single shard and without `uses_before`/`uses_after` directly to their replicas. Their heads only register the replicas. These Deployments can not be scaled while the Flow is running.
+        :param hedge_budget: The maximum ratio of duplicated requests to the requests of the hedged endpoints.
+        :param hedge_endpoints: The endpoints whose requests are duplicated to another replica when the first replica is slow, the first response is taken. Only idempotent endpoints like `/search` should be hedged.
+        :param hedge_percentile: The percentile of the recent latencies of a Deployment after which a request to a hedged endpoint is duplicated.
+        :param in_process: If set, the Executors of the Deployments with a single shard, a single replica, no `uses_before`/`uses_after` and no container run inside the Gateway process. The requests are passed to them without gRPC and serialization. These Deployments can not be scaled or updated while the Flow is running.
         :param inspect: The strategy on those inspect deployments in the flow.
 
               If `REMOVE` is given then all inspect deployments are removed when building the flow.
+        :param load_balancing: The strategy used to select a replica of a Deployment for each request:
+              - ROUND_ROBIN: replicas take turns in a fixed order
+              - LEAST_OUTSTANDING: the replica with the fewest in-flight requests is chosen
+              - EWMA: two random replicas are compared, the one with the lower latency EWMA weighted by its in-flight requests is chosen
         :param log_config: The YAML config of the logger used in this object.
+        :param max_attempts: The number of attempts to send a request to an unavailable Deployment, every retry goes to another replica if there is one.
         :param name: The name of this object.
 
           This will be used in the following places:
@@ -292,6 +446,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
           - ...
 
           When not given, then the default naming strategy will apply.
+        :param outlier_ejection_time: The seconds an ejected replica does not receive requests before it is probed.
+        :param outlier_failures: The number of consecutive failures after which a replica stops receiving requests until it answers a STATUS probe again. 0 disables it.
+        :param outlier_latency_factor: A replica whose latency EWMA is above this factor times the median latency of the other replicas stops receiving requests until it answers a STATUS probe again. 0 disables it.
         :param polling: The polling strategy of the Deployment and its endpoints (when `shards>1`).
               Can be defined for all endpoints of a Deployment or by endpoint.
               Define per Deployment:
@@ -302,6 +459,8 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
               {'/custom': 'ALL', '/search': 'ANY', '*': 'ANY'}
         :param quiet: If set, then no log will be emitted from this object.
         :param quiet_error: If set, then exception stack information will not be added to the log
+        :param retry_backoff: The base delay in seconds before retrying a request, it doubles with every retry and is randomly jittered.
+        :param stream_window: The maximum number of requests in flight on the long-lived bidirectional stream of every channel to a replica. The requests are pipelined over the stream instead of being sent in their own unary call, 0 disables the stream.
         :param timeout_ctrl: The timeout in milliseconds of the control request, -1 for waiting forever
         :param uses: The YAML file represents a flow
         :param workspace: The working directory for any IO operations in this object. If not set, then derive from its parent `workspace`.
@@ -321,6 +480,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         self._version = '1'  #: YAML version number, this will be later overridden if YAML config says the other way
         self._deployment_nodes = OrderedDict()  # type: Dict[str, Deployment]
         self._inspect_deployments = {}  # type: Dict[str, str]
+        # the fused chains are computed once per build, see `_update_fused_deployments`
+        self._fused_deployments = {}  # type: Dict[str, List[str]]
+        self._fused_deployment_names = set()  # type: Set[str]
         self._endpoints_mapping = {}  # type: Dict[str, Dict]
         self._build_level = FlowBuildLevel.EMPTY
         self._last_changed_deployment = [
@@ -425,8 +587,18 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         needs: str,
         graph_description: Dict[str, List[str]],
         deployments_addresses: Dict[str, List[str]],
+        deployments_worker_addresses: Dict[str, List[str]],
+        deployments_in_process: Dict[str, List[str]],
+        deployments_fused: Dict[str, List[str]],
         **kwargs,
     ):
+        kwargs.update(
+            {
+                key: value
+                for key, value in self._kwargs.items()
+                if key in _GATEWAY_CONNECTION_ARGS
+            }
+        )
         kwargs.update(
             dict(
                 name=GATEWAY_NAME,
@@ -444,17 +616,154 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         args.noblock_on_start = True
         args.graph_description = json.dumps(graph_description)
         args.deployments_addresses = json.dumps(deployments_addresses)
+        args.deployments_worker_addresses = json.dumps(deployments_worker_addresses)
+        args.deployments_in_process = json.dumps(deployments_in_process)
+        args.deployments_fused = json.dumps(deployments_fused)
         self._deployment_nodes[GATEWAY_NAME] = Deployment(args, needs)
 
     def _get_deployments_addresses(self) -> Dict[str, List[str]]:
         graph_dict = {}
         for node, v in self._deployment_nodes.items():
-            if node == 'gateway':
+            if (
+                node == 'gateway'
+                or self._is_head_bypassed(v)
+                or self._is_in_process(v)
+                or self._is_fused(v)
+            ):
                 continue
             graph_dict[node] = [f'{v.protocol}://{v.host}:{v.head_port_in}']
 
         return graph_dict
 
+    def _get_deployments_worker_addresses(self) -> Dict[str, List[str]]:
+        graph_dict = {}
+        for node, v in self._deployment_nodes.items():
+            if node == 'gateway' or not self._is_head_bypassed(v):
+                continue
+            graph_dict[node] = [
+                f'{pod_args.host}:{pod_args.port_in}'
+                for pod_args in v.pod_args['pods'][0]
+            ]
+
+        return graph_dict
+
+    def _is_head_bypassed(self, deployment: Deployment) -> bool:
+        # the head of a Deployment with a single shard and no uses_before/uses_after only forwards the requests
+        return (
+            getattr(self.args, 'head_bypass', False)
+            and not deployment.external
+            and not self._is_in_process(deployment)
+            and not self._is_fused(deployment)
+            and getattr(deployment.args, 'shards', 1) == 1
+            and deployment.pod_args['uses_before'] is None
+            and deployment.pod_args['uses_after'] is None
+        )
+
+    def _get_deployments_in_process(self) -> Dict[str, List[str]]:
+        graph_dict = {}
+        for node, v in self._deployment_nodes.items():
+            if node == 'gateway' or not self._is_in_process(v):
+                continue
+            graph_dict[node] = ArgNamespace.kwargs2list(
+                ArgNamespace.get_non_defaults_args(
+                    v.pod_args['pods'][0][0], set_pod_parser()
+                )
+            )
+
+        return graph_dict
+
+    def _is_in_process(self, deployment: Deployment) -> bool:
+        # only a single local replica of an Executor that does not run in a container can be loaded by the gateway
+        return (
+            getattr(self.args, 'in_process', False)
+            and deployment.role != DeploymentRoleType.GATEWAY
+            and self._is_single_native_executor(deployment)
+            and deployment.args.host == __default_host__
+        )
+
+    @staticmethod
+    def _is_single_native_executor(deployment: Deployment) -> bool:
+        uses = getattr(deployment.args, 'uses', None)
+        return (
+            not deployment.external
+            and getattr(deployment.args, 'shards', 1) == 1
+            and getattr(deployment.args, 'replicas', 1) == 1
+            and deployment.pod_args['uses_before'] is None
+            and deployment.pod_args['uses_after'] is None
+            and not (
+                isinstance(uses, str)
+                and uses.startswith(
+                    ('docker://', 'jinahub+docker://', 'jinahub+sandbox://')
+                )
+            )
+        )
+
+    def _get_fused_deployments(self) -> Dict[str, List[str]]:
+        # the maximal linear chains of fusable Deployments, keyed by the Deployment running all their Executors
+        if not getattr(self.args, 'fuse', False):
+            return {}
+        graph = self._get_graph_representation()
+        graph_dict = {}
+        fused = set()
+        for node, v in self._deployment_nodes.items():
+            if node in fused or not self._is_fusable(v):
+                continue
+            chain = []
+            current = node
+            while len(graph.get(current, [])) == 1:
+                next_node = graph[current][0]
+                next_deployment = self._deployment_nodes.get(next_node)
+                if (
+                    next_deployment is None
+                    or next_deployment.needs != {current}
+                    or not self._is_fusable(next_deployment)
+                    or next_deployment.args.host != v.args.host
+                ):
+                    break
+                chain.append(next_node)
+                current = next_node
+            if chain:
+                graph_dict[node] = chain
+                fused.update(chain)
+
+        return graph_dict
+
+    def _is_fusable(self, deployment: Deployment) -> bool:
+        return (
+            getattr(self.args, 'fuse', False)
+            and deployment.role == DeploymentRoleType.DEPLOYMENT
+            and not self._is_in_process(deployment)
+            and self._is_single_native_executor(deployment)
+        )
+
+    def _update_fused_deployments(self):
+        # walking the graph for every Deployment would make building a Flow quadratic, the chains are stored instead
+        self._fused_deployments = self._get_fused_deployments()
+        self._fused_deployment_names = {
+            name for chain in self._fused_deployments.values() for name in chain
+        }
+
+    def _is_fused(self, deployment: Deployment) -> bool:
+        # the Executor of a fused Deployment runs in the worker of the first Deployment of its chain
+        return deployment.name in self._fused_deployment_names
+
+    def _set_fused_executors(self):
+        for node, chain in self._fused_deployments.items():
+            deployment = self._deployment_nodes[node]
+            deployment.args.fused_executors = json.dumps(
+                {
+                    name: ArgNamespace.kwargs2list(
+                        ArgNamespace.get_non_defaults_args(
+                            self._deployment_nodes[name].pod_args['pods'][0][0],
+                            set_pod_parser(),
+                        )
+                    )
+                    for name in chain
+                }
+            )
+            for pod_args in deployment.pod_args['pods'][0]:
+                pod_args.fused_executors = deployment.args.fused_executors
+
     def _get_k8s_deployments_addresses(
         self, k8s_namespace: str, k8s_connection_pool: bool
     ) -> Dict[str, List[str]]:
@@ -568,21 +877,41 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     def add(
         self,
         *,
+        channels_per_replica: Optional[int] = 1,
+        circuit_breaker_failures: Optional[int] = 10,
+        circuit_breaker_reset_time: Optional[float] = 5.0,
+        compress: Optional[str] = 'NONE',
+        compress_min_bytes: Optional[int] = 1024,
+        compress_min_ratio: Optional[float] = 1.1,
         connection_list: Optional[str] = None,
         daemon: Optional[bool] = False,
+        disable_uds: Optional[bool] = False,
         docker_kwargs: Optional[dict] = None,
         entrypoint: Optional[str] = None,
         env: Optional[dict] = None,
+        executor_pool: Optional[str] = 'THREAD',
+        executor_pool_size: Optional[int] = 1,
         expose_public: Optional[bool] = False,
         external: Optional[bool] = False,
         force_update: Optional[bool] = False,
+        fused_executors: Optional[str] = '{}',
         gpus: Optional[str] = None,
+        hedge_budget: Optional[float] = 0.05,
+        hedge_endpoints: Optional[List[str]] = None,
+        hedge_percentile: Optional[float] = 95.0,
         host: Optional[str] = '0.0.0.0',
         host_in: Optional[str] = '0.0.0.0',
         install_requirements: Optional[bool] = False,
+        load_balancing: Optional[str] = 'ROUND_ROBIN',
         log_config: Optional[str] = None,
+        max_attempts: Optional[int] = 3,
+        merge_top_k_by: Optional[str] = None,
+        merge_top_k_descending: Optional[bool] = False,
         name: Optional[str] = None,
         native: Optional[bool] = False,
+        outlier_ejection_time: Optional[float] = 10.0,
+        outlier_failures: Optional[int] = 5,
+        outlier_latency_factor: Optional[float] = 10.0,
         polling: Optional[str] = 'ANY',
         port_in: Optional[int] = None,
         port_jinad: Optional[int] = 8000,
@@ -592,9 +921,11 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         quiet_error: Optional[bool] = False,
         quiet_remote_logs: Optional[bool] = False,
         replicas: Optional[int] = 1,
+        retry_backoff: Optional[float] = 0.05,
         runtime_backend: Optional[str] = 'PROCESS',
         runtime_cls: Optional[str] = 'WorkerRuntime',
         shards: Optional[int] = 1,
+        stream_window: Optional[int] = 64,
         timeout_ctrl: Optional[int] = 60,
         timeout_ready: Optional[int] = 600000,
         upload_files: Optional[List[str]] = None,
@@ -612,17 +943,32 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     ) -> Union['Flow', 'AsyncFlow']:
         """Add an Executor to the current Flow object.
 
+        :param channels_per_replica: The number of gRPC channels opened to every replica of a Deployment. Every channel is a separate HTTP/2 connection, more channels raise the number of concurrent requests a replica can take under high load.
+        :param circuit_breaker_failures: The number of consecutive failed requests to a Deployment after which requests fail fast without being sent. 0 disables it.
+        :param circuit_breaker_reset_time: The seconds requests fail fast after the circuit breaker of a Deployment opened, then a trial request is let through.
+        :param compress: The compress algorithm used over the entire Flow.
+
+              Note that this is not necessarily effective,
+              it depends on the settings of `--compress-min-bytes` and `compress-min-ratio`
+        :param compress_min_bytes: The original message size must be larger than this number to trigger the compress algorithm, -1 means disable compression.
+        :param compress_min_ratio: The compression ratio (uncompressed_size/compressed_size) must be higher than this number to trigger the compress algorithm.
         :param connection_list: dictionary JSON with a list of connections to configure
         :param daemon: The Pod attempts to terminate all of its Runtime child processes/threads on existing. setting it to true basically tell the Pod do not wait on the Runtime when closing
+        :param disable_uds: If set, the runtime does not listen on a Unix domain socket next to `--port-in`. Runtimes on the same host then talk to it over TCP instead of the socket.
         :param docker_kwargs: Dictionary of kwargs arguments that will be passed to Docker SDK when starting the docker '
           container.
 
           More details can be found in the Docker SDK docs:  https://docker-py.readthedocs.io/en/stable/
         :param entrypoint: The entrypoint command overrides the ENTRYPOINT in Docker image. when not set then the Docker image ENTRYPOINT takes effective.
         :param env: The map of environment variables that are available inside runtime
+        :param executor_pool: The pool used to run the synchronous endpoints of the Executor:
+              - THREAD: a thread pool, suited for I/O-bound endpoints or endpoints releasing the GIL
+              - PROCESS: a pool of forked processes, suited for CPU-bound endpoints that do not change the Executor state
+        :param executor_pool_size: The number of threads or processes running the synchronous endpoints of the Executor. An endpoint only runs concurrently if it declares a limit with `@requests(concurrency=...)`.
         :param expose_public: If set, expose the public IP address to remote when necessary, by default it exposesprivate IP address, which only allows accessing under the same network/subnet. Important to set this to true when the Pod will receive input connections from remote Pods
         :param external: The Deployment will be considered an external Deployment that has been started independently from the Flow.This Deployment will not be context managed by the Flow.
         :param force_update: If set, always pull the latest Hub Executor bundle even it exists on local
+        :param fused_executors: dictionary JSON with the arguments of the Executors of the Deployments that run after `--uses` in this runtime, in order. It is set by the Flow when fusing Deployments.
         :param gpus: This argument allows dockerized Jina executor discover local gpu devices.
 
               Note,
@@ -631,10 +977,20 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
               - To access specified gpus based on device id, use `--gpus device=[YOUR-GPU-DEVICE-ID]`
               - To access specified gpus based on multiple device id, use `--gpus device=[YOUR-GPU-DEVICE-ID1],device=[YOUR-GPU-DEVICE-ID2]`
               - To specify more parameters, use `--gpus device=[YOUR-GPU-DEVICE-ID],runtime=nvidia,capabilities=display
+        :param hedge_budget: The maximum ratio of duplicated requests to the requests of the hedged endpoints.
+        :param hedge_endpoints: The endpoints whose requests are duplicated to another replica when the first replica is slow, the first response is taken. Only idempotent endpoints like `/search` should be hedged.
+        :param hedge_percentile: The percentile of the recent latencies of a Deployment after which a request to a hedged endpoint is duplicated.
         :param host: The host address of the runtime, by default it is 0.0.0.0.
         :param host_in: The host address for binding to, by default it is 0.0.0.0
         :param install_requirements: If set, install `requirements.txt` in the Hub Executor bundle to local
+        :param load_balancing: The strategy used to select a replica of a Deployment for each request:
+              - ROUND_ROBIN: replicas take turns in a fixed order
+              - LEAST_OUTSTANDING: the replica with the fewest in-flight requests is chosen
+              - EWMA: two random replicas are compared, the one with the lower latency EWMA weighted by its in-flight requests is chosen
         :param log_config: The YAML config of the logger used in this object.
+        :param max_attempts: The number of attempts to send a request to an unavailable Deployment, every retry goes to another replica if there is one.
+        :param merge_top_k_by: The name of the score (e.g. `cosine`) by which the head merges the matches returned by the shards. If set, the matches of every Document are merged with a heap and cut to the `top_k` given in the parameters, instead of reducing the results of all shards.
+        :param merge_top_k_descending: If set, higher scores are better when merging the matches with `--merge-top-k-by`.
         :param name: The name of this object.
 
           This will be used in the following places:
@@ -645,6 +1001,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
 
           When not given, then the default naming strategy will apply.
         :param native: If set, only native Executors is allowed, and the Executor is always run inside WorkerRuntime.
+        :param outlier_ejection_time: The seconds an ejected replica does not receive requests before it is probed.
+        :param outlier_failures: The number of consecutive failures after which a replica stops receiving requests until it answers a STATUS probe again. 0 disables it.
+        :param outlier_latency_factor: A replica whose latency EWMA is above this factor times the median latency of the other replicas stops receiving requests until it answers a STATUS probe again. 0 disables it.
         :param polling: The polling strategy of the Deployment and its endpoints (when `shards>1`).
               Can be defined for all endpoints of a Deployment or by endpoint.
               Define per Deployment:
@@ -666,9 +1025,11 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param quiet_error: If set, then exception stack information will not be added to the log
         :param quiet_remote_logs: Do not display the streaming of remote logs on local console
         :param replicas: The number of replicas in the deployment
+        :param retry_backoff: The base delay in seconds before retrying a request, it doubles with every retry and is randomly jittered.
         :param runtime_backend: The parallel backend of the runtime inside the Pod
         :param runtime_cls: The runtime class to run inside the Pod
         :param shards: The number of shards in the deployment running at the same time. For more details check https://docs.jina.ai/fundamentals/flow/topology/
+        :param stream_window: The maximum number of requests in flight on the long-lived bidirectional stream of every channel to a replica. The requests are pipelined over the stream instead of being sent in their own unary call, 0 disables the stream.
         :param timeout_ctrl: The timeout in milliseconds of the control request, -1 for waiting forever
         :param timeout_ready: The timeout in milliseconds of a Pod waits for the runtime to be ready, -1 for waiting forever
         :param upload_files: The files on the host to be uploaded to the remote
@@ -958,11 +1319,15 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         if op_flow.args.inspect == FlowInspectType.COLLECT:
             op_flow.gather_inspect(copy_flow=False)
 
+        op_flow._update_fused_deployments()
         if GATEWAY_NAME not in op_flow._deployment_nodes:
             op_flow._add_gateway(
                 needs={op_flow.last_deployment},
                 graph_description=op_flow._get_graph_representation(),
                 deployments_addresses=op_flow._get_deployments_addresses(),
+                deployments_worker_addresses=op_flow._get_deployments_worker_addresses(),
+                deployments_in_process=op_flow._get_deployments_in_process(),
+                deployments_fused=op_flow._fused_deployments,
             )
 
         removed_deployments = []
@@ -1008,6 +1373,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
                 f'{hanging_deployments} are hanging in this flow with no deployment receiving from them, '
                 f'you may want to double check if it is intentional or some mistake'
             )
+        if len(removed_deployments) > 0:
+            op_flow._update_fused_deployments()
+        op_flow._set_fused_executors()
         op_flow._build_level = FlowBuildLevel.GRAPH
         if len(removed_deployments) > 0:
             # very dirty
@@ -1019,6 +1387,19 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
             ].args.deployments_addresses = json.dumps(
                 op_flow._get_deployments_addresses()
             )
+            op_flow._deployment_nodes[
+                GATEWAY_NAME
+            ].args.deployments_worker_addresses = json.dumps(
+                op_flow._get_deployments_worker_addresses()
+            )
+            op_flow._deployment_nodes[
+                GATEWAY_NAME
+            ].args.deployments_in_process = json.dumps(
+                op_flow._get_deployments_in_process()
+            )
+            op_flow._deployment_nodes[GATEWAY_NAME].args.deployments_fused = json.dumps(
+                op_flow._fused_deployments
+            )
 
             op_flow._deployment_nodes[GATEWAY_NAME].update_pod_args()
         return op_flow
@@ -1041,6 +1422,10 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
 
         super().__exit__(exc_type, exc_val, exc_tb)
 
+        if getattr(self, '_uds_dir', None):
+            shutil.rmtree(self._uds_dir, ignore_errors=True)
+            self._uds_dir = None
+
         # unset all envs to avoid any side-effect
         if self.args.env:
             for k in self.args.env.keys():
@@ -1076,8 +1461,11 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
             for k, v in self.args.env.items():
                 os.environ[k] = str(v)
 
+        self._set_uds_dir()
+
         for k, v in self:
-            if not v.external:
+            # the Executors running inside the gateway or fused are started by another runtime
+            if not v.external and not self._is_in_process(v) and not self._is_fused(v):
                 self.enter_context(v)
 
         self._wait_until_all_ready()
@@ -1086,13 +1474,39 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
 
         return self
 
+    def _set_uds_dir(self):
+        # the sockets live in a directory only this user can access, created for every start so that no socket of an
+        # earlier Flow or of another user is ever connected to
+        self._uds_dir = None
+        if self._common_kwargs.get('disable_uds', False) or os.name == 'nt':
+            return
+        self._uds_dir = tempfile.mkdtemp(prefix='jina-')
+        for _, v in self:
+            if v.external:
+                continue
+            v.args.uds_dir = self._uds_dir
+            pod_args = [
+                v.pod_args.get('head'),
+                v.pod_args.get('uses_before'),
+                v.pod_args.get('uses_after'),
+            ]
+            for shard_args in (v.pod_args.get('pods') or {}).values():
+                pod_args.extend(shard_args)
+            for _args in pod_args:
+                if _args is not None:
+                    _args.uds_dir = self._uds_dir
+
     def _wait_until_all_ready(self):
         results = {}
         threads = []
 
         def _wait_ready(_deployment_name, _deployment):
             try:
-                if not _deployment.external:
+                if (
+                    not _deployment.external
+                    and not self._is_in_process(_deployment)
+                    and not self._is_fused(_deployment)
+                ):
                     results[_deployment_name] = 'pending'
                     _deployment.wait_start_success()
                     results[_deployment_name] = 'done'
@@ -1706,6 +2120,17 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param deployment_name: deployment to update
         :param uses_with: a Dictionary of arguments to restart the executor with
         """
+        if self._is_in_process(self._deployment_nodes[deployment_name]):
+            raise ValueError(
+                f'The Executor of {deployment_name} runs inside the Gateway, '
+                f'start the Flow without `in_process` to update it'
+            )
+        if self._is_fused(self._deployment_nodes[deployment_name]):
+            raise ValueError(
+                f'The Executor of {deployment_name} is fused with the Deployment it needs, '
+                f'start the Flow without `fuse` to update it'
+            )
+
         from jina.helper import run_async
 
         run_async(
@@ -1825,6 +2250,21 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param deployment_name: deployment to update
         :param replicas: The number of replicas to scale to
         """
+        if self._is_head_bypassed(self._deployment_nodes[deployment_name]):
+            raise ValueError(
+                f'The Gateway sends the requests of {deployment_name} to its replicas directly, '
+                f'start the Flow without `head_bypass` to scale it'
+            )
+        if self._is_in_process(self._deployment_nodes[deployment_name]):
+            raise ValueError(
+                f'The Executor of {deployment_name} runs inside the Gateway, '
+                f'start the Flow without `in_process` to scale it'
+            )
+        if self._is_fused(self._deployment_nodes[deployment_name]):
+            raise ValueError(
+                f'The Executor of {deployment_name} is fused with the Deployment it needs, '
+                f'start the Flow without `fuse` to scale it'
+            )
 
         # TODO when replicas-host is ready, needs to be passed here
 
@@ -19,7 +19,10 @@ def set_pod_parser(parser=None):
     from jina.parsers.orchestrate.runtimes.container import (
         mixin_container_runtime_parser,
     )
-    from jina.parsers.orchestrate.runtimes.remote import mixin_remote_runtime_parser
+    from jina.parsers.orchestrate.runtimes.remote import (
+        mixin_remote_runtime_parser,
+        mixin_compressor_parser,
+    )
     from jina.parsers.orchestrate.pod import mixin_pod_parser
     from jina.parsers.orchestrate.runtimes.distributed import (
         mixin_distributed_feature_parser,
@@ -30,6 +33,7 @@ def set_pod_parser(parser=None):
     mixin_worker_runtime_parser(parser)
     mixin_container_runtime_parser(parser)
     mixin_remote_runtime_parser(parser)
+    mixin_compressor_parser(parser)
     mixin_distributed_feature_parser(parser)
     mixin_pod_parser(parser)
     mixin_hub_pull_options_parser(parser)
@@ -37,3 +37,70 @@ def mixin_client_features_parser(parser):
         default=False,
         help="If set, return results as DocArray instead of Request.",
     )
+
+    from jina.enums import LoadBalancingType
+
+    parser.add_argument(
+        '--grpc-streams',
+        type=int,
+        default=1,
+        help='The number of gRPC channels the client opens, each with its own stream to the gateway. The requests '
+        'are spread across the streams, so that the client is not bound to a single connection.',
+    )
+
+    parser.add_argument(
+        '--gateway-addresses',
+        type=str,
+        nargs='*',
+        help='The addresses `host:port` of the gateway replicas the gRPC streams are spread across, at least one '
+        'stream is opened to every address. By default all the streams go to `--host` and `--port`.',
+    )
+
+    parser.add_argument(
+        '--streams-load-balancing',
+        type=LoadBalancingType.from_string,
+        choices=[LoadBalancingType.ROUND_ROBIN, LoadBalancingType.LEAST_OUTSTANDING],
+        default=LoadBalancingType.ROUND_ROBIN,
+        help='''
+    The strategy used to select the gRPC stream of each request when there are several:
+    - ROUND_ROBIN: streams take turns in a fixed order
+    - LEAST_OUTSTANDING: the stream with the fewest requests waiting for a response is chosen''',
+    )
+
+    from jina.enums import ExecutorPoolType
+
+    parser.add_argument(
+        '--request-builders',
+        type=int,
+        default=0,
+        help='The number of threads or processes building and serializing the requests ahead of the stream, so that '
+        'converting the inputs to Documents does not hold back the client. 0 builds every request when it is sent.',
+    )
+
+    parser.add_argument(
+        '--request-builders-pool',
+        type=ExecutorPoolType.from_string,
+        choices=list(ExecutorPoolType),
+        default=ExecutorPoolType.THREAD,
+        help='''
+    The pool building the requests when `--request-builders` is set:
+    - THREAD: a thread pool, suited for inputs whose conversion releases the GIL, like NumPy arrays
+    - PROCESS: a pool of processes forked from the client, suited for inputs converted by Python code
+    ''',
+    )
+
+    parser.add_argument(
+        '--request-queue-size',
+        type=int,
+        default=16,
+        help='The maximum number of serialized requests built ahead of the stream when `--request-builders` is set. '
+        'It bounds the memory used by the requests waiting to be sent.',
+    )
+
+    parser.add_argument(
+        '--preserve-order',
+        action='store_true',
+        default=False,
+        help='If set, the responses are returned in the order of the requests, even when the Flow or the streams '
+        'complete them out of order.',
+    )
@@ -33,6 +33,35 @@ def mixin_flow_features_parser(parser):
     ''',
     )
 
+    gp.add_argument(
+        '--head-bypass',
+        action='store_true',
+        default=False,
+        help='If set, the Gateway sends the requests of the Deployments with a single shard and without '
+        '`uses_before`/`uses_after` directly to their replicas. Their heads only register the replicas. '
+        'These Deployments can not be scaled while the Flow is running.',
+    )
+
+    gp.add_argument(
+        '--in-process',
+        action='store_true',
+        default=False,
+        help='If set, the Executors of the Deployments with a single shard, a single replica, no '
+        '`uses_before`/`uses_after` and no container run inside the Gateway process. The requests are passed to '
+        'them without gRPC and serialization. These Deployments can not be scaled or updated while the Flow is running.',
+    )
+
+    gp.add_argument(
+        '--fuse',
+        action='store_true',
+        default=False,
+        help='If set, the linear chains of Deployments with a single shard, a single replica, no '
+        '`uses_before`/`uses_after` and no container are fused: the first Deployment of a chain runs all their '
+        'Executors back to back on the same request, the other Deployments are not started. The routes of the '
+        'response still report every Executor. The fused Deployments can not be scaled or updated while the Flow '
+        'is running.',
+    )
+
 
 def set_flow_parser(parser=None):
     """Set the parser for the flow
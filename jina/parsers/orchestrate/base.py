@@ -3,7 +3,7 @@ import argparse
 import os
 
 from jina.parsers.helper import add_arg_group, _SHOW_ALL_ARGS
-from jina.enums import PollingType
+from jina.enums import PollingType, LoadBalancingType
 from jina.helper import random_identity
 
 
@@ -122,3 +122,111 @@ When not given, then the default naming strategy will apply.
     
     ''',
     )
+
+    gp.add_argument(
+        '--load-balancing',
+        type=LoadBalancingType.from_string,
+        choices=list(LoadBalancingType),
+        default=LoadBalancingType.ROUND_ROBIN,
+        help='''
+    The strategy used to select a replica of a Deployment for each request:
+    - ROUND_ROBIN: replicas take turns in a fixed order
+    - LEAST_OUTSTANDING: the replica with the fewest in-flight requests is chosen
+    - EWMA: two random replicas are compared, the one with the lower latency EWMA weighted by its in-flight requests is chosen
+    ''',
+    )
+
+    gp.add_argument(
+        '--channels-per-replica',
+        type=int,
+        default=1,
+        help='The number of gRPC channels opened to every replica of a Deployment. Every channel is a separate HTTP/2 '
+        'connection, more channels raise the number of concurrent requests a replica can take under high load.',
+    )
+
+    gp.add_argument(
+        '--stream-window',
+        type=int,
+        default=64,
+        help='The maximum number of requests in flight on the long-lived bidirectional stream of every channel to a '
+        'replica. The requests are pipelined over the stream instead of being sent in their own unary call, 0 '
+        'disables the stream.',
+    )
+
+    gp.add_argument(
+        '--max-attempts',
+        type=int,
+        default=3,
+        help='The number of attempts to send a request to an unavailable Deployment, every retry goes to another '
+        'replica if there is one.',
+    )
+
+    gp.add_argument(
+        '--retry-backoff',
+        type=float,
+        default=0.05,
+        help='The base delay in seconds before retrying a request, it doubles with every retry and is randomly '
+        'jittered.',
+    )
+
+    gp.add_argument(
+        '--outlier-failures',
+        type=int,
+        default=5,
+        help='The number of consecutive failures after which a replica stops receiving requests until it answers a '
+        'STATUS probe again. 0 disables it.',
+    )
+
+    gp.add_argument(
+        '--outlier-latency-factor',
+        type=float,
+        default=10.0,
+        help='A replica whose latency EWMA is above this factor times the median latency of the other replicas stops '
+        'receiving requests until it answers a STATUS probe again. 0 disables it.',
+    )
+
+    gp.add_argument(
+        '--outlier-ejection-time',
+        type=float,
+        default=10.0,
+        help='The seconds an ejected replica does not receive requests before it is probed.',
+    )
+
+    gp.add_argument(
+        '--circuit-breaker-failures',
+        type=int,
+        default=10,
+        help='The number of consecutive failed requests to a Deployment after which requests fail fast without '
+        'being sent. 0 disables it.',
+    )
+
+    gp.add_argument(
+        '--circuit-breaker-reset-time',
+        type=float,
+        default=5.0,
+        help='The seconds requests fail fast after the circuit breaker of a Deployment opened, then a trial request '
+        'is let through.',
+    )
+
+    gp.add_argument(
+        '--hedge-endpoints',
+        type=str,
+        nargs='*',
+        help='The endpoints whose requests are duplicated to another replica when the first replica is slow, the '
+        'first response is taken. Only idempotent endpoints like `/search` should be hedged.',
+    )
+
+    gp.add_argument(
+        '--hedge-percentile',
+        type=float,
+        default=95.0,
+        help='The percentile of the recent latencies of a Deployment after which a request to a hedged endpoint is '
+        'duplicated.',
+    )
+
+    gp.add_argument(
+        '--hedge-budget',
+        type=float,
+        default=0.05,
+        help='The maximum ratio of duplicated requests to the requests of the hedged endpoints.',
+    )
@@ -25,3 +25,19 @@ def mixin_head_parser(parser):
         type=str,
         help='dictionary JSON with a list of connections to configure',
     )
+
+    gp.add_argument(
+        '--merge-top-k-by',
+        type=str,
+        default=None,
+        help='The name of the score (e.g. `cosine`) by which the head merges the matches returned by the shards. '
+        'If set, the matches of every Document are merged with a heap and cut to the `top_k` given in the parameters, '
+        'instead of reducing the results of all shards.',
+    )
+
+    gp.add_argument(
+        '--merge-top-k-descending',
+        action='store_true',
+        default=False,
+        help='If set, higher scores are better when merging the matches with `--merge-top-k-by`.',
+    )
@@ -58,6 +58,88 @@ def mixin_gateway_parser(parser):
         help='The port that the gateway exposes for clients for GRPC connections.',
     )
 
+    gp.add_argument(
+        '--response-cache',
+        action=KVAppendAction,
+        metavar='ENDPOINT: TTL',
+        nargs='*',
+        help='The endpoints whose responses are cached by the gateway, with the time to live of the cached '
+        'responses in seconds. Only idempotent endpoints should be cached, a cached response is returned without '
+        'reaching the Executors.',
+    )
+
+    gp.add_argument(
+        '--response-cache-size',
+        type=int,
+        default=1000,
+        help='The maximum number of responses cached by the gateway, the least recently used response is evicted '
+        'beyond it.',
+    )
+
+    gp.add_argument(
+        '--response-cache-invalidate-on',
+        type=str,
+        nargs='*',
+        default=['/index', '/update', '/delete'],
+        help='The endpoints that drop all the responses cached by the gateway when they are called.',
+    )
+
+    gp.add_argument(
+        '--max-inflight-requests',
+        type=int,
+        default=0,
+        help='The maximum number of requests the gateway lets into the Flow at once, the requests beyond it are '
+        'queued briefly and then shed with a RESOURCE_EXHAUSTED error. 0 means no cap.',
+    )
+
+    gp.add_argument(
+        '--max-inflight-bytes',
+        type=int,
+        default=0,
+        help='The maximum size in bytes of the requests the gateway lets into the Flow at once. 0 means no cap.',
+    )
+
+    gp.add_argument(
+        '--max-inflight-requests-per-client',
+        type=int,
+        default=0,
+        help='The maximum number of requests of a single client host the gateway lets into the Flow at once. '
+        '0 means no cap.',
+    )
+
+    gp.add_argument(
+        '--max-inflight-bytes-per-client',
+        type=int,
+        default=0,
+        help='The maximum size in bytes of the requests of a single client host the gateway lets into the Flow at '
+        'once. 0 means no cap.',
+    )
+
+    gp.add_argument(
+        '--admission-queue-size',
+        type=int,
+        default=100,
+        help='The maximum number of requests waiting to be let into the Flow, when it is full the requests with the '
+        'lowest `priority` are shed.',
+    )
+
+    gp.add_argument(
+        '--admission-queue-timeout',
+        type=float,
+        default=0.1,
+        help='The seconds a request waits to be let into the Flow before it is shed, 0 sheds the requests beyond the '
+        'caps right away.',
+    )
+
+    gp.add_argument(
+        '--stats-interval',
+        type=float,
+        default=0,
+        help='The seconds between two logs of the statistics of the gateway, like the requests in flight per replica '
+        'and the hits of the response cache. '
+        '0 disables the periodic logs. The HTTP gateway also serves them at `/stats`.',
+    )
+
     parser.add_argument(
         '--graph-description',
         type=str,
@@ -72,6 +154,27 @@ def mixin_gateway_parser(parser):
         default='{}',
     )
 
+    parser.add_argument(
+        '--deployments-worker-addresses',
+        type=str,
+        help='dictionary JSON with the addresses of the replicas of each Deployment whose head is bypassed',
+        default='{}',
+    )
+
+    parser.add_argument(
+        '--deployments-in-process',
+        type=str,
+        help='dictionary JSON with the arguments of each Deployment whose Executor runs inside the Gateway',
+        default='{}',
+    )
+
+    parser.add_argument(
+        '--deployments-fused',
+        type=str,
+        help='dictionary JSON with the Deployments whose Executors run in the worker of each Deployment, in order',
+        default='{}',
+    )
+
 
 def _add_host(arg_group):
     arg_group.add_argument(
@@ -133,7 +236,7 @@ def mixin_http_gateway_parser(parser=None):
         '--no-debug-endpoints',
         action='store_true',
         default=False,
-        help='If set, /status /post endpoints are removed from HTTP interface. ',
+        help='If set, /status /stats /post endpoints are removed from HTTP interface. ',
     )
 
     gp.add_argument(
@@ -155,6 +258,30 @@ def mixin_http_gateway_parser(parser=None):
         ''',
     )
 
+    gp.add_argument(
+        '--bulk-request-size',
+        type=int,
+        default=100,
+        help='The number of Documents per request when the Documents streamed to the /bulk endpoint are batched, '
+        'a client can override it with the `request_size` query parameter.',
+    )
+
+    gp.add_argument(
+        '--bulk-prefetch',
+        type=int,
+        default=10,
+        help='The number of requests of a stream to the /bulk endpoint that are in flight at once. It bounds the '
+        'memory used by the stream on the gateway, whatever the size of the upload.',
+    )
+
+    gp.add_argument(
+        '--bulk-max-document-size',
+        type=int,
+        default=16 * 1024 * 1024,
+        help='The maximum size in bytes of a Document streamed to the /bulk endpoint, a JSON line or a serialized '
+        'Document. A larger Document is rejected with a 413 error, 0 means no limit.',
+    )
+
     gp.add_argument(
         '--uvicorn-kwargs',
         action=KVAppendAction,
@@ -185,6 +312,36 @@ def mixin_prefetch_parser(parser=None):
     Used to control the speed of data input into a Flow. 0 disables prefetch (disabled by default)''',
     )
 
+    gp.add_argument(
+        '--prefetch-adaptive',
+        action='store_true',
+        default=False,
+        help='''
+    If set, the number of requests in flight is tuned from their latency, it grows as long as the latency does not.
+
+    `--prefetch` then bounds the window, 0 leaves it unbounded''',
+    )
+
+    gp.add_argument(
+        '--results-in-order',
+        action='store_true',
+        default=False,
+        help='''
+    If set, the responses of a stream are returned in the order of its requests instead of the order they complete in.
+
+    The responses completing early are held back in a reorder buffer bounded by `--reorder-buffer-size`''',
+    )
+
+    gp.add_argument(
+        '--reorder-buffer-size',
+        type=int,
+        default=100,
+        help='''
+    The maximum number of requests of a stream in flight or held back when `--results-in-order` is set.
+
+    No new request is read from the client while the buffer is full, a slow request stalls the stream instead of growing the buffer''',
+    )
+
 
 def mixin_compressor_parser(parser=None):
     """Add the options for compressors
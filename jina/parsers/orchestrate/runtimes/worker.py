@@ -4,6 +4,7 @@ import argparse
 from jina.parsers.helper import add_arg_group, _SHOW_ALL_ARGS, KVAppendAction
 from jina import __default_host__
 from jina import helper
+from jina.enums import ExecutorPoolType
 
 
 def mixin_worker_runtime_parser(parser):
@@ -85,6 +86,29 @@ which should be structured as a python package. For more details, please see the
         default=__default_host__,
         help=f'The host address for binding to, by default it is {__default_host__}',
     )
+    gp.add_argument(
+        '--disable-uds',
+        action='store_true',
+        default=False,
+        help='If set, the runtime does not listen on a Unix domain socket next to `--port-in`. Runtimes on the same '
+        'host then talk to it over TCP instead of the socket.',
+    )
+    gp.add_argument(
+        '--uds-dir',
+        type=str,
+        default=None,
+        help='The private directory the Flow creates for the Unix domain sockets of its runtimes. Runtimes do not '
+        'listen on a socket without it.'
+        if _SHOW_ALL_ARGS
+        else argparse.SUPPRESS,
+    )
+    gp.add_argument(
+        '--fused-executors',
+        type=str,
+        default='{}',
+        help='dictionary JSON with the arguments of the Executors of the Deployments that run after `--uses` in this '
+        'runtime, in order. It is set by the Flow when fusing Deployments.',
+    )
 
     gp.add_argument(
         '--native',
@@ -92,3 +116,23 @@ which should be structured as a python package. For more details, please see the
         default=False,
         help='If set, only native Executors is allowed, and the Executor is always run inside WorkerRuntime.',
     )
+
+    gp.add_argument(
+        '--executor-pool',
+        type=ExecutorPoolType.from_string,
+        choices=list(ExecutorPoolType),
+        default=ExecutorPoolType.THREAD,
+        help='''
+    The pool used to run the synchronous endpoints of the Executor:
+    - THREAD: a thread pool, suited for I/O-bound endpoints or endpoints releasing the GIL
+    - PROCESS: a pool of forked processes, suited for CPU-bound endpoints that do not change the Executor state
+    ''',
+    )
+
+    gp.add_argument(
+        '--executor-pool-size',
+        type=int,
+        default=1,
+        help='The number of threads or processes running the synchronous endpoints of the Executor. '
+        'An endpoint only runs concurrently if it declares a limit with `@requests(concurrency=...)`.',
+    )
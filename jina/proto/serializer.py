@@ -1,5 +1,8 @@
-from typing import List, Union, Iterable
+import time
+from typing import Dict, List, Sequence, Tuple, Union, Iterable
 
+from jina.enums import CompressAlgo
+from jina.excepts import BadRequestCompression
 from jina.proto import jina_pb2
 from jina.types.request.control import ControlRequest
 from jina.types.request.data import DataRequest
@@ -48,9 +51,7 @@ class DataRequestProto:
         # noqa: DAR102
         # noqa: DAR201
         """
-        if not x.is_decompressed:
-            return x.buffer
-        return x.proto.SerializePartialToString()
+        return x.to_bytes()
 
     @staticmethod
     def FromString(x: bytes):
@@ -63,6 +64,273 @@ class DataRequestProto:
         return DataRequest(x)
 
 
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _decode_varint(buffer: memoryview, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        b = buffer[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+
+def encode_length_delimited(field_number: int, payload: bytes) -> bytes:
+    """
+    Encode a field holding a serialized message, bytes or a string, without building the message it belongs to
+
+    :param field_number: the number of the field
+    :param payload: the serialized value of the field
+    :return: the encoded field, it can be concatenated with the other encoded fields of its message
+    """
+    return b''.join(
+        [_encode_varint(field_number << 3 | 2), _encode_varint(len(payload)), payload]
+    )
+
+
+def split_fields(
+    x: bytes, field_numbers: Sequence[int]
+) -> Tuple[Dict[int, List[memoryview]], List[memoryview]]:
+    """
+    Split a serialized message into the encoded occurrences of some top-level fields and all other fields, without
+    deserializing any of them. Parsing the concatenation of all parts gives the original message.
+
+    :param x: the serialized message
+    :param field_numbers: the numbers of the fields to split off
+    :return: views on the encoded occurrences of every given field and views on the encoded other fields
+    """
+    view = memoryview(x)
+    fields = {field_number: [] for field_number in field_numbers}
+    others = []
+    pos = 0
+    while pos < len(view):
+        start = pos
+        tag, pos = _decode_varint(view, pos)
+        wire_type = tag & 0x7
+        if wire_type == 0:
+            _, pos = _decode_varint(view, pos)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 2:
+            length, pos = _decode_varint(view, pos)
+            pos += length
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f'unsupported wire type {wire_type} in serialized message')
+        fields.get(tag >> 3, others).append(view[start:pos])
+    return fields, others
+
+
+def get_field_payload(field: memoryview) -> memoryview:
+    """
+    Get the value of an encoded length-delimited field split off by :func:`split_fields`
+
+    :param field: the encoded field
+    :return: a view on the serialized message, bytes or string held by the field
+    """
+    _, pos = _decode_varint(field, 0)
+    _, pos = _decode_varint(field, pos)
+    return field[pos:]
+
+
+# a serialized protobuf message never starts with a zero byte (field number 0 is invalid),
+# so it is used to mark compressed payloads, followed by one byte for the :class:`CompressAlgo`
+_COMPRESSED_MAGIC = 0
+
+# a few bytes of compressed zeros expand to gigabytes, the decompressed size of a request is capped
+MAX_DECOMPRESSED_BYTES = 1 << 30
+
+
+def _get_codec(algo: CompressAlgo):
+    if algo == CompressAlgo.LZ4:
+        from jina.importer import ImportExtensions
+
+        with ImportExtensions(required=True):
+            import lz4.frame
+
+        return lz4.frame
+    elif algo == CompressAlgo.ZLIB:
+        import zlib
+
+        return zlib
+    elif algo == CompressAlgo.GZIP:
+        import gzip
+
+        return gzip
+    elif algo == CompressAlgo.BZ2:
+        import bz2
+
+        return bz2
+    elif algo == CompressAlgo.LZMA:
+        import lzma
+
+        return lzma
+    else:
+        raise ValueError(f'{algo!r} is not a valid compression algorithm')
+
+
+def _get_decompressor(algo: CompressAlgo):
+    codec = _get_codec(algo)
+    if algo == CompressAlgo.LZ4:
+        return codec.LZ4FrameDecompressor()
+    elif algo == CompressAlgo.ZLIB:
+        return codec.decompressobj()
+    elif algo == CompressAlgo.GZIP:
+        import zlib
+
+        # a single gzip member, as written by `gzip.compress`
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    elif algo == CompressAlgo.BZ2:
+        return codec.BZ2Decompressor()
+    else:
+        return codec.LZMADecompressor()
+
+
+def is_compressed(x: bytes) -> bool:
+    """
+    Check if the given bytes were produced by :func:`compress_bytes`
+
+    :param x: the serialized message
+    :return: True if the bytes carry a compressed message
+    """
+    return len(x) > 1 and x[0] == _COMPRESSED_MAGIC
+
+
+def compress_bytes(x: bytes, algo: CompressAlgo) -> bytes:
+    """
+    Compress a serialized message and mark it so that it can be recognized by :func:`decompress_bytes`
+
+    :param x: the serialized message
+    :param algo: the compression algorithm
+    :return: the compressed message
+    """
+    return bytes([_COMPRESSED_MAGIC, int(algo)]) + _get_codec(algo).compress(x)
+
+
+def decompress_bytes(x: bytes, max_size: int = MAX_DECOMPRESSED_BYTES) -> bytes:
+    """
+    Decompress a message produced by :func:`compress_bytes`, other messages are returned unchanged
+
+    The message is decompressed incrementally and never beyond `max_size` bytes.
+
+    :param x: the (possibly compressed) serialized message
+    :param max_size: the maximum size of the uncompressed message
+    :return: the uncompressed serialized message
+    """
+    if not is_compressed(x):
+        return x
+    try:
+        decompressor = _get_decompressor(CompressAlgo(x[1]))
+        uncompressed = decompressor.decompress(memoryview(x)[2:], max_size + 1)
+    except Exception as ex:
+        raise BadRequestCompression(
+            f'the request can not be decompressed: {ex!r}'
+        ) from ex
+    if len(uncompressed) > max_size:
+        raise BadRequestCompression(
+            f'the request is larger than {max_size} bytes once decompressed'
+        )
+    if not decompressor.eof:
+        raise BadRequestCompression('the compressed request is truncated')
+    return uncompressed
+
+
+class DataRequestCompressor:
+    """Compresses :class:`DataRequest` before they are sent over gRPC and tracks the bytes saved.
+
+    Requests smaller than `min_bytes` or not reaching `min_ratio` are sent uncompressed,
+    so that small requests skip the CPU cost.
+
+    :param algo: the compression algorithm
+    :param min_bytes: the minimum size of a serialized request to be compressed
+    :param min_ratio: the minimum compression ratio (uncompressed_size/compressed_size) to send the compressed request
+    """
+
+    def __init__(
+        self,
+        algo: CompressAlgo = CompressAlgo.ZLIB,
+        min_bytes: int = 1024,
+        min_ratio: float = 1.1,
+    ):
+        self.algo = algo
+        self.min_bytes = min_bytes
+        self.min_ratio = min_ratio
+        self.num_compressed = 0
+        self.num_skipped = 0
+        self.bytes_saved = 0
+        self.compress_time = 0.0
+
+    @classmethod
+    def from_args(cls, args) -> 'DataRequestCompressor':
+        """
+        Create a compressor from the `--compress` options
+
+        :param args: the parsed CLI arguments
+        :return: the compressor or None if compression is disabled
+        """
+        algo = getattr(args, 'compress', CompressAlgo.NONE)
+        min_bytes = getattr(args, 'compress_min_bytes', 1024)
+        if algo == CompressAlgo.NONE or min_bytes < 0:
+            return None
+        return cls(algo, min_bytes, getattr(args, 'compress_min_ratio', 1.1))
+
+    def clone(self) -> 'DataRequestCompressor':
+        """
+        Create a compressor with the same settings but fresh counters
+
+        :return: the new compressor
+        """
+        return DataRequestCompressor(self.algo, self.min_bytes, self.min_ratio)
+
+    def compress(self, request: 'DataRequest') -> 'DataRequest':
+        """
+        Serialize and compress the request if it passes the thresholds
+
+        :param request: the request to send
+        :return: a request wrapping the bytes to put on the wire
+        """
+        if not request.is_decompressed and is_compressed(request.buffer):
+            return request
+        data = DataRequestProto.SerializeToString(request)
+        if len(data) < self.min_bytes:
+            self.num_skipped += 1
+            return request
+
+        start = time.perf_counter()
+        compressed = compress_bytes(data, self.algo)
+        self.compress_time += time.perf_counter() - start
+        if len(data) < len(compressed) * self.min_ratio:
+            self.num_skipped += 1
+            return DataRequest(data)
+        self.num_compressed += 1
+        self.bytes_saved += len(data) - len(compressed)
+        return DataRequest(compressed)
+
+    def get_stats(self) -> Dict:
+        """
+        Returns the compression statistics
+
+        :return: dict with the number of compressed and skipped requests, the bytes saved and the time spent compressing
+        """
+        return {
+            'num_compressed': self.num_compressed,
+            'num_skipped': self.num_skipped,
+            'bytes_saved': self.bytes_saved,
+            'compress_time': self.compress_time,
+        }
+
+
 class DataRequestListProto:
     """This class is a drop-in replacement for gRPC default serializer.
     It replace default serializer to make sure the message sending interface is convenient.
@@ -77,14 +345,17 @@ class DataRequestListProto:
         # noqa: DAR102
         # noqa: DAR201
         """
-        protos = []
         if not isinstance(x, Iterable):
-            protos.append(x.proto)
-        else:
-            for r in x:
-                protos.append(r.proto)
-
-        return jina_pb2.DataRequestListProto(requests=protos).SerializeToString()
+            x = [x]
+        # encode the list by hand, so the requests are not deserialized to build a DataRequestListProto
+        tag = _encode_varint(
+            jina_pb2.DataRequestListProto.REQUESTS_FIELD_NUMBER << 3 | 2
+        )
+        segments = []
+        for r in x:
+            data = r.to_bytes()
+            segments.extend([tag, _encode_varint(len(data)), data])
+        return b''.join(segments)
 
     @staticmethod
     def FromString(x: bytes):
@@ -93,10 +364,12 @@ class DataRequestListProto:
         # noqa: DAR102
         # noqa: DAR201
         """
-        rlp = jina_pb2.DataRequestListProto()
-        rlp.ParseFromString(x)
+        field_number = jina_pb2.DataRequestListProto.REQUESTS_FIELD_NUMBER
+        fields, _ = split_fields(x, [field_number])
         requests = []
-        for request in rlp.requests:
-            requests.append(DataRequest.from_proto(request))
+        for field in fields[field_number]:
+            _, pos = _decode_varint(field, 0)
+            _, pos = _decode_varint(field, pos)
+            requests.append(DataRequest(bytes(field[pos:])))
 
         return requests
@@ -1,18 +1,21 @@
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 import inspect
 import os
 from types import SimpleNamespace
-from typing import Dict, Optional, Type, List
+from typing import Callable, Dict, Optional, Type, List
 
 from jina.serve.executors.decorators import store_init_kwargs, wrap_func, requests
 from jina import __default_endpoint__, __args_executor_init__
+from jina.enums import ExecutorPoolType
 from jina.helper import (
     typename,
     ArgNamespace,
     T,
     iscoroutinefunction,
     run_in_threadpool,
+    start_process_pool,
 )
 from jina.jaml import JAMLCompatible, JAML, env_var_regex, internal_var_regex
 
@@ -23,6 +26,22 @@ if TYPE_CHECKING:
 
 __all__ = ['BaseExecutor', 'ReducerExecutor']
 
+# the copy of the Executor living in a process of the process pool
+_process_executor = None
+
+
+def _set_process_executor(executor: 'BaseExecutor'):
+    global _process_executor
+    _process_executor = executor
+
+
+def _call_process_executor(req_endpoint: str, kwargs: Dict):
+    return_data = _process_executor.requests[req_endpoint](_process_executor, **kwargs)
+    if return_data is None:
+        # in-place changes are not visible to the worker process, send the Documents back
+        return kwargs.get('docs')
+    return return_data
+
 
 class ExecutorType(type(JAMLCompatible), type):
     """The class of Executor type, which is the metaclass of :class:`BaseExecutor`."""
@@ -106,10 +125,10 @@ class BaseExecutor(JAMLCompatible, metaclass=ExecutorType):
         :param runtime_args: a dict of arguments injected from :class:`Runtime` during runtime
         :param kwargs: additional extra keyword arguments to avoid failing when extra params ara passed that are not expected
         """
-        self._thread_pool = ThreadPoolExecutor(max_workers=1)
         self._add_metas(metas)
         self._add_requests(requests)
         self._add_runtime_args(runtime_args)
+        self._add_pools()
 
     def _add_runtime_args(self, _runtime_args: Optional[Dict]):
         if _runtime_args:
@@ -117,6 +136,61 @@ class BaseExecutor(JAMLCompatible, metaclass=ExecutorType):
         else:
             self.runtime_args = SimpleNamespace()
 
+    def _add_pools(self):
+        pool_type = getattr(self.runtime_args, 'executor_pool', ExecutorPoolType.THREAD)
+        # runtime args loaded from YAML hold the name of the enum
+        self._pool_type = (
+            pool_type
+            if isinstance(pool_type, ExecutorPoolType)
+            else ExecutorPoolType.from_string(pool_type)
+        )
+        self._pool_size = getattr(self.runtime_args, 'executor_pool_size', 1)
+        self._thread_pool = ThreadPoolExecutor(max_workers=self._pool_size)
+        # the processes are forked once the Executor is fully initialized
+        self._process_pool = None
+        self._process_pool_futures = set()
+        self._endpoint_semaphores = {}
+
+    def _get_endpoint_semaphore(self, func: Callable) -> 'asyncio.Semaphore':
+        # functions not declared thread-safe share one semaphore, so they never run concurrently
+        concurrency = getattr(func, 'concurrency', None)
+        key = func if concurrency else None
+        if key not in self._endpoint_semaphores:
+            self._endpoint_semaphores[key] = asyncio.Semaphore(concurrency or 1)
+        return self._endpoint_semaphores[key]
+
+    def _start_process_pool(self):
+        # Executors not calling `super().__init__` have no pools
+        if (
+            getattr(self, '_pool_type', None) != ExecutorPoolType.PROCESS
+            or self._process_pool
+        ):
+            return
+        # fork all processes now, gRPC does not support forking once its threads are running
+        self._process_pool = start_process_pool(
+            self._pool_size, initializer=_set_process_executor, initargs=(self,)
+        )
+
+    async def _run_in_process_pool(self, req_endpoint: str, **kwargs):
+        self._start_process_pool()
+        future: Future = self._process_pool.submit(
+            _call_process_executor, req_endpoint, kwargs
+        )
+        # the pending calls are cancelled when the pool is closed
+        self._process_pool_futures.add(future)
+        future.add_done_callback(self._process_pool_futures.discard)
+        return await asyncio.wrap_future(future)
+
+    def _close_pools(self):
+        if hasattr(self, '_thread_pool'):
+            self._thread_pool.shutdown(wait=False)
+        if getattr(self, '_process_pool', None) is not None:
+            # `shutdown(cancel_futures=True)` requires Python 3.9
+            for future in list(self._process_pool_futures):
+                future.cancel()
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
+
     def _add_requests(self, _requests: Optional[Dict]):
         if not hasattr(self, 'requests'):
             self.requests = {}
@@ -228,7 +302,10 @@ class BaseExecutor(JAMLCompatible, metaclass=ExecutorType):
         if iscoroutinefunction(func):
             return await func(self, **kwargs)
         else:
-            return await run_in_threadpool(func, self._thread_pool, self, **kwargs)
+            async with self._get_endpoint_semaphore(func):
+                if self._pool_type == ExecutorPoolType.PROCESS:
+                    return await self._run_in_process_pool(req_endpoint, **kwargs)
+                return await run_in_threadpool(func, self._thread_pool, self, **kwargs)
 
     @property
     def workspace(self) -> Optional[str]:
@@ -76,6 +76,9 @@ def requests(
     ] = None,
     *,
     on: Optional[Union[str, Sequence[str]]] = None,
+    dynamic_batch: Optional[int] = None,
+    max_wait_ms: float = 5,
+    concurrency: Optional[int] = None,
 ):
     """
     `@requests` defines when a function will be invoked. It has a keyword `on=` to define the endpoint.
@@ -83,8 +86,16 @@ def requests(
     A class method decorated with plan `@requests` (without `on=`) is the default handler for all endpoints.
     That means, it is the fallback handler for endpoints that are not found.
 
+    With `dynamic_batch=`, the Documents of concurrently arriving requests are merged and the function is called
+    once for the whole batch. The function must then either change the Documents in-place or return one Document
+    per input Document in the same order.
+
     :param func: the method to decorate
     :param on: the endpoint string, by convention starts with `/`
+    :param dynamic_batch: the number of Documents at which a batch is processed, None disables dynamic batching
+    :param max_wait_ms: the maximum time in milliseconds a request waits for other requests to join its batch
+    :param concurrency: the number of calls of a synchronous function that may run at the same time, which declares
+        the function thread-safe. None means the function never runs concurrently with other undeclared functions
     :return: decorated function
     """
     from jina import __default_endpoint__, __args_executor_func__
@@ -116,6 +127,10 @@ def requests(
 
                 self.fn = arg_wrapper
 
+            self.fn.dynamic_batch = dynamic_batch
+            self.fn.max_wait_ms = max_wait_ms
+            self.fn.concurrency = concurrency
+
         def __set_name__(self, owner, name):
             self.fn.class_name = owner.__name__
             if not hasattr(owner, 'requests'):
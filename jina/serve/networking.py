@@ -1,16 +1,21 @@
 import os
 import asyncio
 import ipaddress
+import random
+import statistics
+import time
+from collections import deque
 from threading import Thread
-from typing import Optional, List, Dict, TYPE_CHECKING, Tuple
+from typing import Optional, Iterable, List, Dict, TYPE_CHECKING, Tuple
 from urllib.parse import urlparse
 
 import grpc
 from grpc.aio import AioRpcError
 
 from jina.logging.logger import JinaLogger
-from jina.proto import jina_pb2_grpc
-from jina.enums import PollingType
+from jina.proto import jina_pb2, jina_pb2_grpc
+from jina.proto.serializer import DataRequestCompressor
+from jina.enums import PollingType, LoadBalancingType
 from jina.helper import get_or_reuse_loop
 from jina.types.request import Request
 from jina.types.request.control import ControlRequest
@@ -20,16 +25,622 @@ if TYPE_CHECKING:
     import kubernetes
 
 
+class HealthPolicy:
+    """
+    Settings of the retries, the outlier ejection and the circuit breaking of a connection pool
+
+    :param max_attempts: the number of attempts to send a request, every retry goes to another replica if possible
+    :param retry_backoff: the base delay in seconds before a retry, it grows exponentially and is fully jittered
+    :param outlier_failures: the number of consecutive failures ejecting a replica, 0 disables it
+    :param outlier_latency_factor: a replica whose latency EWMA is above this factor times the median of its peers
+        is ejected, 0 disables it
+    :param outlier_ejection_time: the seconds an ejected replica is out before it is probed with a STATUS request
+    :param circuit_breaker_failures: the number of consecutive failed requests opening the circuit of a deployment,
+        0 disables it
+    :param circuit_breaker_reset_time: the seconds the circuit stays open before a trial request is let through
+    """
+
+    MAX_BACKOFF = 2.0
+    MIN_LATENCY_SAMPLES = 10
+    PROBE_TIMEOUT = 1.0
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        retry_backoff: float = 0.05,
+        outlier_failures: int = 5,
+        outlier_latency_factor: float = 10.0,
+        outlier_ejection_time: float = 10.0,
+        circuit_breaker_failures: int = 10,
+        circuit_breaker_reset_time: float = 5.0,
+    ):
+        self.max_attempts = max(max_attempts, 1)
+        self.retry_backoff = retry_backoff
+        self.outlier_failures = outlier_failures
+        self.outlier_latency_factor = outlier_latency_factor
+        self.outlier_ejection_time = outlier_ejection_time
+        self.circuit_breaker_failures = circuit_breaker_failures
+        self.circuit_breaker_reset_time = circuit_breaker_reset_time
+
+    @classmethod
+    def from_args(cls, args) -> 'HealthPolicy':
+        """
+        Create a health policy from the retry, outlier and circuit breaker options
+
+        :param args: the parsed CLI arguments
+        :return: the health policy
+        """
+        default = cls()
+        return cls(
+            **{
+                name: getattr(args, name, getattr(default, name))
+                for name in (
+                    'max_attempts',
+                    'retry_backoff',
+                    'outlier_failures',
+                    'outlier_latency_factor',
+                    'outlier_ejection_time',
+                    'circuit_breaker_failures',
+                    'circuit_breaker_reset_time',
+                )
+            }
+        )
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Returns the delay before a retry
+
+        :param attempt: the index of the failed attempt, starting at 0
+        :return: a random delay in seconds between 0 and the exponential backoff of the attempt
+        """
+        return random.uniform(
+            0, min(self.MAX_BACKOFF, self.retry_backoff * 2 ** attempt)
+        )
+
+
+class HedgePolicy:
+    """
+    Settings of the hedged requests. A request to a hedged endpoint that got no response after a percentile of the
+    latencies of its deployment is duplicated to another replica, the first response is taken and the other call is
+    cancelled
+
+    :param endpoints: the endpoints whose requests are hedged, they must be idempotent
+    :param percentile: the latency percentile in [0, 100] after which a request is duplicated
+    :param budget: the maximum ratio of duplicated requests to the requests of the hedged endpoints
+    """
+
+    MIN_SAMPLES = 20
+    WINDOW_SIZE = 1000
+    UPDATE_INTERVAL = 50
+
+    def __init__(
+        self, endpoints: Iterable[str], percentile: float = 95.0, budget: float = 0.05
+    ):
+        self.endpoints = set(endpoints)
+        self.percentile = percentile
+        self.budget = budget
+
+    @classmethod
+    def from_args(cls, args) -> Optional['HedgePolicy']:
+        """
+        Create a hedge policy from the `--hedge-*` options
+
+        :param args: the parsed CLI arguments
+        :return: the hedge policy or None if no endpoint is hedged
+        """
+        endpoints = getattr(args, 'hedge_endpoints', None)
+        if not endpoints:
+            return None
+        return cls(
+            endpoints,
+            percentile=getattr(args, 'hedge_percentile', 95.0),
+            budget=getattr(args, 'hedge_budget', 0.05),
+        )
+
+
+class _Hedger:
+    """
+    Tracks the recent latencies of a deployment and the budget of its hedged requests
+
+    :param policy: the hedging settings
+    """
+
+    def __init__(self, policy: HedgePolicy):
+        self.policy = policy
+        self._latencies = deque(maxlen=policy.WINDOW_SIZE)
+        self._num_observed = 0
+        self.delay = None
+        self.num_requests = 0
+        self.num_hedged = 0
+        self.num_hedge_wins = 0
+        self.num_over_budget = 0
+
+    def observe(self, latency: float):
+        """
+        Records the latency of a successful call and updates the hedging delay from time to time
+
+        :param latency: the latency of the call in seconds
+        """
+        self._latencies.append(latency)
+        self._num_observed += 1
+        if len(self._latencies) >= self.policy.MIN_SAMPLES and (
+            self.delay is None or self._num_observed % self.policy.UPDATE_INTERVAL == 0
+        ):
+            latencies = sorted(self._latencies)
+            idx = int(len(latencies) * self.policy.percentile / 100)
+            self.delay = latencies[min(idx, len(latencies) - 1)]
+
+    def get_delay(self, endpoint: Optional[str]) -> Optional[float]:
+        """
+        Returns the time after which a request is duplicated
+
+        :param endpoint: the endpoint of the request
+        :return: the delay in seconds or None if the request is not hedged
+        """
+        if endpoint not in self.policy.endpoints or self.delay is None:
+            return None
+        self.num_requests += 1
+        return self.delay
+
+    def acquire(self) -> bool:
+        """
+        Takes one duplicated request from the budget
+
+        :return: False if the budget is exhausted
+        """
+        if self.num_hedged + 1 > self.policy.budget * self.num_requests:
+            self.num_over_budget += 1
+            return False
+        self.num_hedged += 1
+        return True
+
+    def get_stats(self) -> Dict:
+        """
+        Returns the hedging statistics
+
+        :return: dict with the current delay, the hedgeable requests, the duplicated requests, how often the
+            duplicate answered first and how often the budget prevented a duplicate
+        """
+        return {
+            'delay': self.delay,
+            'num_requests': self.num_requests,
+            'num_hedged': self.num_hedged,
+            'num_hedge_wins': self.num_hedge_wins,
+            'num_over_budget': self.num_over_budget,
+        }
+
+
+class _CircuitBreaker:
+    """
+    Fails the requests to a deployment fast after consecutive failed requests. Once the circuit is open, one trial
+    request is let through every `reset_time` seconds, the circuit closes again when a trial request succeeds
+
+    :param failure_threshold: the number of consecutive failed requests opening the circuit, 0 disables it
+    :param reset_time: the seconds the circuit stays open before a trial request is let through
+    """
+
+    def __init__(self, failure_threshold: int, reset_time: float):
+        self.failure_threshold = failure_threshold
+        self.reset_time = reset_time
+        self.consecutive_failures = 0
+        self.open_until = None
+        self.num_opened = 0
+
+    def allow_request(self) -> bool:
+        """
+        Checks if a request may be sent
+
+        :return: False if the circuit is open
+        """
+        if self.open_until is None:
+            return True
+        now = time.monotonic()
+        if now < self.open_until:
+            return False
+        # half-open, let this request through as a trial and keep the others out
+        self.open_until = now + self.reset_time
+        return True
+
+    def record_success(self):
+        """
+        Closes the circuit after a successful request
+        """
+        self.consecutive_failures = 0
+        self.open_until = None
+
+    def record_failure(self):
+        """
+        Counts a failed request and opens the circuit when the threshold is reached
+        """
+        self.consecutive_failures += 1
+        if not self.failure_threshold:
+            return
+        if self.open_until is not None or (
+            self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.open_until is None:
+                self.num_opened += 1
+            self.open_until = time.monotonic() + self.reset_time
+
+    def get_stats(self) -> Dict:
+        """
+        Returns the state of the circuit
+
+        :return: dict with the consecutive failures, whether the circuit is open and how often it opened
+        """
+        return {
+            'consecutive_failures': self.consecutive_failures,
+            'open': self.open_until is not None,
+            'num_opened': self.num_opened,
+        }
+
+
+class _RequestStream:
+    """
+    A long-lived bidirectional stream to a replica, the single DataRequests are pipelined over it and their responses,
+    which can come back in any order, are correlated by request id
+
+    :param stub: the stub of the `JinaRPC` service of the replica
+    :param window: the maximum number of requests in flight on the stream
+    """
+
+    def __init__(self, stub: jina_pb2_grpc.JinaRPCStub, window: int):
+        self._call = stub.Call()
+        self._window = asyncio.Semaphore(window)
+        self._write_lock = asyncio.Lock()
+        self._pending: Dict[str, asyncio.Future] = {}
+        # only the status of the stream is kept, an exception raised from here would keep the stream alive through its traceback
+        self._status: Optional[Tuple[grpc.StatusCode, str]] = None
+        self._reader = asyncio.create_task(self._read_responses())
+
+    @property
+    def closed(self) -> bool:
+        """
+        Checks if the stream ended, a closed stream does not take requests anymore
+
+        :return: True if the stream ended
+        """
+        return self._status is not None
+
+    def is_pending(self, request_id: str) -> bool:
+        """
+        Checks if a request is in flight on the stream
+
+        :param request_id: the id of the request
+        :return: True if the stream waits for the response to a request with this id
+        """
+        return request_id in self._pending
+
+    async def send(self, request: DataRequest, request_id: str) -> DataRequest:
+        """
+        Sends a request over the stream and waits for its response, the window bounds the requests in flight
+
+        :param request: the request to send, possibly compressed
+        :param request_id: the id of the request, read before the request was compressed
+        :return: the response to the request
+        """
+        async with self._window:
+            if self._status is not None:
+                raise self._get_error()
+            self._pending[request_id] = asyncio.get_running_loop().create_future()
+            try:
+                try:
+                    async with self._write_lock:
+                        await self._call.write(request)
+                except Exception:
+                    # the requests in flight fail with the stream, they are retried on a new stream
+                    self._call.cancel()
+                return await self._pending[request_id]
+            finally:
+                self._pending.pop(request_id, None)
+
+    def _get_error(self) -> AioRpcError:
+        code, details = self._status
+        return AioRpcError(code, grpc.aio.Metadata(), grpc.aio.Metadata(), details)
+
+    async def _read_responses(self):
+        status = (grpc.StatusCode.UNAVAILABLE, 'the stream to the replica was closed')
+        try:
+            while True:
+                response = await self._call.read()
+                if response is grpc.aio.EOF:
+                    break
+                future = self._pending.get(response.header.request_id)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except AioRpcError as e:
+            if e.code() != grpc.StatusCode.CANCELLED:
+                status = (e.code(), e.details())
+        except asyncio.CancelledError:
+            # reading from a cancelled call, the stream was closed
+            pass
+        finally:
+            self._status = status
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(self._get_error())
+
+    async def close(self):
+        """
+        Closes the stream, the requests in flight fail as if the replica was unavailable
+        """
+        self._call.cancel()
+        # the reader ends with the call, grpc must not be left with an outstanding read
+        await self._reader
+
+
+class _ReplicaChannel:
+    """
+    Holds one grpc channel to a replica and its stubs, every channel is a separate HTTP/2 connection
+
+    :param single_data_stub: stub to send a single DataRequest
+    :param data_stub: stub to send a list of DataRequests
+    :param control_stub: stub to send ControlRequests
+    :param channel: the async grpc channel used by the stubs
+    :param stream_window: the maximum number of single DataRequests in flight on the bidirectional stream of the
+        channel, 0 sends every request in its own unary call
+    """
+
+    def __init__(
+        self, single_data_stub, data_stub, control_stub, channel, stream_window: int = 0
+    ):
+        self.single_data_stub = single_data_stub
+        self.data_stub = data_stub
+        self.control_stub = control_stub
+        self.channel = channel
+        self.stream_stub = jina_pb2_grpc.JinaRPCStub(channel)
+        self.stream_window = stream_window
+        self.in_flight = 0
+        self._stream: Optional[_RequestStream] = None
+
+    def get_stream(self) -> _RequestStream:
+        """
+        Returns the bidirectional stream of the channel, a new stream is opened if the last one ended
+
+        :return: the stream to pipeline single DataRequests over
+        """
+        if self._stream is None or self._stream.closed:
+            self._stream = _RequestStream(self.stream_stub, self.stream_window)
+        return self._stream
+
+    async def disable_stream(self):
+        """
+        Closes the bidirectional stream, the requests are sent in unary calls from now on
+        """
+        self.stream_window = 0
+        if self._stream is not None:
+            stream, self._stream = self._stream, None
+            await stream.close()
+
+
+class _ReplicaConnection:
+    """
+    Holds the grpc channels of a single replica together with the load statistics used for balancing
+
+    :param address: the address of the replica
+    :param channels: the channels to the replica, the requests are spread over them
+    :param compressor: compresses single DataRequests sent to this replica, None disables compression
+    """
+
+    EWMA_ALPHA = 0.3
+
+    def __init__(
+        self,
+        address: str,
+        channels: List[_ReplicaChannel],
+        compressor: Optional[DataRequestCompressor] = None,
+    ):
+        self.address = address
+        self.channels = channels
+        self.compressor = compressor
+        self._ready = False
+        self._channel_counter = 0
+        self.in_flight = 0
+        self.num_requests = 0
+        self.ewma_latency = 0.0
+        self.latency_samples = 0
+        self.consecutive_failures = 0
+        self.num_failures = 0
+        self.num_ejections = 0
+        # monotonic time at which an ejected replica is probed, None while the replica receives requests
+        self.ejected_until = None
+        self.probing = False
+
+    @property
+    def control_stub(self):
+        """
+        The stub used to send ControlRequests, these are rare and always go through the first channel
+
+        :return: the control stub of the first channel
+        """
+        return self.channels[0].control_stub
+
+    def get_channel(self) -> _ReplicaChannel:
+        """
+        Returns the channel with the fewest in-flight requests, ties are broken in round robin order
+
+        :return: the channel to send the next request through
+        """
+        num_channels = len(self.channels)
+        if num_channels == 1:
+            return self.channels[0]
+        start = self._channel_counter
+        self._channel_counter = (start + 1) % num_channels
+        return min(
+            (self.channels[(start + i) % num_channels] for i in range(num_channels)),
+            key=lambda c: c.in_flight,
+        )
+
+    def connect(self):
+        """
+        Starts connecting all the channels without waiting for the first request
+        """
+        for channel in self.channels:
+            channel.channel.get_state(try_to_connect=True)
+
+    def is_ready(self) -> bool:
+        """
+        Checks if one of the channels is connected, a replica stays ready once it was connected
+
+        :return: True if the replica can take requests without waiting for a connection
+        """
+        if not self._ready:
+            self._ready = any(
+                channel.channel.get_state() == grpc.ChannelConnectivity.READY
+                for channel in self.channels
+            )
+        return self._ready
+
+    async def close(self):
+        """
+        Closes all the channels to the replica
+        """
+        for channel in self.channels:
+            await channel.disable_stream()
+            # we should handle graceful termination better, 0.5 is a rather random number here
+            await channel.channel.close(0.5)
+
+    def request_started(self):
+        """
+        Marks the start of a request sent to this replica
+        """
+        self.in_flight += 1
+        self.num_requests += 1
+
+    def request_finished(self, latency: float):
+        """
+        Marks the end of a request sent to this replica and updates the latency EWMA
+
+        :param latency: the latency of the request in seconds
+        """
+        self.in_flight -= 1
+        self.latency_samples += 1
+        if self.ewma_latency:
+            self.ewma_latency += self.EWMA_ALPHA * (latency - self.ewma_latency)
+        else:
+            self.ewma_latency = latency
+
+    def record_success(self):
+        """
+        Marks a request sent to this replica as successful
+        """
+        self.consecutive_failures = 0
+
+    def record_failure(self):
+        """
+        Marks a request sent to this replica as failed, because the replica was unavailable or timed out
+        """
+        self.consecutive_failures += 1
+        self.num_failures += 1
+
+    @property
+    def ejected(self) -> bool:
+        """
+        Checks if the replica is ejected from the load balancing
+
+        :return: True if the replica does not receive requests
+        """
+        return self.ejected_until is not None
+
+    def eject(self, duration: float):
+        """
+        Ejects the replica from the load balancing
+
+        :param duration: the seconds before the replica is probed
+        """
+        self.ejected_until = time.monotonic() + duration
+        self.num_ejections += 1
+
+    def readmit(self):
+        """
+        Readmits an ejected replica with fresh health statistics
+        """
+        self.ejected_until = None
+        self.consecutive_failures = 0
+        self.ewma_latency = 0.0
+        self.latency_samples = 0
+
+    @property
+    def cost(self) -> float:
+        """
+        The expected cost of sending one more request to this replica
+
+        :return: the latency EWMA weighted by the number of in-flight requests
+        """
+        return self.ewma_latency * (self.in_flight + 1)
+
+    def get_stats(self) -> Dict:
+        """
+        Returns the load statistics of this replica
+
+        :return: dict with the in-flight requests, the total requests, the latency EWMA, the failures, the ejections
+            and the compression statistics
+        """
+        stats = {
+            'in_flight': self.in_flight,
+            'num_requests': self.num_requests,
+            'ewma_latency': self.ewma_latency,
+            'consecutive_failures': self.consecutive_failures,
+            'num_failures': self.num_failures,
+            'num_ejections': self.num_ejections,
+            'ejected': self.ejected,
+            'ready': self._ready,
+            'channels_in_flight': [channel.in_flight for channel in self.channels],
+        }
+        if self.compressor:
+            stats['compression'] = self.compressor.get_stats()
+        return stats
+
+
 class ReplicaList:
     """
-    Maintains a list of connections to replicas and uses round robin for selecting a replica
+    Maintains a list of connections to replicas and selects a replica according to a load balancing strategy
+
+    Replicas failing consecutively or being much slower than their peers are ejected from the load balancing, at most
+    half of the replicas at a time. An ejected replica is readmitted once it answers a STATUS request.
+
+    The channels to a new replica connect eagerly, the replica only receives requests once one of its channels is
+    connected, unless no replica is connected yet.
+
+    :param load_balancing: the strategy used to select a replica
+    :param compressor: the compression settings for requests sent to the replicas, None disables compression
+    :param health_policy: the retry, outlier ejection and circuit breaking settings
+    :param circuit_breaker: the circuit breaker of the deployment the replicas belong to
+    :param hedger: the hedging state of the deployment the replicas belong to, None disables hedging
+    :param channels_per_replica: the number of grpc channels opened to every replica
+    :param stream_window: the maximum number of single DataRequests in flight on the bidirectional stream of every
+        channel, 0 sends every request in its own unary call
+    :param uds_dir: the private directory of the Unix domain sockets of the runtimes of the Flow, None always uses TCP
     """
 
-    def __init__(self):
-        self._connections = []
+    def __init__(
+        self,
+        load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+        compressor: Optional[DataRequestCompressor] = None,
+        health_policy: Optional[HealthPolicy] = None,
+        circuit_breaker: Optional[_CircuitBreaker] = None,
+        hedger: Optional[_Hedger] = None,
+        channels_per_replica: int = 1,
+        stream_window: int = 0,
+        uds_dir: Optional[str] = None,
+    ):
+        self._connections: List[_ReplicaConnection] = []
         self._address_to_connection_idx = {}
-        self._address_to_channel = {}
+        self._channels_per_replica = max(1, channels_per_replica)
+        self._stream_window = max(0, stream_window)
+        self._uds_dir = uds_dir
         self._rr_counter = 0
+        self._load_balancing = load_balancing
+        self._compressor = compressor
+        self.health_policy = health_policy or HealthPolicy()
+        self.circuit_breaker = circuit_breaker or _CircuitBreaker(
+            self.health_policy.circuit_breaker_failures,
+            self.health_policy.circuit_breaker_reset_time,
+        )
+        self.hedger = hedger
+        self._num_ejected = 0
+        # the number of replicas whose channels are not connected yet
+        self._num_warming = 0
 
     def add_connection(self, address: str):
         """
@@ -45,15 +656,35 @@ class ReplicaList:
                 use_https = False
 
             self._address_to_connection_idx[address] = len(self._connections)
-            (
-                single_data_stub,
-                data_stub,
-                control_stub,
-                channel,
-            ) = GrpcConnectionPool.create_async_channel_stub(address, https=use_https)
-            self._address_to_channel[address] = channel
-
-            self._connections.append((single_data_stub, data_stub, control_stub))
+            # a replica on this host is reached through its Unix domain socket
+            target = (
+                address
+                if use_https
+                else GrpcConnectionPool.get_local_address(address, self._uds_dir)
+            )
+            options = None
+            if self._channels_per_replica > 1:
+                # channels with the same target share their connection unless the subchannel pool is local
+                options = GrpcConnectionPool.get_default_grpc_options() + [
+                    ('grpc.use_local_subchannel_pool', 1)
+                ]
+            channels = [
+                _ReplicaChannel(
+                    *GrpcConnectionPool.create_async_channel_stub(
+                        target, https=use_https, options=options
+                    ),
+                    stream_window=self._stream_window,
+                )
+                for _ in range(self._channels_per_replica)
+            ]
+            connection = _ReplicaConnection(
+                address,
+                channels,
+                self._compressor.clone() if self._compressor else None,
+            )
+            connection.connect()
+            self._num_warming += 1
+            self._connections.append(connection)
 
     async def remove_connection(self, address: str):
         """
@@ -70,9 +701,11 @@ class ReplicaList:
             idx_to_delete = self._address_to_connection_idx.pop(address)
 
             popped_connection = self._connections.pop(idx_to_delete)
-            # we should handle graceful termination better, 0.5 is a rather random number here
-            await self._address_to_channel[address].close(0.5)
-            del self._address_to_channel[address]
+            if popped_connection.ejected:
+                self._num_ejected -= 1
+            if not popped_connection.is_ready():
+                self._num_warming -= 1
+            await popped_connection.close()
             # update the address/idx mapping
             for address in self._address_to_connection_idx:
                 if self._address_to_connection_idx[address] > idx_to_delete:
@@ -82,11 +715,44 @@ class ReplicaList:
 
         return None
 
-    def get_next_connection(self):
+    def get_next_connection(
+        self, exclude: Optional[List[_ReplicaConnection]] = None
+    ) -> _ReplicaConnection:
         """
-        Returns a connection from the list. Strategy is round robin
+        Returns a connection from the list. Strategy is defined by the load balancing type of this list
+        :param exclude: connections that should not be selected if another one is available, like the ones already tried
         :returns: A connection from the pool
         """
+        candidates = self._get_candidates(exclude)
+        if self._load_balancing == LoadBalancingType.LEAST_OUTSTANDING:
+            return self._get_least_outstanding_connection(candidates)
+        elif self._load_balancing == LoadBalancingType.EWMA and len(candidates) > 1:
+            return self._get_power_of_two_connection(candidates)
+        return self._get_round_robin_connection(candidates)
+
+    def _get_candidates(
+        self, exclude: Optional[List[_ReplicaConnection]]
+    ) -> List[_ReplicaConnection]:
+        if not self._num_ejected and not self._num_warming and not exclude:
+            return self._connections
+        self._probe_ejected_connections()
+        healthy = [c for c in self._connections if not c.ejected]
+        candidates = [c for c in healthy if c not in exclude] if exclude else healthy
+        # rather send to a replica that failed before than not sending at all
+        candidates = candidates or healthy or self._connections
+        if self._num_warming:
+            self._num_warming = sum(not c.is_ready() for c in self._connections)
+            # rather wait for a connection than not sending at all
+            candidates = [c for c in candidates if c.is_ready()] or candidates
+        return candidates
+
+    def _get_round_robin_connection(
+        self, candidates: List[_ReplicaConnection]
+    ) -> _ReplicaConnection:
+        if candidates is not self._connections:
+            connection = candidates[self._rr_counter % len(candidates)]
+            self._rr_counter = (self._rr_counter + 1) % len(self._connections)
+            return connection
         try:
             connection = self._connections[self._rr_counter]
         except IndexError:
@@ -96,6 +762,109 @@ class ReplicaList:
         self._rr_counter = (self._rr_counter + 1) % len(self._connections)
         return connection
 
+    def _get_least_outstanding_connection(
+        self, candidates: List[_ReplicaConnection]
+    ) -> _ReplicaConnection:
+        # start scanning at the round robin position, so ties are spread over all replicas
+        num_connections = len(candidates)
+        start = self._rr_counter % num_connections
+        connection = min(
+            (candidates[(start + i) % num_connections] for i in range(num_connections)),
+            key=lambda c: c.in_flight,
+        )
+        self._rr_counter = (start + 1) % num_connections
+        return connection
+
+    def _get_power_of_two_connection(
+        self, candidates: List[_ReplicaConnection]
+    ) -> _ReplicaConnection:
+        first, second = random.sample(candidates, 2)
+        return first if first.cost <= second.cost else second
+
+    def report_success(self, connection: _ReplicaConnection):
+        """
+        Records a successful request and ejects the replica if its latency is far above the one of its peers
+
+        :param connection: the connection the request was sent to
+        """
+        connection.record_success()
+        policy = self.health_policy
+        if (
+            policy.outlier_latency_factor
+            and connection.latency_samples >= policy.MIN_LATENCY_SAMPLES
+        ):
+            peer_latencies = [
+                c.ewma_latency
+                for c in self._connections
+                if c is not connection
+                and not c.ejected
+                and c.latency_samples >= policy.MIN_LATENCY_SAMPLES
+            ]
+            if (
+                peer_latencies
+                and connection.ewma_latency
+                > policy.outlier_latency_factor * statistics.median(peer_latencies)
+            ):
+                self._eject(connection)
+
+    def report_failure(self, connection: _ReplicaConnection):
+        """
+        Records a failed request and ejects the replica after too many consecutive failures
+
+        :param connection: the connection the request was sent to
+        """
+        connection.record_failure()
+        policy = self.health_policy
+        if (
+            policy.outlier_failures
+            and connection.consecutive_failures >= policy.outlier_failures
+        ):
+            self._eject(connection)
+
+    def _eject(self, connection: _ReplicaConnection):
+        # never eject more than half of the replicas, the others could not take the whole load
+        if connection.ejected or self._num_ejected + 1 > len(self._connections) // 2:
+            return
+        connection.eject(self.health_policy.outlier_ejection_time)
+        self._num_ejected += 1
+
+    def _probe_ejected_connections(self):
+        now = time.monotonic()
+        for connection in self._connections:
+            if (
+                connection.ejected
+                and not connection.probing
+                and connection.ejected_until <= now
+            ):
+                connection.probing = True
+                asyncio.create_task(self._probe(connection))
+
+    async def _probe(self, connection: _ReplicaConnection):
+        try:
+            await connection.control_stub.process_control(
+                ControlRequest(command='STATUS'),
+                timeout=self.health_policy.PROBE_TIMEOUT,
+            )
+        except AioRpcError:
+            connection.eject(self.health_policy.outlier_ejection_time)
+            return
+        finally:
+            connection.probing = False
+        if connection in self._connections and connection.ejected:
+            connection.readmit()
+            self._num_ejected -= 1
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Returns the load statistics of all connections
+
+        :returns: dict mapping the address of every replica to its statistics
+        """
+        return {
+            connection.address: connection.get_stats()
+            for connection in self._connections
+        }
+
     def get_all_connections(self):
         """
         Returns all available connections
@@ -122,12 +891,13 @@ class ReplicaList:
         """
         Close all connections and clean up internal state
         """
-        for address in self._address_to_channel:
-            await self._address_to_channel[address].close(0.5)
-        self._address_to_channel.clear()
+        for connection in self._connections:
+            await connection.close()
         self._address_to_connection_idx.clear()
         self._connections.clear()
         self._rr_counter = 0
+        self._num_ejected = 0
+        self._num_warming = 0
 
 
 class GrpcConnectionPool:
@@ -135,13 +905,41 @@ class GrpcConnectionPool:
     Manages a list of grpc connections.
 
     :param logger: the logger to use
+    :param load_balancing: the strategy used to select a replica of a deployment
+    :param compressor: the compression settings for DataRequests, None disables compression
+    :param health_policy: the retry, outlier ejection and circuit breaking settings, None uses the defaults
+    :param hedge_policy: the hedging settings, None disables hedging
+    :param channels_per_replica: the number of grpc channels opened to every replica
+    :param stream_window: the maximum number of single DataRequests in flight on the bidirectional stream of every
+        channel, 0 sends every request in its own unary call
+    :param uds_dir: the private directory of the Unix domain sockets of the runtimes of the Flow, None always uses TCP
     """
 
     class _ConnectionPoolMap:
-        def __init__(self, logger: Optional[JinaLogger]):
+        def __init__(
+            self,
+            logger: Optional[JinaLogger],
+            load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+            compressor: Optional[DataRequestCompressor] = None,
+            health_policy: Optional[HealthPolicy] = None,
+            hedge_policy: Optional[HedgePolicy] = None,
+            channels_per_replica: int = 1,
+            stream_window: int = 0,
+            uds_dir: Optional[str] = None,
+        ):
             self._logger = logger
+            self._load_balancing = load_balancing
+            self._compressor = compressor
+            self._health_policy = health_policy or HealthPolicy()
             # this maps deployments to shards or heads
             self._deployments: Dict[str, Dict[str, Dict[int, ReplicaList]]] = {}
+            # all the replica lists of a deployment share its circuit breaker
+            self._circuit_breakers: Dict[str, _CircuitBreaker] = {}
+            self._hedge_policy = hedge_policy
+            self._hedgers: Dict[str, _Hedger] = {}
+            self._channels_per_replica = channels_per_replica
+            self._stream_window = stream_window
+            self._uds_dir = uds_dir
             # dict stores last entity id used for a particular deployment, used for round robin
             self._access_count: Dict[str, int] = {}
 
@@ -180,6 +978,23 @@ class GrpcConnectionPool:
                     )
             return replicas
 
+        def get_stats(self) -> Dict[str, Dict[str, Dict[int, Dict]]]:
+            stats = {}
+            for deployment in self._deployments:
+                stats[deployment] = {
+                    'circuit_breaker': self._circuit_breakers[deployment].get_stats()
+                }
+                if deployment in self._hedgers:
+                    stats[deployment]['hedging'] = self._hedgers[deployment].get_stats()
+                for entity_type in self._deployments[deployment]:
+                    stats[deployment][entity_type] = {
+                        entity_id: replica_list.get_stats()
+                        for entity_id, replica_list in self._deployments[deployment][
+                            entity_type
+                        ].items()
+                    }
+            return stats
+
         async def close(self):
             # Close all connections to all replicas
             for deployment in self._deployments:
@@ -189,6 +1004,8 @@ class GrpcConnectionPool:
                             shard_in
                         ].close()
             self._deployments.clear()
+            self._circuit_breakers.clear()
+            self._hedgers.clear()
 
         def _get_connection_list(
             self, deployment: str, type: str, entity_id: Optional[int] = None
@@ -221,6 +1038,12 @@ class GrpcConnectionPool:
             if deployment not in self._deployments:
                 self._deployments[deployment] = {'shards': {}, 'heads': {}}
                 self._access_count[deployment] = 0
+                self._circuit_breakers[deployment] = _CircuitBreaker(
+                    self._health_policy.circuit_breaker_failures,
+                    self._health_policy.circuit_breaker_reset_time,
+                )
+                if self._hedge_policy:
+                    self._hedgers[deployment] = _Hedger(self._hedge_policy)
 
         def _add_connection(
             self,
@@ -231,7 +1054,16 @@ class GrpcConnectionPool:
         ):
             self._add_deployment(deployment)
             if entity_id not in self._deployments[deployment][type]:
-                connection_list = ReplicaList()
+                connection_list = ReplicaList(
+                    self._load_balancing,
+                    self._compressor,
+                    self._health_policy,
+                    self._circuit_breakers[deployment],
+                    self._hedgers.get(deployment),
+                    self._channels_per_replica,
+                    self._stream_window,
+                    self._uds_dir,
+                )
                 self._deployments[deployment][type][entity_id] = connection_list
 
             if not self._deployments[deployment][type][entity_id].has_connection(
@@ -272,9 +1104,28 @@ class GrpcConnectionPool:
                 return connection
             return None
 
-    def __init__(self, logger: Optional[JinaLogger] = None):
+    def __init__(
+        self,
+        logger: Optional[JinaLogger] = None,
+        load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+        compressor: Optional[DataRequestCompressor] = None,
+        health_policy: Optional[HealthPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        channels_per_replica: int = 1,
+        stream_window: int = 0,
+        uds_dir: Optional[str] = None,
+    ):
         self._logger = logger or JinaLogger(self.__class__.__name__)
-        self._connections = self._ConnectionPoolMap(self._logger)
+        self._connections = self._ConnectionPoolMap(
+            self._logger,
+            load_balancing,
+            compressor,
+            health_policy,
+            hedge_policy,
+            channels_per_replica,
+            stream_window,
+            uds_dir,
+        )
 
     def send_request(
         self,
@@ -323,20 +1174,18 @@ class GrpcConnectionPool:
         :return: list of asyncio.Task items for each send call
         """
         results = []
-        connections = []
+        connection_lists = []
         if polling_type == PollingType.ANY:
             connection_list = self._connections.get_replicas(deployment, head, shard_id)
             if connection_list:
-                connections.append(connection_list.get_next_connection())
+                connection_lists.append(connection_list)
         elif polling_type == PollingType.ALL:
             connection_lists = self._connections.get_replicas_all_shards(deployment)
-            for connection_list in connection_lists:
-                connections.append(connection_list.get_next_connection())
         else:
             raise ValueError(f'Unsupported polling type {polling_type}')
 
-        for connection in connections:
-            task = self._send_requests(requests, connection, endpoint)
+        for connection_list in connection_lists:
+            task = self._send_requests(requests, connection_list, endpoint)
             results.append(task)
 
         return results
@@ -378,8 +1227,7 @@ class GrpcConnectionPool:
         """
         replicas = self._connections.get_replicas(deployment, head, shard_id)
         if replicas:
-            connection = replicas.get_next_connection()
-            return self._send_requests(requests, connection, endpoint)
+            return self._send_requests(requests, replicas, endpoint)
         else:
             self._logger.debug(
                 f'No available connections for deployment {deployment} and shard {shard_id}'
@@ -431,6 +1279,14 @@ class GrpcConnectionPool:
                 shard_id = 0
             return await self._connections.remove_replica(deployment, address, shard_id)
 
+    def get_connection_stats(self) -> Dict[str, Dict[str, Dict[int, Dict]]]:
+        """
+        Returns the load statistics of all connections managed by this pool, like the number of in-flight requests
+
+        :return: nested dict of deployment -> `heads`/`shards` -> entity id -> address -> statistics
+        """
+        return self._connections.get_stats()
+
     def start(self):
         """
         Starts the connection pool
@@ -444,55 +1300,250 @@ class GrpcConnectionPool:
         await self._connections.close()
 
     def _send_requests(
-        self, requests: List[Request], connection, endpoint: Optional[str] = None
+        self,
+        requests: List[Request],
+        replicas: ReplicaList,
+        endpoint: Optional[str] = None,
     ) -> asyncio.Task:
         # this wraps the awaitable object from grpc as a coroutine so it can be used as a task
         # the grpc call function is not a coroutine but some _AioCall
-        async def task_wrapper(requests, stubs, endpoint):
+        async def task_wrapper(requests, replicas, endpoint):
             metadata = (('endpoint', endpoint),) if endpoint else None
-            for i in range(3):
-                try:
-                    request_type = type(requests[0])
-                    if request_type == DataRequest and len(requests) == 1:
+            if not replicas.circuit_breaker.allow_request():
+                raise AioRpcError(
+                    grpc.StatusCode.UNAVAILABLE,
+                    grpc.aio.Metadata(),
+                    grpc.aio.Metadata(),
+                    details='the circuit breaker is open after too many consecutive failures',
+                )
+            # the connections tried by the request and its hedge, so every attempt goes to another replica
+            tried_connections = []
+            hedge_delay = None
+            if (
+                replicas.hedger
+                and type(requests[0]) == DataRequest
+                and len(replicas.get_all_connections()) > 1
+            ):
+                # the head does not pass the endpoint, the workers read it from the header
+                hedge_delay = replicas.hedger.get_delay(
+                    endpoint or requests[0].header.exec_endpoint
+                )
+            if hedge_delay is None:
+                return await self._send_with_retries(
+                    requests, replicas, metadata, tried_connections
+                )
+            return await self._send_hedged(
+                requests, replicas, metadata, tried_connections, hedge_delay
+            )
 
-                        call_result = stubs[0].process_single_data(
-                            requests[0], metadata=metadata
-                        )
-                        metadata, response = (
-                            await call_result.trailing_metadata(),
-                            await call_result,
-                        )
-                        return response, metadata
-                    if request_type == DataRequest and len(requests) > 1:
-                        call_result = stubs[1].process_data(requests, metadata=metadata)
-                        metadata, response = (
-                            await call_result.trailing_metadata(),
-                            await call_result,
-                        )
-                        return response, metadata
-                    elif request_type == ControlRequest:
-                        call_result = stubs[2].process_control(requests[0])
-                        metadata, response = (
-                            await call_result.trailing_metadata(),
-                            await call_result,
-                        )
-                        return response, metadata
-                    else:
-                        raise ValueError(
-                            f'Unsupported request type {type(requests[0])}'
-                        )
+        return asyncio.create_task(task_wrapper(requests, replicas, endpoint))
+
+    async def _send_hedged(
+        self,
+        requests: List[Request],
+        replicas: ReplicaList,
+        metadata,
+        tried_connections: List[_ReplicaConnection],
+        delay: float,
+    ):
+        first = asyncio.create_task(
+            self._send_with_retries(requests, replicas, metadata, tried_connections)
+        )
+        hedge = None
+        try:
+            done, _ = await asyncio.wait((first,), timeout=delay)
+            if done or not replicas.hedger.acquire():
+                return await first
+            # the first replica is slow, send a duplicate to another one and take the first response
+            hedge = asyncio.create_task(
+                self._send_with_retries(requests, replicas, metadata, tried_connections)
+            )
+            pending = {first, hedge}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            replicas.hedger.num_hedge_wins += 1
+                        return task.result()
+            # both failed, raise the error of the first request
+            return first.result()
+        finally:
+            first.cancel()
+            if hedge is not None:
+                hedge.cancel()
+
+    async def _send_with_retries(
+        self,
+        requests: List[Request],
+        replicas: ReplicaList,
+        metadata,
+        tried_connections: List[_ReplicaConnection],
+    ):
+        request_type = type(requests[0])
+        policy = replicas.health_policy
+        circuit_breaker = replicas.circuit_breaker
+        for i in range(policy.max_attempts):
+            # every retry goes to another replica if there is one
+            connection = replicas.get_next_connection(exclude=tried_connections)
+            tried_connections.append(connection)
+            start = time.perf_counter()
+            try:
+                result = await self._send_requests_to_connection(
+                    requests, connection, metadata
+                )
+                replicas.report_success(connection)
+                circuit_breaker.record_success()
+                if replicas.hedger and request_type == DataRequest:
+                    replicas.hedger.observe(time.perf_counter() - start)
+                return result
+            except AioRpcError as e:
+                if (
+                    e.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+                    and request_type == DataRequest
+                ):
+                    # the deadline is set by the client, a request it gave up on does not make the replica unhealthy
+                    return self._get_timeout_response(requests[0], connection)
+                if e.code() != grpc.StatusCode.UNAVAILABLE:
+                    raise
+                replicas.report_failure(connection)
+                if i == policy.max_attempts - 1:
+                    circuit_breaker.record_failure()
+                    self._logger.debug(f'GRPC call failed, retries exhausted')
+                    raise
+                else:
+                    self._logger.debug(
+                        f'GRPC call to {connection.address} failed with StatusCode.UNAVAILABLE, retry attempt {i+1}/{policy.max_attempts - 1}'
+                    )
+                    backoff = policy.get_backoff(i)
+                    if request_type == DataRequest:
+                        # no retry is sent after the deadline of the request
+                        time_left = requests[0].time_left
+                        if time_left is not None:
+                            backoff = min(backoff, max(0.0, time_left))
+                    await asyncio.sleep(backoff)
+
+    async def _send_requests_to_connection(
+        self, requests: List[Request], connection: _ReplicaConnection, metadata
+    ):
+        request_type = type(requests[0])
+        timeout = None
+        if request_type == DataRequest:
+            # the deadline of the request becomes the deadline of the grpc call
+            timeout = requests[0].time_left
+            if timeout is not None and timeout <= 0:
+                return self._get_timeout_response(requests[0], connection)
+        if request_type == DataRequest and len(requests) == 1:
+            channel = connection.get_channel()
+            request_id = requests[0].header.request_id
+            if channel.stream_window and not channel.get_stream().is_pending(
+                request_id
+            ):
+                try:
+                    return await self._send_streamed_call(
+                        connection, channel, requests[0], request_id, timeout
+                    )
                 except AioRpcError as e:
-                    if e.code() != grpc.StatusCode.UNAVAILABLE:
+                    if e.code() != grpc.StatusCode.UNIMPLEMENTED:
                         raise
-                    elif e.code() == grpc.StatusCode.UNAVAILABLE and i == 2:
-                        self._logger.debug(f'GRPC call failed, retries exhausted')
-                        raise
-                    else:
-                        self._logger.debug(
-                            f'GRPC call failed with StatusCode.UNAVAILABLE, retry attempt {i+1}/3'
-                        )
+                    # the replica does not serve the stream, it gets unary calls from now on
+                    await channel.disable_stream()
+            return await self._send_data_call(
+                connection,
+                channel,
+                channel.single_data_stub.process_single_data,
+                requests[0],
+                metadata,
+                timeout,
+            )
+        if request_type == DataRequest and len(requests) > 1:
+            channel = connection.get_channel()
+            return await self._send_data_call(
+                connection,
+                channel,
+                channel.data_stub.process_data,
+                requests,
+                metadata,
+                timeout,
+            )
+        elif request_type == ControlRequest:
+            call_result = connection.control_stub.process_control(requests[0])
+            metadata, response = (
+                await call_result.trailing_metadata(),
+                await call_result,
+            )
+            return response, metadata
+        else:
+            raise ValueError(f'Unsupported request type {type(requests[0])}')
+
+    @staticmethod
+    async def _send_data_call(
+        connection: _ReplicaConnection,
+        channel: _ReplicaChannel,
+        rpc,
+        request,
+        metadata,
+        timeout: Optional[float] = None,
+    ):
+        if connection.compressor and isinstance(request, DataRequest):
+            request = connection.compressor.compress(request)
+        connection.request_started()
+        channel.in_flight += 1
+        start = time.perf_counter()
+        try:
+            call_result = rpc(request, metadata=metadata, timeout=timeout)
+            metadata, response = (
+                await call_result.trailing_metadata(),
+                await call_result,
+            )
+            return response, metadata
+        finally:
+            channel.in_flight -= 1
+            connection.request_finished(time.perf_counter() - start)
+
+    @staticmethod
+    async def _send_streamed_call(
+        connection: _ReplicaConnection,
+        channel: _ReplicaChannel,
+        request: DataRequest,
+        request_id: str,
+        timeout: Optional[float] = None,
+    ):
+        stream = channel.get_stream()
+        if connection.compressor:
+            request = connection.compressor.compress(request)
+        connection.request_started()
+        channel.in_flight += 1
+        start = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(stream.send(request, request_id), timeout)
+        except asyncio.TimeoutError:
+            raise AioRpcError(
+                grpc.StatusCode.DEADLINE_EXCEEDED,
+                grpc.aio.Metadata(),
+                grpc.aio.Metadata(),
+                details='the deadline of the request passed',
+            )
+        finally:
+            channel.in_flight -= 1
+            connection.request_finished(time.perf_counter() - start)
+        # a stream has no trailing metadata per request, the errors are read from the status of the response
+        if response.header.status.code in (
+            jina_pb2.StatusProto.ERROR,
+            jina_pb2.StatusProto.ERROR_TIMEOUT,
+        ):
+            return response, grpc.aio.Metadata(('is-error', 'true'))
+        return response, grpc.aio.Metadata()
 
-        return asyncio.create_task(task_wrapper(requests, connection, endpoint))
+    @staticmethod
+    def _get_timeout_response(
+        request: DataRequest, connection: _ReplicaConnection
+    ) -> Tuple[DataRequest, grpc.aio.Metadata]:
+        # the request is returned as an error response, so the following hops skip it
+        request.set_timeout_error(connection.address)
+        return request, grpc.aio.Metadata(('is-error', 'true'))
 
     @staticmethod
     def get_grpc_channel(
@@ -533,6 +1584,41 @@ class GrpcConnectionPool:
 
         return insecure_channel(address, options)
 
+    @staticmethod
+    def get_uds_address(port: int, uds_dir: str) -> str:
+        """
+        Returns the address of the Unix domain socket a runtime listening on a port also listens on
+
+        :param port: the port the runtime listens on
+        :param uds_dir: the private directory of the Unix domain sockets of the runtimes of the Flow
+        :return: the grpc address of the socket
+        """
+        return f'unix://{os.path.join(uds_dir, f"{port}.sock")}'
+
+    @staticmethod
+    def get_local_address(address: str, uds_dir: Optional[str] = None) -> str:
+        """
+        Returns the Unix domain socket address of a runtime on this host if it listens on one
+
+        Only the private directory created by the Flow is looked at, it is not writable by other users and never holds
+        the sockets of an earlier Flow.
+
+        :param address: the address of the runtime, format is <host>:<port>
+        :param uds_dir: the private directory of the Unix domain sockets of the runtimes of the Flow
+        :return: the address of the socket or the given address if the runtime can not be reached through a socket
+        """
+        host, _, port = address.rpartition(':')
+        if uds_dir is None or os.name == 'nt' or not port.isdigit():
+            return address
+        try:
+            if not host_is_local(host):
+                return address
+        except ValueError:
+            # host names other than localhost are never local
+            return address
+        uds_address = GrpcConnectionPool.get_uds_address(int(port), uds_dir)
+        return uds_address if os.path.exists(uds_address[len('unix://') :]) else address
+
     @staticmethod
     def activate_worker_sync(
         worker_host: str,
@@ -661,6 +1747,14 @@ class GrpcConnectionPool:
         return [
             ('grpc.max_send_message_length', -1),
             ('grpc.max_receive_message_length', -1),
+            # ping idle connections, so broken ones are detected before a request is sent through them
+            ('grpc.keepalive_time_ms', 9999),
+            ('grpc.keepalive_timeout_ms', 4999),
+            ('grpc.keepalive_permit_without_calls', 1),
+            ('grpc.http2.max_pings_without_data', 0),
+            # the servers accept the pings of the clients above
+            ('grpc.http2.min_time_between_pings_ms', 9999),
+            ('grpc.http2.min_ping_interval_without_data_ms', 4999),
         ]
 
     @staticmethod
@@ -701,6 +1795,7 @@ class GrpcConnectionPool:
         address,
         https=False,
         root_certificates: Optional[str] = None,
+        options: Optional[list] = None,
     ) -> Tuple[
         jina_pb2_grpc.JinaSingleDataRequestRPCStub,
         jina_pb2_grpc.JinaDataRequestRPCStub,
@@ -713,11 +1808,13 @@ class GrpcConnectionPool:
         :param address: the address to create the connection to, like 127.0.0.0.1:8080
         :param https: if True, use https for the grpc channel
         :param root_certificates: the path to the root certificates for https, only u
+        :param options: the options of the grpc channel, None uses the default options
 
         :returns: DataRequest/ControlRequest stubs and an async grpc channel
         """
         channel = GrpcConnectionPool.get_grpc_channel(
             address,
+            options=options,
             asyncio=True,
             https=https,
             root_certificates=root_certificates,
@@ -738,6 +1835,14 @@ class K8sGrpcConnectionPool(GrpcConnectionPool):
     :param namespace: K8s namespace to operate in
     :param client: K8s client
     :param logger: the logger to use
+    :param load_balancing: the strategy used to select a replica of a deployment
+    :param compressor: the compression settings for DataRequests, None disables compression
+    :param health_policy: the retry, outlier ejection and circuit breaking settings, None uses the defaults
+    :param hedge_policy: the hedging settings, None disables hedging
+    :param channels_per_replica: the number of grpc channels opened to every replica
+    :param stream_window: the maximum number of single DataRequests in flight on the bidirectional stream of every
+        channel, 0 sends every request in its own unary call
+    :param uds_dir: the private directory of the Unix domain sockets of the runtimes of the Flow, None always uses TCP
     """
 
     K8S_PORT_EXPOSE = 8080
@@ -750,8 +1855,24 @@ class K8sGrpcConnectionPool(GrpcConnectionPool):
         namespace: str,
         client: 'kubernetes.client.CoreV1Api',
         logger: JinaLogger = None,
+        load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+        compressor: Optional[DataRequestCompressor] = None,
+        health_policy: Optional[HealthPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        channels_per_replica: int = 1,
+        stream_window: int = 0,
+        uds_dir: Optional[str] = None,
     ):
-        super().__init__(logger=logger)
+        super().__init__(
+            logger=logger,
+            load_balancing=load_balancing,
+            compressor=compressor,
+            health_policy=health_policy,
+            hedge_policy=hedge_policy,
+            channels_per_replica=channels_per_replica,
+            stream_window=stream_window,
+            uds_dir=uds_dir,
+        )
 
         self._namespace = namespace
         self._process_events_task = None
@@ -903,12 +2024,27 @@ def create_connection_pool(
     k8s_connection_pool: bool = False,
     k8s_namespace: Optional[str] = None,
     logger: Optional[JinaLogger] = None,
+    load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+    compressor: Optional[DataRequestCompressor] = None,
+    health_policy: Optional[HealthPolicy] = None,
+    hedge_policy: Optional[HedgePolicy] = None,
+    channels_per_replica: int = 1,
+    stream_window: int = 0,
+    uds_dir: Optional[str] = None,
 ) -> GrpcConnectionPool:
     """
     Creates the appropriate connection pool based on parameters
     :param k8s_namespace: k8s namespace the pool will live in, None if outside K8s
     :param k8s_connection_pool: flag to indicate if K8sGrpcConnectionPool should be used, defaults to true in K8s
     :param logger: the logger to use
+    :param load_balancing: the strategy used to select a replica of a deployment
+    :param compressor: the compression settings for DataRequests, None disables compression
+    :param health_policy: the retry, outlier ejection and circuit breaking settings, None uses the defaults
+    :param hedge_policy: the hedging settings, None disables hedging
+    :param channels_per_replica: the number of grpc channels opened to every replica
+    :param stream_window: the maximum number of single DataRequests in flight on the bidirectional stream of every
+        channel, 0 sends every request in its own unary call
+    :param uds_dir: the private directory of the Unix domain sockets of the runtimes of the Flow, None always uses TCP
     :return: A connection pool object
     """
     if k8s_connection_pool and k8s_namespace:
@@ -920,10 +2056,28 @@ def create_connection_pool(
         k8s_client = client.ApiClient()
         core_client = client.CoreV1Api(api_client=k8s_client)
         return K8sGrpcConnectionPool(
-            namespace=k8s_namespace, client=core_client, logger=logger
+            namespace=k8s_namespace,
+            client=core_client,
+            logger=logger,
+            load_balancing=load_balancing,
+            compressor=compressor,
+            health_policy=health_policy,
+            hedge_policy=hedge_policy,
+            channels_per_replica=channels_per_replica,
+            stream_window=stream_window,
+            uds_dir=uds_dir,
         )
     else:
-        return GrpcConnectionPool(logger=logger)
+        return GrpcConnectionPool(
+            logger=logger,
+            load_balancing=load_balancing,
+            compressor=compressor,
+            health_policy=health_policy,
+            hedge_policy=hedge_policy,
+            channels_per_replica=channels_per_replica,
+            stream_window=stream_window,
+            uds_dir=uds_dir,
+        )
 
 
 def host_is_local(hostname):
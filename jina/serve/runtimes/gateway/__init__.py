@@ -1,7 +1,14 @@
+import asyncio
 from abc import ABC
+from typing import Dict
 
+from jina.serve.runtimes.gateway.admission import AdmissionController
 from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
-from jina.serve.networking import create_connection_pool
+from jina.serve.runtimes.gateway.in_process import InProcessConnectionPool
+from jina.serve.runtimes.gateway.request_handling import get_gateway_stats
+from jina.serve.runtimes.gateway.response_cache import ResponseCache
+from jina.serve.networking import create_connection_pool, HealthPolicy, HedgePolicy
+from jina.proto.serializer import DataRequestCompressor
 
 from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime
 
@@ -16,7 +23,64 @@ class GatewayRuntime(AsyncNewLoopRuntime, ABC):
         import json
 
         graph_description = json.loads(self.args.graph_description)
-        self._topology_graph = TopologyGraph(graph_description)
+        deployments_in_process = json.loads(self.args.deployments_in_process)
+        deployments_fused = json.loads(self.args.deployments_fused)
+        self._topology_graph = TopologyGraph(
+            graph_description,
+            in_process_deployments=deployments_in_process.keys(),
+            fused_deployments=[
+                name for names in deployments_fused.values() for name in names
+            ],
+        )
+
+    def _set_response_cache(self):
+        self._response_cache = ResponseCache.from_args(self.args)
+
+    def _log_response_cache_stats(self):
+        if self._response_cache is not None:
+            self.logger.debug(
+                f'Response cache stats: {self._response_cache.get_stats()}'
+            )
+
+    def _set_admission_controller(self):
+        self._admission_controller = AdmissionController.from_args(self.args)
+
+    def _log_admission_stats(self):
+        if self._admission_controller is not None:
+            self.logger.debug(
+                f'Admission stats: {self._admission_controller.get_stats()}'
+            )
+
+    def _get_stats(self) -> Dict:
+        return get_gateway_stats(
+            connection_pool=self._connection_pool,
+            response_cache=self._response_cache,
+        )
+
+    def _start_stats_logging(self):
+        self._stats_task = None
+        stats_interval = getattr(self.args, 'stats_interval', 0)
+        if stats_interval > 0:
+            self._stats_task = asyncio.create_task(
+                self._log_stats_periodically(stats_interval)
+            )
+
+    async def _log_stats_periodically(self, stats_interval: float):
+        while True:
+            await asyncio.sleep(stats_interval)
+            stats = self._get_stats()
+            if stats:
+                self.logger.info(f'Gateway stats: {stats}')
+
+    def _stop_stats_logging(self):
+        if getattr(self, '_stats_task', None) is not None:
+            self._stats_task.cancel()
+            self._stats_task = None
+
+    def _log_prefetch_stats(self, streamer):
+        prefetch_stats = streamer.get_prefetch_stats()
+        if prefetch_stats:
+            self.logger.debug(f'Adaptive prefetch stats: {prefetch_stats}')
 
     def _set_connection_pool(self):
         import json
@@ -27,9 +91,29 @@ class GatewayRuntime(AsyncNewLoopRuntime, ABC):
             logger=self.logger,
             k8s_connection_pool=self.args.k8s_connection_pool,
             k8s_namespace=self.args.k8s_namespace,
+            load_balancing=self.args.load_balancing,
+            compressor=DataRequestCompressor.from_args(self.args),
+            health_policy=HealthPolicy.from_args(self.args),
+            hedge_policy=HedgePolicy.from_args(self.args),
+            channels_per_replica=self.args.channels_per_replica,
+            stream_window=self.args.stream_window,
+            uds_dir=getattr(self.args, 'uds_dir', None),
         )
         for deployment_name, addresses in deployments_addresses.items():
             for address in addresses:
                 self._connection_pool.add_connection(
                     deployment=deployment_name, address=address, head=True
                 )
+        # the replicas of a Deployment whose head is bypassed take the place of the head
+        deployments_worker_addresses = json.loads(
+            self.args.deployments_worker_addresses
+        )
+        for deployment_name, addresses in deployments_worker_addresses.items():
+            for address in addresses:
+                self._connection_pool.add_connection(
+                    deployment=deployment_name, address=address, head=True
+                )
+        # the Executors of some Deployments may run inside the gateway
+        self._connection_pool = InProcessConnectionPool.from_args(
+            self.args, self._connection_pool, self.logger
+        )
@@ -0,0 +1,233 @@
+import asyncio
+import heapq
+import itertools
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from jina.types.request.data import DataRequest
+
+# the client sending the requests handled in the current context, set by the gateway when a client opens a stream
+_current_client: 'ContextVar[str]' = ContextVar('jina_gateway_client', default='')
+
+
+class _Ticket:
+    __slots__ = ('client', 'nbytes')
+
+    def __init__(self, client: str, nbytes: int):
+        self.client = client
+        self.nbytes = nbytes
+
+
+class AdmissionController:
+    """Caps the requests and the bytes in flight through the Flow, globally and per client.
+
+    A request beyond the caps waits in a bounded queue, where the requests with the highest `priority` header field
+    are admitted first. It is shed when it waited longer than `queue_timeout` or when the queue is full and it does not
+    have a higher priority than the requests already waiting.
+
+    :param max_requests: the maximum number of requests in flight, 0 means no cap
+    :param max_bytes: the maximum size in bytes of the requests in flight, 0 means no cap
+    :param max_requests_per_client: the maximum number of requests in flight from a single client, 0 means no cap
+    :param max_bytes_per_client: the maximum size in bytes of the requests in flight from a single client, 0 means no cap
+    :param queue_size: the maximum number of requests waiting to be admitted
+    :param queue_timeout: the seconds a request waits to be admitted before it is shed, 0 sheds it right away
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 0,
+        max_bytes: int = 0,
+        max_requests_per_client: int = 0,
+        max_bytes_per_client: int = 0,
+        queue_size: int = 100,
+        queue_timeout: float = 0.1,
+    ):
+        self.max_requests = max_requests
+        self.max_bytes = max_bytes
+        self.max_requests_per_client = max_requests_per_client
+        self.max_bytes_per_client = max_bytes_per_client
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._num_requests = 0
+        self._num_bytes = 0
+        # client -> [requests in flight, bytes in flight]
+        self._per_client: Dict[str, List[int]] = {}
+        # (-priority, arrival order, ticket, future), the future is resolved when the request is admitted
+        self._queue: List[Tuple[int, int, _Ticket, asyncio.Future]] = []
+        self._arrivals = itertools.count()
+        self.admitted = 0
+        self.queued = 0
+        self.shed_queue_full = 0
+        self.shed_timeout = 0
+
+    @classmethod
+    def from_args(cls, args) -> Optional['AdmissionController']:
+        """
+        Create an admission controller from the `--max-inflight-*` options
+
+        :param args: the parsed CLI arguments
+        :return: the admission controller or None if no cap is set
+        """
+        caps = {
+            'max_requests': getattr(args, 'max_inflight_requests', 0),
+            'max_bytes': getattr(args, 'max_inflight_bytes', 0),
+            'max_requests_per_client': getattr(
+                args, 'max_inflight_requests_per_client', 0
+            ),
+            'max_bytes_per_client': getattr(args, 'max_inflight_bytes_per_client', 0),
+        }
+        if not any(caps.values()):
+            return None
+        return cls(
+            **caps,
+            queue_size=getattr(args, 'admission_queue_size', 100),
+            queue_timeout=getattr(args, 'admission_queue_timeout', 0.1),
+        )
+
+    @staticmethod
+    def set_client(client: str):
+        """
+        Set the client sending the requests handled in the current context, the per client caps apply to it
+
+        :param client: the identity of the client, usually its host
+        """
+        _current_client.set(client)
+
+    def _fits(self, ticket: _Ticket) -> bool:
+        # a request always fits when nothing is in flight, so a single oversized request is not shed forever
+        if self._num_requests == 0:
+            return True
+        if self.max_requests and self._num_requests + 1 > self.max_requests:
+            return False
+        if self.max_bytes and self._num_bytes + ticket.nbytes > self.max_bytes:
+            return False
+        client_requests, client_bytes = self._per_client.get(ticket.client, (0, 0))
+        if client_requests == 0:
+            return True
+        if (
+            self.max_requests_per_client
+            and client_requests + 1 > self.max_requests_per_client
+        ):
+            return False
+        if (
+            self.max_bytes_per_client
+            and client_bytes + ticket.nbytes > self.max_bytes_per_client
+        ):
+            return False
+        return True
+
+    def _take(self, ticket: _Ticket):
+        self._num_requests += 1
+        self._num_bytes += ticket.nbytes
+        in_flight = self._per_client.setdefault(ticket.client, [0, 0])
+        in_flight[0] += 1
+        in_flight[1] += ticket.nbytes
+        self.admitted += 1
+
+    async def admit(self, request: DataRequest) -> Tuple[Optional[_Ticket], str]:
+        """
+        Wait until a request can be let into the Flow
+
+        :param request: the request received from the client
+        :return: the ticket to pass to :meth:`release` when the request is done, or None and the reason why the
+            request was shed
+        """
+        ticket = _Ticket(_current_client.get(), request.nbytes)
+        # the waiting requests do not fit, or they would have been admitted when the last request was released
+        if self._fits(ticket):
+            self._take(ticket)
+            return ticket, ''
+
+        priority = request.header.priority
+        if self.queue_timeout <= 0:
+            self.shed_queue_full += 1
+            return None, 'the gateway is saturated'
+        if len(self._queue) >= self.queue_size:
+            if not self._queue or -max(self._queue)[0] >= priority:
+                self.shed_queue_full += 1
+                return None, 'the gateway is saturated and its admission queue is full'
+            lowest = max(self._queue)
+            # the waiting request with the lowest priority makes room for this one
+            self._remove(lowest)
+            lowest[3].set_result(False)
+            self.shed_queue_full += 1
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (-priority, next(self._arrivals), ticket, future)
+        heapq.heappush(self._queue, entry)
+        self.queued += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            # the client went away while the request was waiting
+            if not future.done():
+                self._remove(entry)
+            elif future.result():
+                self.release(ticket)
+            raise
+        if not future.done():
+            self._remove(entry)
+            self.shed_timeout += 1
+            return (
+                None,
+                f'the gateway is saturated, the request waited {self.queue_timeout}s to be admitted',
+            )
+        if not future.result():
+            return (
+                None,
+                'the gateway is saturated, requests with a higher priority took the place of the request',
+            )
+        return ticket, ''
+
+    def _remove(self, entry: Tuple[int, int, _Ticket, asyncio.Future]):
+        self._queue.remove(entry)
+        heapq.heapify(self._queue)
+
+    def release(self, ticket: _Ticket):
+        """
+        Free the room taken by a request admitted by :meth:`admit` and admit the waiting requests that fit
+
+        :param ticket: the ticket returned by :meth:`admit`
+        """
+        self._num_requests -= 1
+        self._num_bytes -= ticket.nbytes
+        in_flight = self._per_client[ticket.client]
+        in_flight[0] -= 1
+        in_flight[1] -= ticket.nbytes
+        if in_flight[0] == 0:
+            del self._per_client[ticket.client]
+
+        # the waiting requests are admitted by priority, a request whose client is at its cap lets the others pass
+        admitted_entries = []
+        for entry in sorted(self._queue):
+            if self._fits(entry[2]):
+                self._take(entry[2])
+                admitted_entries.append(entry)
+            elif self._num_requests and (
+                (self.max_requests and self._num_requests >= self.max_requests)
+                or (self.max_bytes and self._num_bytes >= self.max_bytes)
+            ):
+                break
+        if admitted_entries:
+            for entry in admitted_entries:
+                self._queue.remove(entry)
+                entry[3].set_result(True)
+            heapq.heapify(self._queue)
+
+    def get_stats(self) -> Dict:
+        """
+        Returns the admission statistics
+
+        :return: dict with the requests and bytes in flight, the queue depth and the admitted, queued and shed counts
+        """
+        return {
+            'in_flight_requests': self._num_requests,
+            'in_flight_bytes': self._num_bytes,
+            'queue_depth': len(self._queue),
+            'admitted': self.admitted,
+            'queued': self.queued,
+            'shed_queue_full': self.shed_queue_full,
+            'shed_timeout': self.shed_timeout,
+        }
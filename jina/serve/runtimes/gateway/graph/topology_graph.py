@@ -1,8 +1,9 @@
 import asyncio
+import copy
 
 from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional, Dict, Tuple
+from typing import Iterable, List, Optional, Dict, Tuple
 
 from jina.serve.networking import GrpcConnectionPool
 from jina.types.request.data import DataRequest
@@ -13,21 +14,34 @@ class TopologyGraph:
     :class TopologyGraph is a class that describes a computational graph of nodes, where each node represents
         a Deployment that needs to be sent requests in the order respecting the path traversal.
 
+    The graph is compiled once into an immutable plan that is shared by all the requests, the state of every request
+    going through the graph is kept in a separate object created by :meth:`create_request_state`.
+
     :param graph_description: A dictionary describing the topology of the Deployments. 2 special nodes are expected, the name `start-gateway` and `end-gateway` to
         determine the nodes that receive the very first request and the ones whose response needs to be sent back to the client. All the nodes with no outgoing nodes
         will be considered to be hanging, and they will be "flagged" so that the user can ignore their tasks and not await them.
+    :param in_process_deployments: The Deployments running inside the gateway, they get the requests by reference
+    :param fused_deployments: The Deployments whose Executor runs in the worker of the Deployment they need, their
+        node passes the response of that Deployment through
     """
 
     class _ReqReplyNode:
         def __init__(self, name: str, number_of_parts: int = 1, hanging: bool = False):
             self.name = name
             self.outgoing_nodes = []
+            self.incoming_nodes = []
             self.number_of_parts = number_of_parts
             self.hanging = hanging
-            self.parts_to_send = []
-            self.start_time = None
-            self.end_time = None
-            self.status = None
+            # set when the node receives the request from the gateway
+            self.origin = False
+            # the position of the node in the plan, indexing the per-request state
+            self.index = 0
+            # set when the Deployment changes the requests it gets in place, inside the gateway process
+            self.in_process = False
+            # set when the requests the node gets are sent to other nodes as well
+            self.shares_input = False
+            # set when the Executor of the Deployment runs in the worker of its incoming node
+            self.fused = False
 
         @property
         def leaf(self):
@@ -35,121 +49,55 @@ class TopologyGraph:
 
         async def _wait_previous_and_send(
             self,
-            request: DataRequest,
-            previous_task: Optional[asyncio.Task],
+            request: Optional[DataRequest],
+            previous_tasks: List[asyncio.Task],
             connection_pool: GrpcConnectionPool,
             endpoint: Optional[str],
+            request_state: 'TopologyGraph._RequestState',
         ):
-            metadata = {}
-            if previous_task is not None:
-                result = await previous_task
-                request, metadata = result[0], result[1]
-            if 'is-error' in metadata:
-                return request, metadata
-            elif request is not None:
-                self.parts_to_send.append(request)
-                # this is a specific needs
-                if len(self.parts_to_send) == self.number_of_parts:
-                    self.start_time = datetime.utcnow()
-                    resp, metadata = await connection_pool.send_requests_once(
-                        requests=self.parts_to_send,
-                        deployment=self.name,
-                        head=True,
-                        endpoint=endpoint,
-                    )
-                    self.end_time = datetime.utcnow()
+            parts_to_send = [request] if self.origin else []
+            if previous_tasks:
+                for previous_request, metadata in await asyncio.gather(*previous_tasks):
                     if 'is-error' in metadata:
-                        self.status = resp.header.status
-                    return resp, metadata
-            return None, {}
+                        return previous_request, metadata
+                    parts_to_send.append(previous_request)
+            if any(part is None for part in parts_to_send):
+                return None, {}
+            if self.fused:
+                # the incoming Deployment already ran this Executor and reported its route
+                return parts_to_send[0], {}
+            if self.in_process and self.shares_input:
+                # the other nodes must not see the changes of this Deployment
+                parts_to_send = [DataRequest(part.to_bytes()) for part in parts_to_send]
 
-        def get_leaf_tasks(
-            self,
-            connection_pool: GrpcConnectionPool,
-            request_to_send: Optional[DataRequest],
-            previous_task: Optional[asyncio.Task],
-            endpoint: Optional[str] = None,
-        ) -> List[Tuple[bool, asyncio.Task]]:
-            """
-            Gets all the tasks corresponding from all the subgraphs born from this node
-
-            :param connection_pool: The connection_pool need to actually send the requests
-            :param request_to_send: Optional request to be sent when the node is an origin of a graph
-            :param previous_task: Optional task coming from the predecessor of the Node
-            :param endpoint: Optional string defining the endpoint of this request
-
-            .. note:
-                deployment1 -> outgoing_nodes: deployment2
-                deployment2 -> outgoing_nodes: deployment4
-                deployment3 -> outgoing_nodes: deployment4
-                deployment4 -> outgoing_nodes: deployment6
-                deployment5 -> outgoing_nodes: deployment6
-                deployment6 -> outgoing_nodes: []
-
-                |-> deployment1 -> deployment2 -->
-                |                   | -> deployment4 --->
-                |-> deployment3 ---------->             | -> deployment6
-                |-> deployment5 ------------------------>
-
-                Let's imagine a graph from this. Node corresponding to Deployment6 will receive 2 calls from deployment4 and deployment5.
-                The task returned by `deployment6` will backpropagated to the caller of deployment1.get_leaf_tasks, deployment3.get_leaf_tasks and deployment5.get_leaf_tasks.
-
-                When the caller of these methods await them, they will fire the logic of sending requests and responses from and to every deployment
-
-            :return: Return a list of tuples, where tasks corresponding to the leafs of all the subgraphs born from this node are in each tuple.
-                These tasks will be based on awaiting for the task from previous_node and sending a request to the corresponding node. The other member of the pair
-                is a flag indicating if the task is to be awaited by the gateway or not.
-            """
-            wait_previous_and_send_task = asyncio.create_task(
-                self._wait_previous_and_send(
-                    request_to_send, previous_task, connection_pool, endpoint=endpoint
-                )
+            request_state.start_times[self.index] = datetime.utcnow()
+            resp, metadata = await connection_pool.send_requests_once(
+                requests=parts_to_send,
+                deployment=self.name,
+                head=True,
+                endpoint=endpoint,
             )
-            if self.leaf:  # I am like a leaf
-                return [
-                    (not self.hanging, wait_previous_and_send_task)
-                ]  # I am the last in the chain
-            hanging_tasks_tuples = []
-            for outgoing_node in self.outgoing_nodes:
-                t = outgoing_node.get_leaf_tasks(
-                    connection_pool,
-                    None,
-                    wait_previous_and_send_task,
-                    endpoint=endpoint,
-                )
-                # We are interested in the last one, that will be the task that awaits all the previous
-                hanging_tasks_tuples.extend(t)
-
-            return hanging_tasks_tuples
-
-        def add_route(self, request: 'DataRequest'):
-            """
-             Add routes to the DataRequest based on the state of request processing
-
-             :param request: the request to add the routes to
-            :return: modified request with added routes
-            """
-
-            def _find_route(request):
-                for r in request.routes:
-                    if r.executor == self.name:
-                        return r
-                return None
-
-            r = _find_route(request)
-            if r is None and self.start_time:
-                r = request.routes.add()
-                r.executor = self.name
-                r.start_time.FromDatetime(self.start_time)
-                if self.end_time:
-                    r.end_time.FromDatetime(self.end_time)
-                if self.status:
-                    r.status.CopyFrom(self.status)
-            for outgoing_node in self.outgoing_nodes:
-                request = outgoing_node.add_route(request=request)
-            return request
-
-    def __init__(self, graph_representation: Dict, *args, **kwargs):
+            request_state.end_times[self.index] = datetime.utcnow()
+            if 'is-error' in metadata:
+                request_state.statuses[self.index] = resp.header.status
+            return resp, metadata
+
+    class _RequestState:
+        __slots__ = ('start_times', 'end_times', 'statuses')
+
+        def __init__(self, num_nodes: int):
+            self.start_times = [None] * num_nodes
+            self.end_times = [None] * num_nodes
+            self.statuses = [None] * num_nodes
+
+    def __init__(
+        self,
+        graph_representation: Dict,
+        in_process_deployments: Iterable[str] = (),
+        fused_deployments: Iterable[str] = (),
+        *args,
+        **kwargs,
+    ):
         num_parts_per_node = defaultdict(int)
         if 'start-gateway' in graph_representation:
             origin_node_names = graph_representation['start-gateway']
@@ -182,18 +130,147 @@ class TopologyGraph:
                 for out_node_name in outgoing_node_names:
                     if out_node_name not in ['start-gateway', 'end-gateway']:
                         nodes[node_name].outgoing_nodes.append(nodes[out_node_name])
+                        nodes[out_node_name].incoming_nodes.append(nodes[node_name])
 
         self._origin_nodes = [nodes[node_name] for node_name in origin_node_names]
+        for node in self._origin_nodes:
+            node.origin = True
+            node.shares_input = len(self._origin_nodes) > 1
+        for node in nodes.values():
+            node.in_process = node.name in in_process_deployments
+            node.fused = node.name in fused_deployments
+            if any(len(n.outgoing_nodes) > 1 for n in node.incoming_nodes):
+                node.shares_input = True
+        self._compile(list(nodes.values()))
+
+    def _compile(self, nodes: List['_ReqReplyNode']):
+        # order the nodes reachable from the gateway so that every node comes after all its incoming nodes
+        self._plan = []
+        num_waiting = {
+            id(node): len(node.incoming_nodes) for node in nodes if node.incoming_nodes
+        }
+        ready = [node for node in self._origin_nodes if id(node) not in num_waiting]
+        while ready:
+            node = ready.pop(0)
+            node.index = len(self._plan)
+            self._plan.append(node)
+            for outgoing_node in node.outgoing_nodes:
+                num_waiting[id(outgoing_node)] -= 1
+                if num_waiting[id(outgoing_node)] == 0:
+                    ready.append(outgoing_node)
+
+        # the order in which the paths are traversed from the origin nodes gives the order of the leaf tasks and routes
+        self._traversal = []
+        planned = set(id(node) for node in self._plan)
+        visited = set()
 
-    def add_routes(self, request: 'DataRequest'):
+        def _traverse(node):
+            if id(node) in visited or id(node) not in planned:
+                return
+            visited.add(id(node))
+            self._traversal.append(node)
+            for outgoing_node in node.outgoing_nodes:
+                _traverse(outgoing_node)
+
+        for node in self._origin_nodes:
+            _traverse(node)
+        self._has_fused_nodes = any(node.fused for node in self._plan)
+        self._route_order = {node.name: i for i, node in enumerate(self._traversal)}
+
+    def create_request_state(self) -> '_RequestState':
+        """
+        Create the state of a new request going through the graph
+
+        :return: the state object to pass to :meth:`get_leaf_tasks` and :meth:`add_routes`
+        """
+        return self._RequestState(len(self._plan))
+
+    def get_leaf_tasks(
+        self,
+        connection_pool: GrpcConnectionPool,
+        request: DataRequest,
+        request_state: '_RequestState',
+        endpoint: Optional[str] = None,
+    ) -> List[Tuple[bool, asyncio.Task]]:
+        """
+        Creates one task per node of the graph, sending the request along the paths of the graph, and returns the
+        tasks of the leaf nodes
+
+        :param connection_pool: The connection_pool need to actually send the requests
+        :param request: the request received from the client
+        :param request_state: the state of the request created by :meth:`create_request_state`
+        :param endpoint: Optional string defining the endpoint of this request
+
+        .. note:
+            deployment1 -> outgoing_nodes: deployment2
+            deployment2 -> outgoing_nodes: deployment4
+            deployment3 -> outgoing_nodes: deployment4
+            deployment4 -> outgoing_nodes: deployment6
+            deployment5 -> outgoing_nodes: deployment6
+            deployment6 -> outgoing_nodes: []
+
+            |-> deployment1 -> deployment2 -->
+            |                   | -> deployment4 --->
+            |-> deployment3 ---------->             | -> deployment6
+            |-> deployment5 ------------------------>
+
+            The task of every node awaits the tasks of its incoming nodes and sends the collected parts to its
+            Deployment. The task of `deployment6` awaits the tasks of deployment4 and deployment5, it is the only leaf task.
+
+            When the caller awaits the leaf tasks, they will fire the logic of sending requests and responses from and to every deployment
+
+        :return: Return a list of tuples, where the tasks corresponding to the leafs of the graph are in each tuple.
+            The other member of the pair is a flag indicating if the task is to be awaited by the gateway or not.
+        """
+        tasks = []
+        for node in self._plan:
+            tasks.append(
+                asyncio.create_task(
+                    node._wait_previous_and_send(
+                        request,
+                        [tasks[n.index] for n in node.incoming_nodes],
+                        connection_pool,
+                        endpoint,
+                        request_state,
+                    )
+                )
+            )
+        return [
+            (not node.hanging, tasks[node.index])
+            for node in self._traversal
+            if node.leaf
+        ]
+
+    def add_routes(self, request: 'DataRequest', request_state: '_RequestState'):
         """
         Add routes to the DataRequest based on the state of request processing
 
         :param request: the request to add the routes to
+        :param request_state: the state of the request created by :meth:`create_request_state`
         :return: modified request with added routes
         """
-        for node in self._origin_nodes:
-            request = node.add_route(request=request)
+        existing_routes = {r.executor for r in request.routes}
+        for node in self._traversal:
+            start_time = request_state.start_times[node.index]
+            if node.name in existing_routes or start_time is None:
+                continue
+            r = request.routes.add()
+            r.executor = node.name
+            r.start_time.FromDatetime(start_time)
+            end_time = request_state.end_times[node.index]
+            if end_time:
+                r.end_time.FromDatetime(end_time)
+            status = request_state.statuses[node.index]
+            if status:
+                r.status.CopyFrom(status)
+        if self._has_fused_nodes:
+            # the fused Deployments reported their routes before the routes of the Deployments preceding them were added
+            routes = sorted(
+                request.routes, key=lambda r: self._route_order.get(r.executor, -1)
+            )
+            routes = [copy.deepcopy(r) for r in routes]
+            del request.routes[:]
+            request.routes.extend(routes)
         return request
 
     @property
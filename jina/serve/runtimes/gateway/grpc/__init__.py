@@ -5,7 +5,9 @@ import grpc
 from jina import __default_host__
 
 from jina.proto import jina_pb2_grpc
+from jina.serve.networking import GrpcConnectionPool
 from jina.serve.runtimes.gateway import GatewayRuntime
+from jina.serve.runtimes.gateway.admission import AdmissionController
 from jina.serve.stream import RequestStreamer
 from jina.serve.runtimes.gateway.request_handling import handle_request, handle_result
 
@@ -28,23 +30,25 @@ class GRPCGatewayRuntime(GatewayRuntime):
             os.unsetenv('https_proxy')
 
         self.server = grpc.aio.server(
-            options=[
-                ('grpc.max_send_message_length', -1),
-                ('grpc.max_receive_message_length', -1),
-            ]
+            options=GrpcConnectionPool.get_default_grpc_options()
         )
         self._set_topology_graph()
         self._set_connection_pool()
+        self._set_response_cache()
+        self._set_admission_controller()
 
         self.streamer = RequestStreamer(
             args=self.args,
             request_handler=handle_request(
-                graph=self._topology_graph, connection_pool=self._connection_pool
+                graph=self._topology_graph,
+                connection_pool=self._connection_pool,
+                response_cache=self._response_cache,
+                admission_controller=self._admission_controller,
             ),
             result_handler=handle_result,
         )
 
-        self.streamer.Call = self.streamer.stream
+        self.streamer.Call = self._stream
 
         jina_pb2_grpc.add_JinaRPCServicer_to_server(self.streamer, self.server)
         jina_pb2_grpc.add_JinaControlRequestRPCServicer_to_server(self, self.server)
@@ -58,7 +62,18 @@ class GRPCGatewayRuntime(GatewayRuntime):
         # usually async_cancel should already have been called, but then its a noop
         # if the runtime is stopped without a sigterm (e.g. as a context manager, this can happen)
         await self.async_cancel()
+        self._stop_stats_logging()
         await self._connection_pool.close()
+        self._log_response_cache_stats()
+        self._log_admission_stats()
+        self._log_prefetch_stats(self.streamer)
+
+    async def _stream(self, request_iterator, context=None):
+        if context is not None:
+            # the per client caps of the admission control apply to the host of the client
+            AdmissionController.set_client(context.peer().rsplit(':', 1)[0])
+        async for response in self.streamer.stream(request_iterator):
+            yield response
 
     async def async_cancel(self):
         """The async method to stop server."""
@@ -67,6 +82,7 @@ class GRPCGatewayRuntime(GatewayRuntime):
     async def async_run_forever(self):
         """The async running of server."""
         self._connection_pool.start()
+        self._start_stats_logging()
         await self.server.wait_for_termination()
 
     async def process_control(self, request: ControlRequest, *args) -> ControlRequest:
@@ -1,17 +1,29 @@
 import argparse
 import json
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, Optional, TYPE_CHECKING
 
-from jina import __version__
+from jina import __version__, __protobuf_media_type__, __default_endpoint__
 from jina.clients.request import request_generator
+from jina.excepts import BadRequestCompression
 from jina.helper import get_full_version
 from jina.importer import ImportExtensions
 from jina.logging.logger import JinaLogger
 from jina.logging.profile import used_memory_readable
+from jina.proto import jina_pb2
+from jina.serve.runtimes.gateway.http.bulk import (
+    BulkUploadError,
+    batch_requests,
+    iter_length_prefixed_documents,
+    iter_ndjson_documents,
+    to_length_prefixed,
+)
+from jina.types.request.data import DataRequest
 
 if TYPE_CHECKING:
     from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
     from jina.serve.networking import GrpcConnectionPool
+    from jina.serve.runtimes.gateway.response_cache import ResponseCache
+    from jina.serve.runtimes.gateway.admission import AdmissionController
 
 
 def get_fastapi_app(
@@ -19,6 +31,8 @@ def get_fastapi_app(
     topology_graph: 'TopologyGraph',
     connection_pool: 'GrpcConnectionPool',
     logger: 'JinaLogger',
+    response_cache: Optional['ResponseCache'] = None,
+    admission_controller: Optional['AdmissionController'] = None,
 ):
     """
     Get the app from FastAPI as the REST interface.
@@ -27,12 +41,19 @@ def get_fastapi_app(
     :param topology_graph: topology graph that manages the logic of sending to the proper executors.
     :param connection_pool: Connection Pool to handle multiple replicas and sending to different of them
     :param logger: Jina logger.
+    :param response_cache: Optional cache of the responses of idempotent endpoints.
+    :param admission_controller: Optional caps of the requests in flight.
     :return: fastapi app
     """
     with ImportExtensions(required=True):
         from fastapi import FastAPI
         from starlette.requests import Request
-        from fastapi.responses import HTMLResponse
+        from fastapi.responses import (
+            HTMLResponse,
+            JSONResponse,
+            Response,
+            StreamingResponse,
+        )
         from fastapi.middleware.cors import CORSMiddleware
         from jina.serve.runtimes.gateway.http.models import (
             JinaStatusModel,
@@ -65,6 +86,7 @@ def get_fastapi_app(
 
     from jina.serve.stream import RequestStreamer
     from jina.serve.runtimes.gateway.request_handling import (
+        get_gateway_stats,
         handle_request,
         handle_result,
     )
@@ -72,7 +94,10 @@ def get_fastapi_app(
     streamer = RequestStreamer(
         args=args,
         request_handler=handle_request(
-            graph=topology_graph, connection_pool=connection_pool
+            graph=topology_graph,
+            connection_pool=connection_pool,
+            response_cache=response_cache,
+            admission_controller=admission_controller,
         ),
         result_handler=handle_result,
     )
@@ -81,6 +106,13 @@ def get_fastapi_app(
     @app.on_event('shutdown')
     async def _shutdown():
         await connection_pool.close()
+        prefetch_stats = streamer.get_prefetch_stats()
+        if prefetch_stats:
+            logger.debug(f'Adaptive prefetch stats: {prefetch_stats}')
+
+    # the paths taking a serialized DataRequestProto body, mapped to the executor endpoint they target, None keeps
+    # the endpoint of the request
+    binary_endpoints = {}  # type: Dict[str, Optional[str]]
 
     openapi_tags = []
     if not args.no_debug_endpoints:
@@ -113,6 +145,21 @@ def get_fastapi_app(
                 'used_memory': used_memory_readable(),
             }
 
+        @app.get(
+            path='/stats',
+            summary='Get the statistics of the gateway',
+            tags=['Debug'],
+        )
+        async def _stats():
+            """
+            Get the statistics of the gateway, like the requests in flight per replica and the response cache hits.
+
+            .. # noqa: DAR201
+            """
+            return get_gateway_stats(
+                connection_pool=connection_pool, response_cache=response_cache
+            )
+
         @app.post(
             path='/post',
             summary='Post a data request to some endpoint',
@@ -120,7 +167,7 @@ def get_fastapi_app(
             tags=['Debug']
             # do not add response_model here, this debug endpoint should not restricts the response model
         )
-        async def post(body: JinaEndpointRequestModel):
+        async def post(body: JinaEndpointRequestModel, req: Request):
             """
             Post a data request to some endpoint.
 
@@ -146,10 +193,12 @@ def get_fastapi_app(
                 req_generator_input['data'] = req_generator_input['data']['docs']
 
             result = await _get_singleton_result(
-                request_generator(**req_generator_input)
+                request_generator(**req_generator_input), req
             )
             return result
 
+        binary_endpoints['/post'] = None
+
     def expose_executor_endpoint(exec_endpoint, http_path=None, **kwargs):
         """Exposing an executor endpoint to http endpoint
         :param exec_endpoint: the executor endpoint
@@ -165,11 +214,12 @@ def get_fastapi_app(
             JinaResponseModel,  # use standard response model by default
         )
         kwargs['methods'] = kwargs.get('methods', ['POST'])
+        binary_endpoints[http_path or exec_endpoint] = exec_endpoint
 
         @app.api_route(
             path=http_path or exec_endpoint, name=http_path or exec_endpoint, **kwargs
         )
-        async def foo(body: JinaRequestModel):
+        async def foo(body: JinaRequestModel, req: Request):
             from jina.enums import DataInputType
 
             bd = body.dict() if body else {'data': None}
@@ -180,7 +230,7 @@ def get_fastapi_app(
                 req_generator_input['data'] = req_generator_input['data']['docs']
 
             result = await _get_singleton_result(
-                request_generator(**req_generator_input)
+                request_generator(**req_generator_input), req
             )
             return result
 
@@ -205,6 +255,102 @@ def get_fastapi_app(
             ] = f'Post data requests to the Flow. Executors with `@requests(on="{k}")` will respond.'
             expose_executor_endpoint(exec_endpoint=k, **v)
 
+    class BulkStreamingResponse(StreamingResponse):
+        async def __call__(self, scope, receive, send):
+            # the status is only sent with the first result, an upload rejected before it is answered with an error
+            results = self.body_iterator.__aiter__()
+            try:
+                first = await results.__anext__()
+            except StopAsyncIteration:
+                first = None
+            except BulkUploadError as ex:
+                await Response(status_code=ex.status_code, content=str(ex))(
+                    scope, receive, send
+                )
+                return
+
+            async def _all_results():
+                if first is not None:
+                    yield first
+                async for result in results:
+                    yield result
+
+            self.body_iterator = _all_results()
+            # the body of the request is still read while the results are sent, listening for a disconnect would
+            # consume it
+            await self.stream_response(send)
+
+    openapi_tags.append(
+        {
+            'name': 'Bulk',
+            'description': 'Bulk interface. Stream any number of Documents into the Flow in a single HTTP request.',
+        }
+    )
+
+    @app.post(
+        path='/bulk',
+        summary='Stream Documents to some endpoint and stream the results back',
+        tags=['Bulk'],
+    )
+    async def bulk(
+        req: Request,
+        exec_endpoint: str = __default_endpoint__,
+        target_executor: Optional[str] = None,
+        request_size: int = args.bulk_request_size,
+    ):
+        """
+        Stream Documents to some endpoint and stream the results back as they complete.
+
+        The body is either newline delimited JSON, one Document per line, or, with the `application/x-protobuf`
+        content type, serialized DocumentProtos each preceded by its size as a 4 bytes big endian integer. The
+        Documents are batched into requests of `request_size` Documents. The results are streamed back in the same
+        format, one response per request, in the order they complete.
+
+        .. # noqa: DAR101
+        .. # noqa: DAR201
+        """
+        binary = req.headers.get('content-type', '').startswith(__protobuf_media_type__)
+        documents = (
+            iter_length_prefixed_documents(req.stream(), args.bulk_max_document_size)
+            if binary
+            else iter_ndjson_documents(req.stream(), args.bulk_max_document_size)
+        )
+        request_iterator = batch_requests(
+            documents, max(1, request_size), exec_endpoint, target_executor
+        )
+
+        def _encode(response: DataRequest) -> bytes:
+            if binary:
+                return to_length_prefixed(response.to_bytes())
+            return json.dumps(response.to_dict()).encode() + b'\n'
+
+        async def _results():
+            if admission_controller is not None and req.client:
+                admission_controller.set_client(req.client.host)
+            sent = False
+            try:
+                # the prefetch pauses the upload until there is room for more requests in flight
+                async for response in streamer.stream(
+                    request_iterator=request_iterator,
+                    prefetch=max(1, args.bulk_prefetch),
+                ):
+                    yield _encode(response)
+                    sent = True
+            except BulkUploadError as ex:
+                if not sent:
+                    raise
+                # the status was already sent, the error is the last record of the stream
+                error = DataRequest()
+                error.header.status.code = jina_pb2.StatusProto.ERROR
+                error.header.status.description = str(ex)
+                error.header.status.exception.name = ex.__class__.__name__
+                yield _encode(error)
+
+        return BulkStreamingResponse(
+            _results(),
+            media_type=__protobuf_media_type__ if binary else 'application/x-ndjson',
+        )
+
     if openapi_tags:
         app.openapi_tags = openapi_tags
 
@@ -227,15 +373,96 @@ def get_fastapi_app(
 
         app.add_route(docs_url, _render_custom_swagger_html, include_in_schema=False)
 
-    async def _get_singleton_result(request_iterator) -> Dict:
+    class BinaryRequestMiddleware:
         """
-        Streams results from AsyncPrefetchCall as a dict
+        Sends a serialized DataRequestProto body straight into the streamer and answers with the serialized response,
+        the pydantic models and the JSON conversions are skipped. The requests with another content type are passed
+        through untouched, a `BaseHTTPMiddleware` would read their body while the streaming endpoints still do.
+        """
+
+        def __init__(self, app):
+            self.app = app
+
+        async def __call__(self, scope, receive, send):
+            if scope['type'] == 'http' and scope['path'] in binary_endpoints:
+                req = Request(scope, receive)
+                if req.headers.get('content-type', '').startswith(
+                    __protobuf_media_type__
+                ):
+                    response = await _binary_request(req)
+                    await response(scope, receive, send)
+                    return
+            await self.app(scope, receive, send)
+
+    app.add_middleware(BinaryRequestMiddleware)
+
+    async def _binary_request(req: Request) -> Response:
+        """
+        Streams a request received as a serialized DataRequestProto
+
+        :param req: the HTTP request
+        :return: the HTTP response
+        """
+        try:
+            request = DataRequest(await req.body())
+            if request.is_compressed:
+                raise BadRequestCompression(
+                    'the gateway does not accept compressed requests from clients'
+                )
+            # only the header is parsed, the docs stay serialized
+            header = request.header
+            exec_endpoint = binary_endpoints[req.url.path]
+            if exec_endpoint is not None:
+                header.exec_endpoint = exec_endpoint
+        except Exception as ex:
+            return Response(
+                status_code=400, content=f'the body is not a DataRequestProto: {ex!r}'
+            )
+
+        async def _request_iterator():
+            yield request
+
+        response = await _get_singleton_response(_request_iterator(), req)
+        return Response(
+            status_code=429 if _is_shed(response) else 200,
+            content=response.to_bytes(),
+            media_type=__protobuf_media_type__,
+        )
+
+    def _is_shed(response: DataRequest) -> bool:
+        return (
+            response.header.status.code == jina_pb2.StatusProto.ERROR_RESOURCE_EXHAUSTED
+        )
+
+    async def _get_singleton_response(
+        request_iterator, req: Optional[Request] = None
+    ) -> DataRequest:
+        """
+        Streams the response to a single request
 
         :param request_iterator: request iterator, with length of 1
-        :return: the first result from the request iterator
+        :param req: the HTTP request, its client host is subject to the per client caps of the admission control
+        :return: the first response from the request iterator
         """
+        if admission_controller is not None and req is not None and req.client:
+            admission_controller.set_client(req.client.host)
         async for k in streamer.stream(request_iterator=request_iterator):
-            request_dict = k.to_dict()
-            return request_dict
+            return k
+
+    async def _get_singleton_result(
+        request_iterator, req: Optional[Request] = None
+    ) -> Dict:
+        """
+        Streams results from AsyncPrefetchCall as a dict
+
+        :param request_iterator: request iterator, with length of 1
+        :param req: the HTTP request, its client host is subject to the per client caps of the admission control
+        :return: the first result from the request iterator, a 429 response if the request was shed
+        """
+        response = await _get_singleton_response(request_iterator, req)
+        request_dict = response.to_dict()
+        if _is_shed(response):
+            return JSONResponse(status_code=429, content=request_dict)
+        return request_dict
 
     return app
@@ -0,0 +1,144 @@
+import json
+import struct
+from typing import AsyncIterator, Optional
+
+from docarray import Document
+from docarray.proto.docarray_pb2 import DocumentProto
+
+from jina.clients.request.helper import _new_data_request
+from jina.types.request.data import DataRequest
+
+# every message of a binary bulk stream is preceded by its size as a 4 bytes big endian unsigned integer
+_LENGTH_PREFIX = struct.Struct('>I')
+
+
+class BulkUploadError(ValueError):
+    """Raised when the body streamed to the bulk endpoint can not be turned into Documents"""
+
+    status_code = 400
+
+
+class DocumentTooLargeError(BulkUploadError):
+    """Raised when a Document of a bulk stream is larger than the maximum size of a Document"""
+
+    status_code = 413
+
+
+def _check_document_size(size: int, max_document_size: int):
+    if max_document_size and size > max_document_size:
+        raise DocumentTooLargeError(
+            f'a Document of the stream is larger than {max_document_size} bytes'
+        )
+
+
+def _parse_json_document(line: bytes) -> DocumentProto:
+    try:
+        return Document.from_dict(json.loads(line)).to_protobuf()
+    except Exception as ex:
+        raise BulkUploadError(f'a line of the stream is not a Document: {ex!r}') from ex
+
+
+def _parse_document_proto(message: bytes) -> DocumentProto:
+    try:
+        return DocumentProto.FromString(message)
+    except Exception as ex:
+        raise BulkUploadError(
+            f'a message of the stream is not a DocumentProto: {ex!r}'
+        ) from ex
+
+
+async def iter_ndjson_documents(
+    chunks: AsyncIterator[bytes],
+    max_document_size: int = 0,
+) -> AsyncIterator[DocumentProto]:
+    """
+    Parses a stream of Documents as newline delimited JSON, one Document dict per line
+
+    :param chunks: the chunks of the stream, a line may span several chunks
+    :param max_document_size: the maximum size in bytes of a line, 0 means no limit
+    :yield: the Documents as protos
+    """
+    tail = b''
+    async for chunk in chunks:
+        lines = (tail + chunk).split(b'\n')
+        # the last line is not complete until a newline or the end of the stream is received
+        tail = lines.pop()
+        for line in lines:
+            _check_document_size(len(line), max_document_size)
+            if line.strip():
+                yield _parse_json_document(line)
+        # a body without newlines is not buffered beyond the maximum size
+        _check_document_size(len(tail), max_document_size)
+    if tail.strip():
+        yield _parse_json_document(tail)
+
+
+async def iter_length_prefixed_documents(
+    chunks: AsyncIterator[bytes],
+    max_document_size: int = 0,
+) -> AsyncIterator[DocumentProto]:
+    """
+    Parses a stream of serialized DocumentProtos, each preceded by its size
+
+    :param chunks: the chunks of the stream, a Document may span several chunks
+    :param max_document_size: the maximum size in bytes of a serialized Document, 0 means no limit
+    :yield: the Documents as protos
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        offset = 0
+        while len(buffer) - offset >= _LENGTH_PREFIX.size:
+            (size,) = _LENGTH_PREFIX.unpack_from(buffer, offset)
+            _check_document_size(size, max_document_size)
+            end = offset + _LENGTH_PREFIX.size + size
+            if len(buffer) < end:
+                break
+            yield _parse_document_proto(
+                bytes(buffer[offset + _LENGTH_PREFIX.size : end])
+            )
+            offset = end
+        del buffer[:offset]
+    if buffer:
+        raise BulkUploadError(
+            f'the stream ends in the middle of a Document, {len(buffer)} bytes are left'
+        )
+
+
+def to_length_prefixed(message: bytes) -> bytes:
+    """
+    Frames a serialized message for a binary bulk stream
+
+    :param message: the serialized message
+    :return: the message preceded by its size
+    """
+    return _LENGTH_PREFIX.pack(len(message)) + message
+
+
+async def batch_requests(
+    documents: AsyncIterator[DocumentProto],
+    request_size: int,
+    exec_endpoint: str,
+    target_executor: Optional[str] = None,
+) -> AsyncIterator[DataRequest]:
+    """
+    Batches a stream of Documents into requests, a request is yielded as soon as it is full so that only the requests
+    in flight are held in memory
+
+    :param documents: the Documents as protos
+    :param request_size: the number of Documents per request
+    :param exec_endpoint: the endpoint of the requests
+    :param target_executor: a regex matching the Executors the requests are sent to
+    :yield: the requests
+    """
+    request = None
+    async for doc in documents:
+        if request is None:
+            request = _new_data_request(exec_endpoint, target_executor, None)
+        # the Documents are copied proto to proto, they are never turned into Python objects
+        request.proto.data.docs.docs.append(doc)
+        if len(request.proto.data.docs.docs) >= request_size:
+            yield request
+            request = None
+    if request is not None:
+        yield request
@@ -0,0 +1,139 @@
+import asyncio
+import json
+from typing import Dict, List, Optional, Tuple
+
+from jina import __default_executor__
+from jina.logging.logger import JinaLogger
+from jina.serve.networking import GrpcConnectionPool
+from jina.serve.runtimes.request_handlers.data_request_handler import DataRequestHandler
+from jina.types.request import Request
+from jina.types.request.data import DataRequest
+
+
+class InProcessConnectionPool:
+    """
+    Wraps the connection pool of the gateway, the Deployments running inside the gateway process get the requests
+    passed by reference to their :class:`DataRequestHandler` instead of through gRPC.
+
+    The requests to all the other Deployments and all the other methods go to the wrapped connection pool.
+
+    :param connection_pool: the connection pool of the Deployments running in their own pods
+    :param handlers: the request handler of every Deployment running inside the gateway
+    :param logger: the logger of the gateway
+    """
+
+    def __init__(
+        self,
+        connection_pool: GrpcConnectionPool,
+        handlers: Dict[str, DataRequestHandler],
+        logger: JinaLogger,
+    ):
+        self._connection_pool = connection_pool
+        self._handlers = handlers
+        self._logger = logger
+
+    @classmethod
+    def from_args(
+        cls, args, connection_pool: GrpcConnectionPool, logger: JinaLogger
+    ) -> GrpcConnectionPool:
+        """
+        Load the Executors of the Deployments in `--deployments-in-process` inside the gateway
+
+        :param args: the parsed CLI arguments of the gateway
+        :param connection_pool: the connection pool of the Deployments running in their own pods
+        :param logger: the logger of the gateway
+        :return: the wrapped connection pool, or the given one if no Deployment runs inside the gateway
+        """
+        from jina.parsers import set_pod_parser
+
+        deployments_args = json.loads(getattr(args, 'deployments_in_process', '{}'))
+        if not deployments_args:
+            return connection_pool
+        handlers = {}
+        for deployment_name, deployment_args in deployments_args.items():
+            logger.debug(f'Loading the Executor of {deployment_name} in the gateway')
+            handlers[deployment_name] = DataRequestHandler(
+                set_pod_parser().parse_args(deployment_args), logger
+            )
+        return cls(connection_pool, handlers, logger)
+
+    def send_request(
+        self, request: Request, deployment: str, head: bool = False, **kwargs
+    ) -> List[asyncio.Task]:
+        """
+        Send a single request to a Deployment, see :meth:`GrpcConnectionPool.send_request`
+
+        :param request: the request to send
+        :param deployment: name of the Deployment to send the request to
+        :param head: If True it is send to the head, ignored for the Deployments running inside the gateway
+        :param kwargs: the other arguments of :meth:`GrpcConnectionPool.send_request`
+        :return: list of asyncio.Task items for each send call
+        """
+        if deployment in self._handlers:
+            return [self.send_requests_once([request], deployment)]
+        return self._connection_pool.send_request(
+            request=request, deployment=deployment, head=head, **kwargs
+        )
+
+    def send_requests_once(
+        self,
+        requests: List[Request],
+        deployment: str,
+        head: bool = False,
+        shard_id: Optional[int] = None,
+        endpoint: Optional[str] = None,
+    ) -> asyncio.Task:
+        """
+        Send requests to a Deployment, see :meth:`GrpcConnectionPool.send_requests_once`
+
+        :param requests: the requests to send
+        :param deployment: name of the Deployment to send the requests to
+        :param head: If True it is send to the head, ignored for the Deployments running inside the gateway
+        :param shard_id: Send to a specific shard of the Deployment
+        :param endpoint: endpoint to target with the requests
+        :return: asyncio.Task representing the send call
+        """
+        handler = self._handlers.get(deployment)
+        if handler is None:
+            return self._connection_pool.send_requests_once(
+                requests,
+                deployment=deployment,
+                head=head,
+                shard_id=shard_id,
+                endpoint=endpoint,
+            )
+        return asyncio.create_task(self._handle(handler, requests))
+
+    async def _handle(
+        self, handler: DataRequestHandler, requests: List[DataRequest]
+    ) -> Tuple[DataRequest, Dict]:
+        # this mirrors what the head and the worker of the Deployment do with the requests
+        if requests[0].is_expired:
+            requests[0].set_timeout_error(handler.args.name or 'the executor')
+            return requests[0], {'is-error': 'true'}
+        if len(requests) > 1:
+            DataRequestHandler.merge_routes(requests)
+            if handler.args.uses == __default_executor__:
+                requests = [DataRequestHandler.reduce_requests(requests)]
+        try:
+            return await handler.handle(requests=requests), {}
+        except (RuntimeError, Exception) as ex:
+            self._logger.error(
+                f'{ex!r}' + f'\n add "--quiet-error" to suppress the exception details'
+                if not handler.args.quiet_error
+                else '',
+                exc_info=not handler.args.quiet_error,
+            )
+            requests[0].add_exception(ex, handler._executor)
+            return requests[0], {'is-error': 'true'}
+
+    async def close(self):
+        """
+        Close the Executors running inside the gateway and the wrapped connection pool
+        """
+        for handler in self._handlers.values():
+            handler.close()
+        await self._connection_pool.close()
+
+    def __getattr__(self, name):
+        return getattr(self._connection_pool, name)
@@ -1,36 +1,96 @@
-import copy
 import asyncio
 
-from typing import List, TYPE_CHECKING, Callable
+from typing import Dict, List, TYPE_CHECKING, Callable, Optional
 
+from jina.excepts import BadRequestCompression
+from jina.serve.runtimes.gateway.admission import AdmissionController
 from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
+from jina.serve.runtimes.gateway.response_cache import ResponseCache
 from jina.serve.networking import GrpcConnectionPool
+from jina.types.request.data import DataRequest
 
 if TYPE_CHECKING:
     from jina.types.request import Request
 
 
+def get_gateway_stats(
+    connection_pool: Optional['GrpcConnectionPool'] = None,
+    response_cache: Optional['ResponseCache'] = None,
+) -> Dict:
+    """
+    Collect the statistics of the gateway
+
+    :param connection_pool: The connection pool to the Deployments, its stats hold the requests in flight per replica
+    :param response_cache: Optional cache of the responses of idempotent endpoints
+    :return: dict with the statistics of every enabled feature of the gateway
+    """
+    stats = {}
+    if connection_pool is not None:
+        stats['connections'] = connection_pool.get_connection_stats()
+    if response_cache is not None:
+        stats['response_cache'] = response_cache.get_stats()
+    return stats
+
+
 def handle_request(
-    graph: 'TopologyGraph', connection_pool: 'GrpcConnectionPool'
+    graph: 'TopologyGraph',
+    connection_pool: 'GrpcConnectionPool',
+    response_cache: Optional['ResponseCache'] = None,
+    admission_controller: Optional['AdmissionController'] = None,
 ) -> Callable[['Request'], 'asyncio.Future']:
     """
     Function that handles the requests arriving to the gateway. This will be passed to the streamer.
 
     :param graph: The TopologyGraph of the Flow.
     :param connection_pool: The connection pool to be used to send messages to specific nodes of the graph
+    :param response_cache: Optional cache of the responses of idempotent endpoints, a hit skips the graph
+    :param admission_controller: Optional caps of the requests in flight, the requests beyond them are queued or shed
     :return: Return a Function that given a Request will return a Future from where to extract the response
     """
 
     def _handle_request(request: 'Request') -> 'asyncio.Future':
+        if request.is_compressed:
+            # only the runtimes of the Flow compress the requests they send to each other, a client can not make the
+            # gateway decompress a payload
+            future = asyncio.Future()
+            future.set_exception(
+                BadRequestCompression(
+                    'the gateway does not accept compressed requests from clients'
+                )
+            )
+            return future
 
-        request_graph = copy.deepcopy(graph)
-        # important that the gateway needs to have an instance of the graph per request
+        # the graph is shared by all the requests, only the state of this request is created
+        request_state = graph.create_request_state()
         tasks_to_respond = []
         tasks_to_ignore = []
         endpoint = request.header.exec_endpoint
+        cache_key = None
+        cache_ids = None
+        cache_generation = None
+        if response_cache is not None:
+            response_cache.invalidate(endpoint)
+            cache_generation = response_cache.generation
+            if (
+                response_cache.is_cached(endpoint)
+                and not request.header.target_executor
+            ):
+                cache_key, cache_ids = response_cache.get_key(request)
         r = request.routes.add()
         r.executor = 'gateway'
         r.start_time.GetCurrentTime()
+        if cache_key is not None:
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                cached_response, cached_ids = cached
+                response = DataRequest(cached_response)
+                response_cache.restore_ids(response, cached_ids, cache_ids)
+                response.header.request_id = request.header.request_id
+                del response.routes[:]
+                response.routes.extend(request.routes)
+                future = asyncio.Future()
+                future.set_result(response)
+                return future
         # If the request is targeting a specific deployment, we can send directly to the deployment instead of querying the graph
         if request.header.target_executor:
             tasks_to_respond.extend(
@@ -42,18 +102,16 @@ def handle_request(
                 )
             )
         else:
-            for origin_node in request_graph.origin_nodes:
-                leaf_tasks = origin_node.get_leaf_tasks(
-                    connection_pool, request, None, endpoint=endpoint
-                )
-                # Every origin node returns a set of tasks that are the ones corresponding to the leafs of each of their
-                # subtrees that unwrap all the previous tasks. It starts like a chain of waiting for tasks from previous
-                # nodes
-                tasks_to_respond.extend([task for ret, task in leaf_tasks if ret])
-                tasks_to_ignore.extend([task for ret, task in leaf_tasks if not ret])
+            leaf_tasks = graph.get_leaf_tasks(
+                connection_pool, request, request_state, endpoint=endpoint
+            )
+            # The graph returns the tasks corresponding to its leafs, they unwrap all the previous tasks. It starts like
+            # a chain of waiting for tasks from previous nodes
+            tasks_to_respond.extend([task for ret, task in leaf_tasks if ret])
+            tasks_to_ignore.extend([task for ret, task in leaf_tasks if not ret])
 
         async def _process_results_at_end_gateway(
-            tasks: List[asyncio.Task], request_graph: TopologyGraph
+            tasks: List[asyncio.Task], request_state: TopologyGraph._RequestState
         ) -> asyncio.Future:
 
             partial_responses = await asyncio.gather(*tasks)
@@ -63,7 +121,19 @@ def handle_request(
             )
 
             response = filtered_partial_responses[0]
-            request_graph.add_routes(response)
+            graph.add_routes(response, request_state)
+            if response_cache is not None:
+                # drop the responses cached while the indexed data was being changed
+                response_cache.invalidate(endpoint)
+                if cache_key is not None:
+                    response_cache.put(
+                        cache_key,
+                        endpoint,
+                        response,
+                        metadatas=metadatas,
+                        generation=cache_generation,
+                        ids=cache_ids,
+                    )
 
             return response
 
@@ -74,10 +144,26 @@ def handle_request(
             future.set_result((request, {}))
             tasks_to_respond.append(future)
         return asyncio.ensure_future(
-            _process_results_at_end_gateway(tasks_to_respond, request_graph)
+            _process_results_at_end_gateway(tasks_to_respond, request_state)
         )
 
-    return _handle_request
+    if admission_controller is None:
+        return _handle_request
+
+    async def _admit_and_handle_request(request: 'Request') -> 'Request':
+        ticket, reason = await admission_controller.admit(request)
+        if ticket is None:
+            request.set_resource_exhausted_error(reason)
+            return request
+        try:
+            return await _handle_request(request)
+        finally:
+            admission_controller.release(ticket)
+
+    def _handle_admitted_request(request: 'Request') -> 'asyncio.Future':
+        return asyncio.ensure_future(_admit_and_handle_request(request))
+
+    return _handle_admitted_request
 
 
 def handle_result(result: 'Request'):
@@ -0,0 +1,262 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from docarray import DocumentArray
+from docarray.proto.docarray_pb2 import DocumentArrayProto, DocumentProto
+
+from jina.proto import jina_pb2
+from jina.proto.serializer import get_field_payload, split_fields
+from jina.types.request.data import DataRequest
+
+_DATA_FIELD = jina_pb2.DataRequestProto.DATA_FIELD_NUMBER
+_DOCS_FIELD = jina_pb2.DataRequestProto.DataContentProto.DOCS_FIELD_NUMBER
+_DOCS_BYTES_FIELD = jina_pb2.DataRequestProto.DataContentProto.DOCS_BYTES_FIELD_NUMBER
+_DOCUMENT_ARRAY_DOCS_FIELD = DocumentArrayProto.DOCS_FIELD_NUMBER
+_ID_FIELD = DocumentProto.ID_FIELD_NUMBER
+_PARENT_ID_FIELD = DocumentProto.PARENT_ID_FIELD_NUMBER
+_NESTED_DOCS_FIELDS = (
+    DocumentProto.CHUNKS_FIELD_NUMBER,
+    DocumentProto.MATCHES_FIELD_NUMBER,
+)
+# no protobuf tag has the field number 0, these bytes delimit the Documents in the digest of a request
+_DOCUMENT_START = bytes([0])
+_DOCUMENT_END = bytes([1])
+
+
+class ResponseCache:
+    """An LRU cache with TTL of the responses of idempotent endpoints, kept by the gateway.
+
+    A cached response is returned without sending the request through the topology graph. The key of a request is a
+    hash of its endpoint, its parameters and its serialized docs without their ids, as clients give every Document a
+    random id. The ids of the request a response was cached for are replaced by the ids of the request it is returned
+    for. All the entries are dropped when a request arrives at
+    one of the endpoints changing the indexed data, and when it completes. The responses computed while the indexed data
+    was changing are not cached.
+
+    :param ttl_per_endpoint: the time to live in seconds of the cached responses of every cached endpoint
+    :param max_size: the maximum number of cached responses, the least recently used response is evicted beyond it
+    :param invalidate_on: the endpoints that drop all the cached responses when they are called
+    """
+
+    def __init__(
+        self,
+        ttl_per_endpoint: Dict[str, float],
+        max_size: int = 1000,
+        invalidate_on: Iterable[str] = ('/index', '/update', '/delete'),
+    ):
+        self.ttl_per_endpoint = ttl_per_endpoint
+        self.max_size = max_size
+        self.invalidate_on = set(invalidate_on)
+        # key -> (expiry time, serialized response, ids of the docs of the request)
+        self._entries: 'OrderedDict[bytes, Tuple[float, bytes, List[str]]]' = (
+            OrderedDict()
+        )
+        # bumped every time the indexed data may change, a response is only cached in the generation it started in
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_args(cls, args) -> Optional['ResponseCache']:
+        """
+        Create a response cache from the `--response-cache` options
+
+        :param args: the parsed CLI arguments
+        :return: the response cache or None if no endpoint is cached
+        """
+        ttl_per_endpoint = getattr(args, 'response_cache', None)
+        if not ttl_per_endpoint:
+            return None
+        return cls(
+            {endpoint: float(ttl) for endpoint, ttl in ttl_per_endpoint.items()},
+            max_size=getattr(args, 'response_cache_size', 1000),
+            invalidate_on=getattr(
+                args, 'response_cache_invalidate_on', ['/index', '/update', '/delete']
+            ),
+        )
+
+    def is_cached(self, endpoint: str) -> bool:
+        """
+        Check if the responses of an endpoint are cached
+
+        :param endpoint: the endpoint of the request
+        :return: True if the endpoint is cached
+        """
+        return endpoint in self.ttl_per_endpoint
+
+    @staticmethod
+    def get_key(request: DataRequest) -> Tuple[bytes, List[str]]:
+        """
+        Compute the cache key of a request, the docs are hashed in their serialized form without their ids and the ids
+        of their parents
+
+        :param request: the request received from the client
+        :return: the digest of the endpoint, the parameters and the docs of the request, and the ids of the docs, their
+            chunks and their matches in the order they are serialized
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(request.header.exec_endpoint.encode())
+        digest.update(json.dumps(request.parameters, sort_keys=True).encode())
+        ids = []
+        fields, _ = split_fields(request.to_bytes(), [_DATA_FIELD])
+        for data in fields[_DATA_FIELD]:
+            content, others = split_fields(
+                get_field_payload(data), [_DOCS_FIELD, _DOCS_BYTES_FIELD]
+            )
+            for segment in others:
+                digest.update(segment)
+            for docs in content[_DOCS_FIELD]:
+                ResponseCache._update_with_docs(digest, ids, get_field_payload(docs))
+            if content[_DOCS_BYTES_FIELD]:
+                # the docs are not serialized as protobuf, they are parsed to drop their ids
+                ResponseCache._update_with_docs(
+                    digest,
+                    ids,
+                    request.docs.to_protobuf().SerializePartialToString(),
+                )
+        return digest.digest(), ids
+
+    @staticmethod
+    def _update_with_docs(digest, ids: List[str], docs: memoryview):
+        fields, _ = split_fields(docs, [_DOCUMENT_ARRAY_DOCS_FIELD])
+        for doc in fields[_DOCUMENT_ARRAY_DOCS_FIELD]:
+            ResponseCache._update_with_document(digest, ids, get_field_payload(doc))
+
+    @staticmethod
+    def _update_with_document(digest, ids: List[str], doc: memoryview):
+        fields, others = split_fields(
+            doc, (_ID_FIELD, _PARENT_ID_FIELD) + _NESTED_DOCS_FIELDS
+        )
+        ids.extend(
+            bytes(get_field_payload(field)).decode() for field in fields[_ID_FIELD]
+        )
+        digest.update(_DOCUMENT_START)
+        for segment in others:
+            digest.update(segment)
+        for field_number in _NESTED_DOCS_FIELDS:
+            # the chunks and the matches are hashed in order after the other fields
+            digest.update(bytes([field_number]))
+            for nested in fields[field_number]:
+                ResponseCache._update_with_document(
+                    digest, ids, get_field_payload(nested)
+                )
+        digest.update(_DOCUMENT_END)
+
+    @staticmethod
+    def restore_ids(
+        response: DataRequest, cached_ids: Sequence[str], ids: Sequence[str]
+    ):
+        """
+        Replace the ids of the request a response was cached for by the ids of the request it is returned for
+
+        :param response: the cached response
+        :param cached_ids: the ids of the request the response was cached for, as returned by :meth:`get_key`
+        :param ids: the ids of the request the response is returned for, as returned by :meth:`get_key`
+        """
+        id_map = {
+            cached_id: new_id
+            for cached_id, new_id in zip(cached_ids, ids)
+            if cached_id != new_id
+        }
+        if not id_map:
+            return
+
+        def _restore(docs: DocumentArray):
+            for doc in docs:
+                doc.id = id_map.get(doc.id, doc.id)
+                if doc.parent_id:
+                    doc.parent_id = id_map.get(doc.parent_id, doc.parent_id)
+                _restore(doc.chunks)
+                _restore(doc.matches)
+
+        docs = response.docs
+        _restore(docs)
+        response.data.docs = docs
+
+    def get(self, key: bytes) -> Optional[Tuple[bytes, List[str]]]:
+        """
+        Get the response cached under a key
+
+        :param key: the key of the request
+        :return: the serialized response and the ids of the request it was cached for, or None if it is not cached or
+            expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1], entry[2]
+
+    def put(
+        self,
+        key: bytes,
+        endpoint: str,
+        response: DataRequest,
+        metadatas: Iterable[Mapping] = (),
+        generation: Optional[int] = None,
+        ids: Sequence[str] = (),
+    ):
+        """
+        Cache a successful response
+
+        :param key: the key of the request
+        :param endpoint: the endpoint of the request
+        :param response: the response to cache
+        :param metadatas: the metadata returned with the partial responses, a response is not cached if any of them
+            flags an error
+        :param generation: the :attr:`generation` when the request started, the response is not cached if the indexed
+            data was changed since
+        :param ids: the ids of the docs of the request, as returned by :meth:`get_key`
+        """
+        if response.header.status.code == jina_pb2.StatusProto.ERROR:
+            return
+        if any('is-error' in metadata for metadata in metadatas):
+            return
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = (
+            time.monotonic() + self.ttl_per_endpoint[endpoint],
+            response.to_bytes(),
+            list(ids),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, endpoint: str):
+        """
+        Drop all the cached responses if the endpoint changes the indexed data
+
+        :param endpoint: the endpoint of the request
+        """
+        if endpoint not in self.invalidate_on:
+            return
+        self.generation += 1
+        if self._entries:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def get_stats(self) -> Dict:
+        """
+        Returns the cache statistics
+
+        :return: dict with the hit, miss, eviction and invalidation counts and the number of cached responses
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'size': len(self._entries),
+        }
@@ -53,6 +53,8 @@ class WebSocketGatewayRuntime(GatewayRuntime):
         uvicorn_kwargs = self.args.uvicorn_kwargs or {}
         self._set_topology_graph()
         self._set_connection_pool()
+        self._set_response_cache()
+        self._set_admission_controller()
         self._server = UviServer(
             config=Config(
                 app=extend_rest_interface(
@@ -61,6 +63,8 @@ class WebSocketGatewayRuntime(GatewayRuntime):
                         topology_graph=self._topology_graph,
                         connection_pool=self._connection_pool,
                         logger=self.logger,
+                        response_cache=self._response_cache,
+                        admission_controller=self._admission_controller,
                     )
                 ),
                 host=__default_host__,
@@ -75,6 +79,7 @@ class WebSocketGatewayRuntime(GatewayRuntime):
     async def async_run_forever(self):
         """Running method of ther server."""
         self._connection_pool.start()
+        self._start_stats_logging()
         await self._server.serve()
 
     async def _wait_for_cancel(self):
@@ -87,8 +92,11 @@ class WebSocketGatewayRuntime(GatewayRuntime):
 
     async def async_teardown(self):
         """Shutdown the server."""
+        self._stop_stats_logging()
         await self._server.shutdown()
         await self._connection_pool.close()
+        self._log_response_cache_stats()
+        self._log_admission_stats()
 
     async def async_cancel(self):
         """Stop the server."""
@@ -1,5 +1,5 @@
 import argparse
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from jina.importer import ImportExtensions
 from jina.logging.logger import JinaLogger
@@ -8,6 +8,8 @@ from jina.types.request.data import DataRequest
 if TYPE_CHECKING:
     from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
     from jina.serve.networking import GrpcConnectionPool
+    from jina.serve.runtimes.gateway.response_cache import ResponseCache
+    from jina.serve.runtimes.gateway.admission import AdmissionController
 
 
 def get_fastapi_app(
@@ -15,6 +17,8 @@ def get_fastapi_app(
     topology_graph: 'TopologyGraph',
     connection_pool: 'GrpcConnectionPool',
     logger: 'JinaLogger',
+    response_cache: Optional['ResponseCache'] = None,
+    admission_controller: Optional['AdmissionController'] = None,
 ):
     """
     Get the app from FastAPI as the Websocket interface.
@@ -23,6 +27,8 @@ def get_fastapi_app(
     :param topology_graph: topology graph that manages the logic of sending to the proper executors.
     :param connection_pool: Connection Pool to handle multiple replicas and sending to different of them
     :param logger: Jina logger.
+    :param response_cache: Optional cache of the responses of idempotent endpoints.
+    :param admission_controller: Optional caps of the requests in flight.
     :return: fastapi app
     """
 
@@ -56,7 +62,10 @@ def get_fastapi_app(
     streamer = RequestStreamer(
         args=args,
         request_handler=handle_request(
-            graph=topology_graph, connection_pool=connection_pool
+            graph=topology_graph,
+            connection_pool=connection_pool,
+            response_cache=response_cache,
+            admission_controller=admission_controller,
         ),
         result_handler=handle_result,
     )
@@ -65,11 +74,16 @@ def get_fastapi_app(
     @app.on_event('shutdown')
     async def _shutdown():
         await connection_pool.close()
+        prefetch_stats = streamer.get_prefetch_stats()
+        if prefetch_stats:
+            logger.debug(f'Adaptive prefetch stats: {prefetch_stats}')
 
     @app.websocket('/')
     async def websocket_endpoint(websocket: WebSocket):
 
         await manager.connect(websocket)
+        if admission_controller is not None and websocket.client:
+            admission_controller.set_client(websocket.client.host)
 
         async def req_iter():
             async for request_bytes in websocket.iter_bytes():
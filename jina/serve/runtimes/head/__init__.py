@@ -12,9 +12,18 @@ import grpc
 
 from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime
 from jina.serve.runtimes.request_handlers.data_request_handler import DataRequestHandler
-from jina.serve.networking import create_connection_pool, K8sGrpcConnectionPool
+from jina.serve.networking import (
+    create_connection_pool,
+    GrpcConnectionPool,
+    HealthPolicy,
+    HedgePolicy,
+    K8sGrpcConnectionPool,
+)
+from jina.serve.stream import RequestStreamer
+from jina.serve.stream.helper import StreamedCallContext
 from jina.enums import PollingType
 from jina.proto import jina_pb2_grpc
+from jina.proto.serializer import DataRequestCompressor
 from jina.types.request.control import ControlRequest
 from jina.types.request.data import DataRequest
 from jina import __default_executor__
@@ -50,6 +59,13 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             logger=self.logger,
             k8s_connection_pool=args.k8s_connection_pool,
             k8s_namespace=args.k8s_namespace,
+            load_balancing=args.load_balancing,
+            compressor=DataRequestCompressor.from_args(args),
+            health_policy=HealthPolicy.from_args(args),
+            hedge_policy=HedgePolicy.from_args(args),
+            channels_per_replica=args.channels_per_replica,
+            stream_window=args.stream_window,
+            uds_dir=getattr(args, 'uds_dir', None),
         )
 
         polling = getattr(args, 'polling', self.DEFAULT_POLLING.name)
@@ -118,6 +134,15 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
                 deployment='uses_after', address=self.uses_after_address
             )
         self._has_uses = args.uses is not None and args.uses != __default_executor__
+        self._compressor = DataRequestCompressor.from_args(args)
+        self._merge_top_k_by = getattr(args, 'merge_top_k_by', None)
+        self._merge_top_k_descending = getattr(args, 'merge_top_k_descending', False)
+        self._request_streamer = RequestStreamer(
+            args=args,
+            request_handler=self._process_streamed_data,
+            result_handler=lambda response: response,
+            logger=self.logger,
+        )
 
     def _default_polling_dict(self, default_polling):
         return defaultdict(
@@ -128,10 +153,7 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
     async def async_setup(self):
         """ Wait for the GRPC server to start """
         self._grpc_server = grpc.aio.server(
-            options=[
-                ('grpc.max_send_message_length', -1),
-                ('grpc.max_receive_message_length', -1),
-            ]
+            options=GrpcConnectionPool.get_default_grpc_options()
         )
 
         jina_pb2_grpc.add_JinaSingleDataRequestRPCServicer_to_server(
@@ -141,9 +163,21 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
         jina_pb2_grpc.add_JinaControlRequestRPCServicer_to_server(
             self, self._grpc_server
         )
+        jina_pb2_grpc.add_JinaRPCServicer_to_server(self, self._grpc_server)
         bind_addr = f'0.0.0.0:{self.args.port_in}'
         self._grpc_server.add_insecure_port(bind_addr)
         self.logger.debug(f'Start listening on {bind_addr}')
+        uds_dir = getattr(self.args, 'uds_dir', None)
+        if (
+            uds_dir
+            and not getattr(self.args, 'disable_uds', False)
+            and os.path.isdir(uds_dir)
+        ):
+            # runtimes of the same Flow connect through the socket instead of TCP, a containerized runtime can not
+            # see the directory of the Flow and only listens on TCP
+            uds_addr = GrpcConnectionPool.get_uds_address(self.args.port_in, uds_dir)
+            self._grpc_server.add_insecure_port(uds_addr)
+            self.logger.debug(f'Start listening on {uds_addr}')
         await self._grpc_server.start()
 
     async def async_run_forever(self):
@@ -160,7 +194,12 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
     async def async_teardown(self):
         """Close the connection pool"""
         await self.async_cancel()
+        self.logger.debug(
+            f'Connection stats: {self.connection_pool.get_connection_stats()}'
+        )
         await self.connection_pool.close()
+        if self._compressor:
+            self.logger.debug(f'Compression stats: {self._compressor.get_stats()}')
 
     async def process_single_data(self, request: DataRequest, context) -> DataRequest:
         """
@@ -184,6 +223,8 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             endpoint = dict(context.invocation_metadata()).get('endpoint')
             response, metadata = await self._handle_data_request(requests, endpoint)
             context.set_trailing_metadata(metadata.items())
+            if self._compressor:
+                response = self._compressor.compress(response)
             return response
         except (RuntimeError, Exception) as ex:
             self.logger.error(
@@ -194,6 +235,30 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             )
             raise
 
+    async def Call(self, request_iterator, context):
+        """
+        Process the data requests pipelined over a bidirectional stream, every response is sent back as soon as it is ready
+
+        :param request_iterator: the data requests sent over the stream
+        :param context: grpc context
+        :yield: the response requests, in the order they are ready
+        """
+        async for response in self._request_streamer.stream(request_iterator):
+            yield response
+
+    def _process_streamed_data(self, request: DataRequest) -> 'asyncio.Future':
+        async def _process():
+            try:
+                return await self.process_single_data(
+                    request, StreamedCallContext(request)
+                )
+            except (RuntimeError, Exception) as ex:
+                # the other requests on the stream go on, the error is sent back in the response
+                request.add_exception(ex)
+                return request
+
+        return asyncio.ensure_future(_process())
+
     async def process_control(self, request: ControlRequest, *args) -> ControlRequest:
         """
         Process the received control request and return the input request
@@ -279,6 +344,10 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             ) = await self.connection_pool.send_requests_once(
                 worker_results, deployment='uses_after'
             )
+        elif len(worker_results) > 1 and self._merge_top_k_by:
+            DataRequestHandler.reduce_requests_top_k(
+                worker_results, self._merge_top_k_by, self._merge_top_k_descending
+            )
         elif len(worker_results) > 1:
             DataRequestHandler.reduce_requests(worker_results)
 
@@ -1,11 +1,16 @@
+import heapq
+import itertools
 import warnings
+from operator import itemgetter
 from typing import Dict, List, TYPE_CHECKING, Optional
 
+import numpy as np
 from docarray import DocumentArray
 
 from jina import __default_endpoint__
 from jina.excepts import ExecutorFailToLoad, BadConfigSource
 from jina.serve.executors import BaseExecutor
+from jina.serve.runtimes.request_handlers.dynamic_batching import DynamicBatchQueue
 from jina.types.request.data import DataRequest
 
 if TYPE_CHECKING:
@@ -30,6 +35,8 @@ class DataRequestHandler:
         self.logger = logger
         self._is_closed = False
         self._load_executor()
+        self._executor._start_process_pool()
+        self._batch_queues: Dict[str, DynamicBatchQueue] = {}
 
     def _load_executor(self):
         """Load the executor to this runtime, specified by ``uses`` CLI argument."""
@@ -57,7 +64,8 @@ class DataRequestHandler:
 
     @staticmethod
     def _parse_params(parameters: Dict, executor_name: str):
-        parsed_params = parameters
+        # the parameters of the request are cached, do not change them in-place
+        parsed_params = dict(parameters)
         specific_parameters = parameters.get(executor_name, None)
         if specific_parameters:
             parsed_params.update(**specific_parameters)
@@ -86,15 +94,23 @@ class DataRequestHandler:
         )
 
         # executor logic
-        return_data = await self._executor.__acall__(
-            req_endpoint=requests[0].header.exec_endpoint,
-            docs=docs,
-            parameters=params,
-            docs_matrix=DataRequestHandler.get_docs_matrix_from_request(
-                requests,
-                field='docs',
-            ),
+        batch_queue = (
+            self._get_batch_queue(requests[0].header.exec_endpoint)
+            if len(requests) == 1
+            else None
         )
+        if batch_queue:
+            return_data = await batch_queue.push(docs, params)
+        else:
+            return_data = await self._executor.__acall__(
+                req_endpoint=requests[0].header.exec_endpoint,
+                docs=docs,
+                parameters=params,
+                docs_matrix=DataRequestHandler.get_docs_matrix_from_request(
+                    requests,
+                    field='docs',
+                ),
+            )
         # assigning result back to request
         if return_data is not None:
             if isinstance(return_data, DocumentArray):
@@ -119,6 +135,38 @@ class DataRequestHandler:
 
         return requests[0]
 
+    def _get_batch_queue(self, endpoint: str) -> Optional[DynamicBatchQueue]:
+        if endpoint not in self._executor.requests:
+            endpoint = __default_endpoint__
+        func = self._executor.requests[endpoint]
+        if not getattr(func, 'dynamic_batch', None):
+            return None
+
+        if endpoint not in self._batch_queues:
+
+            async def _process(docs: DocumentArray, parameters: Dict):
+                return await self._executor.__acall__(
+                    req_endpoint=endpoint,
+                    docs=docs,
+                    parameters=parameters,
+                    docs_matrix=[docs] if docs else None,
+                )
+
+            self._batch_queues[endpoint] = DynamicBatchQueue(
+                _process, func.dynamic_batch, func.max_wait_ms
+            )
+        return self._batch_queues[endpoint]
+
+    def get_batching_stats(self) -> Dict[str, Dict]:
+        """Returns the dynamic batching statistics of every endpoint
+
+        :return: dict mapping the endpoints to their batch size and queue wait histograms
+        """
+        return {
+            endpoint: batch_queue.get_stats()
+            for endpoint, batch_queue in self._batch_queues.items()
+        }
+
     @staticmethod
     def replace_docs(request: List['DataRequest'], docs: 'DocumentArray') -> None:
         """Replaces the docs in a message with new Documents.
@@ -156,6 +204,7 @@ class DataRequestHandler:
         """ Close the data request handler, by closing the executor """
         if not self._is_closed:
             self._executor.close()
+            self._executor._close_pools()
             self._is_closed = True
 
     @staticmethod
@@ -279,3 +328,76 @@ class DataRequestHandler:
         DataRequestHandler.replace_parameters(requests[0], params)
 
         return requests[0]
+
+    @staticmethod
+    def merge_top_k(
+        docs_matrix: List['DocumentArray'],
+        score_name: str,
+        top_k: Optional[int] = None,
+        descending: bool = False,
+    ) -> Optional['DocumentArray']:
+        """
+        Merges the matches that every DocumentArray holds for the same Documents into the first DocumentArray.
+
+        The matches of each Document are merged with a k-way heap merge by the value of the score `score_name` and
+        cut to `top_k`, so the result is sorted. Matches without the score are placed last.
+
+        :param docs_matrix: List of DocumentArrays holding the same Documents with different matches, e.g. the
+            results of all shards
+        :param score_name: the name of the score to sort the matches by, e.g. `cosine`
+        :param top_k: the number of matches to keep per Document, None keeps all matches
+        :param descending: if set, higher scores are better
+        :return: the first DocumentArray with the merged matches
+        """
+        if not docs_matrix:
+            return None
+        da = docs_matrix[0]
+        sign = -1 if descending else 1
+        for doc in da:
+            sorted_matches = []
+            for docs in docs_matrix:
+                matches = docs[doc.id].matches if doc.id in docs else None
+                if not matches:
+                    continue
+                scores = sign * np.array(
+                    matches[:, f'scores__{score_name}__value'], dtype=float
+                )
+                scores[np.isnan(scores)] = np.inf
+                order = np.argsort(scores, kind='stable')
+                sorted_matches.append(
+                    [(scores[i], matches[int(i)]) for i in order[:top_k]]
+                )
+            merged = heapq.merge(*sorted_matches, key=itemgetter(0))
+            doc.matches = [m for _, m in itertools.islice(merged, top_k)]
+        return da
+
+    @staticmethod
+    def reduce_requests_top_k(
+        requests: List['DataRequest'], score_name: str, descending: bool = False
+    ) -> 'DataRequest':
+        """
+        Reduces a list of requests holding the results of different shards into one request object, keeping the
+        `top_k` matches given by the parameters of each Document. Changes are applied to the first request object
+        in-place.
+
+        :param requests: List of DataRequest objects
+        :param score_name: the name of the score to sort the matches by, e.g. `cosine`
+        :param descending: if set, higher scores are better
+        :return: the resulting DataRequest
+        """
+        docs_matrix = DataRequestHandler.get_docs_matrix_from_request(
+            requests, field='docs'
+        )
+        top_k = requests[0].parameters.get('top_k')
+        da = DataRequestHandler.merge_top_k(
+            docs_matrix,
+            score_name,
+            int(top_k) if top_k is not None else None,
+            descending,
+        )
+        DataRequestHandler.replace_docs(requests[0], da)
+
+        params = DataRequestHandler.get_parameters_dict_from_request(requests)
+        DataRequestHandler.replace_parameters(requests[0], params)
+
+        return requests[0]
@@ -0,0 +1,160 @@
+import asyncio
+import bisect
+import json
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Union
+
+from docarray import DocumentArray
+
+
+class Histogram:
+    """A histogram with fixed bucket upper bounds
+
+    :param bounds: the sorted upper bounds of the buckets, values above the last bound fall into `+Inf`
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """
+        Record a value
+
+        :param value: the observed value
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the histogram as a dict
+
+        :return: dict with the count of every bucket, the total count and the sum of all observed values
+        """
+        buckets = {str(bound): count for bound, count in zip(self.bounds, self.counts)}
+        buckets['+Inf'] = self.counts[-1]
+        return {'buckets': buckets, 'count': self.count, 'sum': self.sum}
+
+
+class _PendingBatch:
+    def __init__(self, parameters: Dict):
+        self.parameters = parameters
+        self.docs: List[DocumentArray] = []
+        self.futures: List[asyncio.Future] = []
+        self.arrival_times: List[float] = []
+        self.size = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def add(self, docs: DocumentArray, future: asyncio.Future):
+        self.docs.append(docs)
+        self.futures.append(future)
+        self.arrival_times.append(time.perf_counter())
+        self.size += len(docs)
+
+
+class DynamicBatchQueue:
+    """Merges the Documents of concurrently arriving requests into one call of an Executor endpoint.
+
+    A batch is flushed as soon as it holds `max_batch_size` Documents or its first request waited `max_wait_ms`.
+    Only requests with the same parameters are batched together.
+
+    :param process: coroutine function calling the endpoint with the merged `docs` and the `parameters`
+    :param max_batch_size: the number of Documents that triggers a flush
+    :param max_wait_ms: the maximum time in milliseconds a request waits for other requests to join its batch
+    """
+
+    BATCH_SIZE_BOUNDS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+    QUEUE_WAIT_MS_BOUNDS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+    def __init__(
+        self,
+        process: Callable[[DocumentArray, Dict], Awaitable],
+        max_batch_size: int,
+        max_wait_ms: float,
+    ):
+        self._process = process
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._pending: Dict[str, _PendingBatch] = {}
+        self._batch_size_histogram = Histogram(self.BATCH_SIZE_BOUNDS)
+        self._queue_wait_histogram = Histogram(self.QUEUE_WAIT_MS_BOUNDS)
+
+    async def push(
+        self, docs: DocumentArray, parameters: Dict
+    ) -> Optional[Union[DocumentArray, Dict]]:
+        """
+        Add the Documents of one request to the current batch and wait for the batch to be processed
+
+        :param docs: the Documents of the request
+        :param parameters: the parameters of the request
+        :return: the part of the endpoint result belonging to the given Documents
+        """
+        loop = asyncio.get_running_loop()
+        key = json.dumps(parameters, sort_keys=True)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(parameters)
+            batch.timer = loop.call_later(self._max_wait, self._flush, key)
+            self._pending[key] = batch
+
+        future = loop.create_future()
+        batch.add(docs, future)
+        if batch.size >= self._max_batch_size:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: str):
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+        asyncio.create_task(self._run(batch))
+
+    async def _run(self, batch: _PendingBatch):
+        flush_time = time.perf_counter()
+        for arrival_time in batch.arrival_times:
+            self._queue_wait_histogram.observe((flush_time - arrival_time) * 1000)
+        self._batch_size_histogram.observe(batch.size)
+
+        merged = DocumentArray([d for docs in batch.docs for d in docs])
+        try:
+            return_data = await self._process(merged, batch.parameters)
+            if isinstance(return_data, DocumentArray):
+                if len(return_data) != len(merged):
+                    raise ValueError(
+                        f'an endpoint with dynamic batching must return one Document per input Document, '
+                        f'but got {len(return_data)} Documents for {len(merged)} inputs'
+                    )
+                results = []
+                offset = 0
+                for docs in batch.docs:
+                    results.append(return_data[offset : offset + len(docs)])
+                    offset += len(docs)
+            else:
+                # Documents are changed in-place or the endpoint returned a dict,
+                # which is valid for every request of the batch
+                results = [return_data] * len(batch.futures)
+        except Exception as ex:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(ex)
+            return
+
+        for future, result in zip(batch.futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    def get_stats(self) -> Dict:
+        """
+        Returns the batching statistics
+
+        :return: dict with the histograms of the batch sizes and of the queue wait times in milliseconds
+        """
+        return {
+            'batch_size': self._batch_size_histogram.to_dict(),
+            'queue_wait_ms': self._queue_wait_histogram.to_dict(),
+        }
@@ -1,15 +1,22 @@
 import argparse
 import asyncio
+import json
 import multiprocessing
+import os
 import threading
 from abc import ABC
-from typing import Optional, Union, List
+from datetime import datetime
+from typing import Dict, Optional, Union, List
 
 import grpc
 
 from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime
 from jina.serve.runtimes.request_handlers.data_request_handler import DataRequestHandler
 from jina.proto import jina_pb2_grpc
+from jina.serve.networking import GrpcConnectionPool
+from jina.serve.stream import RequestStreamer
+from jina.serve.stream.helper import StreamedCallContext
+from jina.proto.serializer import DataRequestCompressor
 from jina.types.request.control import ControlRequest
 from jina.types.request.data import DataRequest
 
@@ -34,16 +41,34 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
 
         # Keep this initialization order, otherwise readiness check is not valid
         self._data_request_handler = DataRequestHandler(args, self.logger)
+        self._fused_request_handlers = self._load_fused_executors(args)
+        self._compressor = DataRequestCompressor.from_args(args)
+        self._request_streamer = RequestStreamer(
+            args=args,
+            request_handler=self._process_streamed_data,
+            result_handler=lambda response: response,
+            logger=self.logger,
+        )
+
+    def _load_fused_executors(
+        self, args: argparse.Namespace
+    ) -> Dict[str, DataRequestHandler]:
+        from jina.parsers import set_pod_parser
+
+        fused_executors = json.loads(getattr(args, 'fused_executors', '{}'))
+        return {
+            deployment_name: DataRequestHandler(
+                set_pod_parser().parse_args(executor_args), self.logger
+            )
+            for deployment_name, executor_args in fused_executors.items()
+        }
 
     async def async_setup(self):
         """
         Wait for the GRPC server to start
         """
         self._grpc_server = grpc.aio.server(
-            options=[
-                ('grpc.max_send_message_length', -1),
-                ('grpc.max_receive_message_length', -1),
-            ]
+            options=GrpcConnectionPool.get_default_grpc_options()
         )
 
         jina_pb2_grpc.add_JinaSingleDataRequestRPCServicer_to_server(
@@ -53,9 +78,21 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
         jina_pb2_grpc.add_JinaControlRequestRPCServicer_to_server(
             self, self._grpc_server
         )
+        jina_pb2_grpc.add_JinaRPCServicer_to_server(self, self._grpc_server)
         bind_addr = f'0.0.0.0:{self.args.port_in}'
         self.logger.debug(f'Start listening on {bind_addr}')
         self._grpc_server.add_insecure_port(bind_addr)
+        uds_dir = getattr(self.args, 'uds_dir', None)
+        if (
+            uds_dir
+            and not getattr(self.args, 'disable_uds', False)
+            and os.path.isdir(uds_dir)
+        ):
+            # runtimes of the same Flow connect through the socket instead of TCP, a containerized runtime can not
+            # see the directory of the Flow and only listens on TCP
+            uds_addr = GrpcConnectionPool.get_uds_address(self.args.port_in, uds_dir)
+            self._grpc_server.add_insecure_port(uds_addr)
+            self.logger.debug(f'Start listening on {uds_addr}')
         await self._grpc_server.start()
 
     async def async_run_forever(self):
@@ -75,6 +112,13 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
         """Close the data request handler"""
         await self.async_cancel()
         self._data_request_handler.close()
+        for handler in self._fused_request_handlers.values():
+            handler.close()
+        batching_stats = self._data_request_handler.get_batching_stats()
+        if batching_stats:
+            self.logger.debug(f'Dynamic batching stats: {batching_stats}')
+        if self._compressor:
+            self.logger.debug(f'Compression stats: {self._compressor.get_stats()}')
 
     async def process_single_data(self, request: DataRequest, context) -> DataRequest:
         """
@@ -94,11 +138,22 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
         :param context: grpc context
         :returns: the response request
         """
+        if requests[0].is_expired:
+            # do not spend executor time on requests the client gave up on already
+            self.logger.debug(
+                f'dropping request {requests[0].header.request_id}, its deadline passed'
+            )
+            requests[0].set_timeout_error(self.args.name or 'the executor')
+            context.set_trailing_metadata((('is-error', 'true'),))
+            return requests[0]
+
         try:
             if self.logger.debug_enabled:
                 self._log_data_request(requests[0])
 
-            return await self._data_request_handler.handle(requests=requests)
+            response = await self._data_request_handler.handle(requests=requests)
+            if self._fused_request_handlers:
+                response = await self._handle_fused(response, context)
         except (RuntimeError, Exception) as ex:
             self.logger.error(
                 f'{ex!r}' + f'\n add "--quiet-error" to suppress the exception details'
@@ -109,7 +164,52 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
 
             requests[0].add_exception(ex, self._data_request_handler._executor)
             context.set_trailing_metadata((('is-error', 'true'),))
-            return requests[0]
+            response = requests[0]
+
+        return self._compressor.compress(response) if self._compressor else response
+
+    async def Call(self, request_iterator, context):
+        """
+        Process the data requests pipelined over a bidirectional stream, every response is sent back as soon as it is ready
+
+        :param request_iterator: the data requests sent over the stream
+        :param context: grpc context
+        :yield: the response requests, in the order they are ready
+        """
+        async for response in self._request_streamer.stream(request_iterator):
+            yield response
+
+    def _process_streamed_data(self, request: DataRequest) -> 'asyncio.Future':
+        return asyncio.ensure_future(
+            self.process_single_data(request, StreamedCallContext(request))
+        )
+
+    async def _handle_fused(self, request: DataRequest, context) -> DataRequest:
+        # the Executors of the fused Deployments run back to back on the same request, each one reports its route
+        for deployment_name, handler in self._fused_request_handlers.items():
+            start_time = datetime.utcnow()
+            failed = False
+            try:
+                request = await handler.handle(requests=[request])
+            except (RuntimeError, Exception) as ex:
+                self.logger.error(
+                    f'{ex!r}'
+                    + f'\n add "--quiet-error" to suppress the exception details'
+                    if not self.args.quiet_error
+                    else '',
+                    exc_info=not self.args.quiet_error,
+                )
+                request.add_exception(ex, handler._executor)
+                context.set_trailing_metadata((('is-error', 'true'),))
+                failed = True
+            route = request.routes.add()
+            route.executor = deployment_name
+            route.start_time.FromDatetime(start_time)
+            route.end_time.GetCurrentTime()
+            if failed:
+                route.status.CopyFrom(request.header.status)
+                break
+        return request
 
     async def process_control(self, request: ControlRequest, *args) -> ControlRequest:
         """
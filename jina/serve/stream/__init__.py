@@ -1,5 +1,6 @@
 import asyncio
 import argparse
+from collections import deque
 from typing import (
     List,
     Union,
@@ -9,9 +10,11 @@ from typing import (
     Callable,
     Optional,
     Awaitable,
+    Dict,
+    Deque,
 )
 
-from jina.serve.stream.helper import AsyncRequestsIterator
+from jina.serve.stream.helper import AsyncRequestsIterator, AdaptivePrefetchWindow
 from jina.logging.logger import JinaLogger
 
 __all__ = ['RequestStreamer']
@@ -49,32 +52,73 @@ class RequestStreamer:
         self.args = args
         self.logger = logger or JinaLogger(self.__class__.__name__, **vars(args))
         self._prefetch = getattr(self.args, 'prefetch', 0)
+        # one window for all the streams, it bounds the requests in flight through the Flow
+        self._prefetch_window = (
+            AdaptivePrefetchWindow(max_window=self._prefetch)
+            if getattr(self.args, 'prefetch_adaptive', False)
+            else None
+        )
+        self._results_in_order = getattr(self.args, 'results_in_order', False)
+        self._reorder_buffer_size = getattr(self.args, 'reorder_buffer_size', 100)
         self._request_handler = request_handler
         self._result_handler = result_handler
         self._end_of_iter_handler = end_of_iter_handler
 
-    async def stream(self, request_iterator, *args) -> AsyncIterator['Request']:
+    async def stream(
+        self, request_iterator, *args, prefetch: Optional[int] = None
+    ) -> AsyncIterator['Request']:
         """
         stream requests from client iterator and stream responses back.
 
         :param request_iterator: iterator of requests
         :param args: positional arguments
+        :param prefetch: Optional number of requests to prefetch from this iterator, overriding the prefetch from CLI
         :yield: responses from Executors
         """
-        async_iter: AsyncIterator = (
-            self._stream_requests_with_prefetch(request_iterator, self._prefetch)
-            if self._prefetch > 0
-            else self._stream_requests(request_iterator)
-        )
+        if self._results_in_order:
+            async_iter: AsyncIterator = self._stream_requests_in_order(
+                request_iterator,
+                min(prefetch, self._reorder_buffer_size)
+                if prefetch
+                else self._reorder_buffer_size,
+                self._prefetch_window,
+            )
+        elif prefetch:
+            async_iter: AsyncIterator = self._stream_requests_with_prefetch(
+                request_iterator, prefetch
+            )
+        elif self._prefetch_window is not None:
+            async_iter: AsyncIterator = self._stream_requests(
+                request_iterator, self._prefetch_window
+            )
+        else:
+            async_iter: AsyncIterator = (
+                self._stream_requests_with_prefetch(request_iterator, self._prefetch)
+                if self._prefetch > 0
+                else self._stream_requests(request_iterator)
+            )
 
         async for response in async_iter:
             yield response
 
+    def get_prefetch_stats(self) -> Dict:
+        """
+        Returns the state of the adaptive prefetch window
+
+        :return: dict with the window and the observed latency, empty if the prefetch is not adaptive
+        """
+        if self._prefetch_window is None:
+            return {}
+        return self._prefetch_window.get_stats()
+
     async def _stream_requests(
-        self, request_iterator: Union[Iterator, AsyncIterator]
+        self,
+        request_iterator: Union[Iterator, AsyncIterator],
+        prefetch_window: Optional[AdaptivePrefetchWindow] = None,
     ) -> AsyncIterator:
-        """Implements request and response handling without prefetching
+        """Implements request and response handling without prefetching, or with an adaptive prefetch window
         :param request_iterator: requests iterator from Client
+        :param prefetch_window: Optional window bounding the requests in flight
         :yield: responses
         """
         result_queue = asyncio.Queue()
@@ -111,8 +155,12 @@ class RequestStreamer:
             5. Set `end_of_iter` event
             """
             async for request in AsyncRequestsIterator(iterator=request_iterator):
+                if prefetch_window is not None:
+                    await prefetch_window.acquire()
                 requests_to_handle.count += 1
                 future: 'asyncio.Future' = self._request_handler(request=request)
+                if prefetch_window is not None:
+                    prefetch_window.track(future)
                 future.add_done_callback(callback)
             if self._end_of_iter_handler is not None:
                 self._end_of_iter_handler()
@@ -134,6 +182,69 @@ class RequestStreamer:
             except self._EndOfStreaming:
                 pass
 
+    async def _stream_requests_in_order(
+        self,
+        request_iterator: Union[Iterator, AsyncIterator],
+        buffer_size: int,
+        prefetch_window: Optional[AdaptivePrefetchWindow] = None,
+    ) -> AsyncIterator:
+        """Implements request and response handling yielding the responses in the order of the requests
+
+        The futures of the requests are kept in a buffer by request index, the response of the oldest request is yielded
+        as soon as it is done and the responses completing before it are held back. At most `buffer_size` requests are
+        in flight or held back, the next request is not read from the iterator until the oldest one is yielded.
+
+        :param request_iterator: requests iterator from Client
+        :param buffer_size: the maximum number of requests in flight or held back
+        :param prefetch_window: Optional window bounding the requests in flight through the Flow
+        :yield: responses
+        """
+        buffer: Deque['asyncio.Future'] = deque()
+        buffer_slots = asyncio.Semaphore(max(1, buffer_size))
+        request_added = asyncio.Event()
+        end_of_iter = asyncio.Event()
+
+        async def iterate_requests() -> None:
+            try:
+                async for request in AsyncRequestsIterator(iterator=request_iterator):
+                    await buffer_slots.acquire()
+                    if prefetch_window is not None:
+                        await prefetch_window.acquire()
+                    future: 'asyncio.Future' = self._request_handler(request=request)
+                    if prefetch_window is not None:
+                        prefetch_window.track(future)
+                    buffer.append(future)
+                    request_added.set()
+                if self._end_of_iter_handler is not None:
+                    self._end_of_iter_handler()
+            finally:
+                end_of_iter.set()
+                request_added.set()
+
+        iterate_task = asyncio.create_task(iterate_requests())
+        try:
+            while True:
+                if not buffer:
+                    if end_of_iter.is_set():
+                        # the responses of the requests read before the iterator failed are yielded first
+                        if iterate_task.done() and not iterate_task.cancelled():
+                            ex = iterate_task.exception()
+                            if ex is not None:
+                                raise ex
+                        break
+                    # the requests are read concurrently, so that a client waiting for a response before sending the
+                    # next request is served
+                    request_added.clear()
+                    await request_added.wait()
+                    continue
+                response = await buffer[0]
+                buffer.popleft()
+                buffer_slots.release()
+                yield self._result_handler(response)
+        finally:
+            # the client went away or a request failed, no more request is read from it
+            iterate_task.cancel()
+
     async def _stream_requests_with_prefetch(
         self, request_iterator: Union[Iterator, AsyncIterator], prefetch: int
     ):
@@ -1,7 +1,13 @@
-from typing import Iterator, AsyncIterator, Union
+import asyncio
+import math
+import time
+from typing import Dict, Iterator, AsyncIterator, Optional, Tuple, Union, TYPE_CHECKING
 
 from jina.helper import get_or_reuse_loop
 
+if TYPE_CHECKING:
+    from jina.types.request.data import DataRequest
+
 
 class AsyncRequestsIterator:
     """Iterator to allow async iteration of blocking/non-blocking iterator from the Client"""
@@ -52,3 +58,131 @@ class AsyncRequestsIterator:
             request = await self.iterator.__anext__()
 
         return request
+
+
+class StreamedCallContext:
+    """Stands in for the grpc context of a unary call when a request is received over a bidirectional stream, the
+    stream has no metadata per request"""
+
+    def __init__(self, request: 'DataRequest') -> None:
+        """
+        :param request: the request received over the stream
+        """
+        self._endpoint = request.header.exec_endpoint
+
+    def invocation_metadata(self) -> Tuple[Tuple[str, str]]:
+        """
+        The endpoint of the request is read from its header
+
+        :return: the metadata a unary call of the request would get
+        """
+        return (('endpoint', self._endpoint),)
+
+    def set_trailing_metadata(self, metadata) -> None:
+        """
+        Ignored, the receiver reads the errors from the status of the response
+
+        :param metadata: the metadata of the response
+        """
+        pass
+
+
+class AdaptivePrefetchWindow:
+    """Bounds the requests in flight with a window tuned from their observed latency.
+
+    Like TCP Vegas, the latency is compared to the lowest latency observed, which is the latency of a request that
+    does not queue anywhere in the Flow. The window grows while the latency stays within `tolerance` of it and shrinks
+    in proportion once the requests start queuing. The window moves by one step per round trip, so that it does not
+    overshoot before the latency of the requests it let in is known.
+    """
+
+    def __init__(
+        self,
+        max_window: int = 0,
+        initial_window: int = 4,
+        tolerance: float = 1.5,
+    ) -> None:
+        """
+        :param max_window: the upper bound of the window, 0 leaves it unbounded
+        :param initial_window: the window before any latency was observed
+        :param tolerance: how much the latency may grow over the lowest latency before the window shrinks
+        """
+        self._max_window = max_window if max_window > 0 else math.inf
+        self._window = float(min(initial_window, self._max_window))
+        self._tolerance = tolerance
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._min_latency: Optional[float] = None
+        self._capacity_freed: Optional[asyncio.Event] = None
+
+    @property
+    def window(self) -> int:
+        """
+        The number of requests allowed in flight
+
+        :return: the current window
+        """
+        return max(1, int(self._window))
+
+    async def acquire(self) -> None:
+        """
+        Waits until the window has room for one more request
+        """
+        while self._in_flight >= self.window:
+            if self._capacity_freed is None:
+                # created lazily so that it belongs to the running loop
+                self._capacity_freed = asyncio.Event()
+            self._capacity_freed.clear()
+            await self._capacity_freed.wait()
+        self._in_flight += 1
+
+    def track(self, future: 'asyncio.Future') -> None:
+        """
+        Measures the latency of a request admitted by :meth:`acquire`, its room in the window is freed when it is done
+
+        :param future: the future of the response to the request
+        """
+        start = time.perf_counter()
+
+        def _done(f: 'asyncio.Future'):
+            self._release(None if f.cancelled() else time.perf_counter() - start)
+
+        future.add_done_callback(_done)
+
+    def _release(self, latency: Optional[float]) -> None:
+        in_flight = self._in_flight
+        self._in_flight -= 1
+        if self._capacity_freed is not None:
+            self._capacity_freed.set()
+        if latency is None:
+            return
+        if self._latency is None:
+            self._latency = self._min_latency = latency
+        self._latency += (latency - self._latency) * 0.2
+        # the lowest latency drifts up slowly, so that it follows the workload of the Flow when it changes
+        self._min_latency = min(latency, self._min_latency * 1.001)
+        if in_flight < self._window / 2:
+            # the client does not send enough requests to tell if a larger window would help
+            return
+        gradient = 1.0
+        if self._latency > 0:
+            gradient = max(
+                0.5, min(1.0, self._tolerance * self._min_latency / self._latency)
+            )
+        target = self._window * gradient + math.sqrt(self._window)
+        # every response moves the window by a fraction of the step, it moves a whole step per round trip
+        self._window += (target - self._window) / self._window
+        self._window = max(1.0, min(self._max_window, self._window))
+
+    def get_stats(self) -> Dict:
+        """
+        Returns the state of the window
+
+        :return: dict with the window, the requests in flight and the current and lowest latency in milliseconds
+        """
+        return {
+            'window': self.window,
+            'in_flight': self._in_flight,
+            'latency_ms': (self._latency or 0) * 1000,
+            'min_latency_ms': (self._min_latency or 0) * 1000,
+        }
@@ -1,5 +1,6 @@
 import copy
-from typing import Optional, Dict, TypeVar
+import time
+from typing import Optional, Dict, List, TypeVar
 
 from google.protobuf import json_format
 
@@ -76,6 +77,9 @@ class DataRequest(Request):
     A container for serialized :class:`jina_pb2.DataRequestProto` that only triggers deserialization
     and decompression when receives the first read access to its member.
 
+    Accessing the header, the routes or the parameters only deserializes these fields, the serialized docs are kept
+    as they are and forwarded untouched by :meth:`to_bytes` until ``data`` or ``docs`` is accessed.
+
     It overrides :meth:`__getattr__` to provide the same get/set interface as an
     :class:`jina_pb2.DataRequestProto` object.
 
@@ -87,6 +91,11 @@ class DataRequest(Request):
         request: Optional[RequestSourceType] = None,
     ):
         self.buffer = None
+        self._data_segments: Optional[List[memoryview]] = None
+        self._parameters_segments: Optional[List[memoryview]] = None
+        self._parameters: Optional[Dict] = None
+        # set when the cached dict is handed out or assigned, it may have changed and is written on serialization
+        self._parameters_handed_out = False
         try:
             if isinstance(request, jina_pb2.DataRequestProto):
                 self._pb_body = request
@@ -118,6 +127,17 @@ class DataRequest(Request):
         """
         return self.buffer is None
 
+    @property
+    def is_compressed(self) -> bool:
+        """
+        Checks if the request was received compressed and was not deserialized yet
+
+        :return: True if the serialized request is compressed
+        """
+        from jina.proto.serializer import is_compressed
+
+        return self.buffer is not None and is_compressed(self.buffer)
+
     @property
     def proto(self) -> 'jina_pb2.DataRequestProto':
         """
@@ -125,15 +145,78 @@ class DataRequest(Request):
         :meth:`SerializeToString`.
         :return: protobuf instance
         """
+        self._flush_parameters()
+        pb_body = self.proto_wo_data
+        if self._parameters_segments is not None:
+            for segment in self._parameters_segments:
+                pb_body.MergeFromString(segment)
+            self._parameters_segments = None
+        if self._data_segments is not None:
+            for segment in self._data_segments:
+                pb_body.MergeFromString(segment)
+            self._data_segments = None
+        return pb_body
+
+    @property
+    def proto_wo_data(self) -> 'jina_pb2.DataRequestProto':
+        """
+        Cast ``self`` to a :class:`jina_pb2.DataRequestProto` without deserializing the docs and the parameters. The
+        ``data`` and ``parameters`` fields of the returned proto are empty until they are accessed.
+        :return: protobuf instance
+        """
         if not self.is_decompressed:
             self._decompress()
         return self._pb_body
 
     def _decompress(self):
+        from jina.proto.serializer import decompress_bytes, split_fields
+
+        data_field = jina_pb2.DataRequestProto.DATA_FIELD_NUMBER
+        parameters_field = jina_pb2.DataRequestProto.PARAMETERS_FIELD_NUMBER
+        fields, others = split_fields(
+            decompress_bytes(self.buffer), [data_field, parameters_field]
+        )
+        self._data_segments = fields[data_field]
+        self._parameters_segments = fields[parameters_field]
         self._pb_body = jina_pb2.DataRequestProto()
-        self._pb_body.ParseFromString(self.buffer)
+        self._pb_body.ParseFromString(b''.join(others))
         self.buffer = None
 
+    def to_bytes(self) -> bytes:
+        """Return the serialized request, the docs and the parameters are not serialized again if they were never
+        changed.
+
+        :return: binary string representation of the object
+        """
+        self._flush_parameters()
+        if not self.is_decompressed:
+            return self.buffer
+        return b''.join(
+            [
+                self._pb_body.SerializePartialToString(),
+                *(self._parameters_segments or []),
+                *(self._data_segments or []),
+            ]
+        )
+
+    @property
+    def header(self) -> 'jina_pb2.HeaderProto':
+        """
+        Returns the header without deserializing the docs
+
+        :return: the header of this request
+        """
+        return self.proto_wo_data.header
+
+    @property
+    def routes(self):
+        """
+        Returns the routes without deserializing the docs
+
+        :return: the routes of this request
+        """
+        return self.proto_wo_data.routes
+
     def to_dict(self) -> Dict:
         """Return the object in Python dictionary.
 
@@ -160,6 +243,24 @@ class DataRequest(Request):
         .. # noqa: DAR201"""
         return self.data.docs
 
+    def set_serialized_docs(self, docs: bytes) -> None:
+        """
+        Replace the docs with a serialized :class:`DocumentArrayProto`, it is forwarded untouched by :meth:`to_bytes`
+        until ``data`` or ``docs`` is accessed
+
+        :param docs: the serialized docs
+        """
+        from jina.proto.serializer import encode_length_delimited
+
+        self.proto_wo_data.ClearField('data')
+        data = encode_length_delimited(
+            jina_pb2.DataRequestProto.DataContentProto.DOCS_FIELD_NUMBER, docs
+        )
+        self._data_segments = [
+            encode_length_delimited(jina_pb2.DataRequestProto.DATA_FIELD_NUMBER, data)
+        ]
+        del self.data
+
     @cached_property
     def data(self) -> 'DataRequest._DataContent':
         """Get the data contaned in this data request
@@ -171,18 +272,41 @@ class DataRequest(Request):
     @property
     def parameters(self) -> Dict:
         """Return the `parameters` field of this DataRequest as a Python dict
+
+        The dict is parsed once and cached, in-place changes to it are written to the proto on the next
+        serialization.
         :return: a Python dict view of the parameters.
         """
-        # if u get this u need to have it decompressed
-        return json_format.MessageToDict(self.proto.parameters)
+        if self._parameters is None:
+            pb_body = self.proto_wo_data
+            if self._parameters_segments:
+                # parse a copy, the encoded parameters are forwarded as they are until they are changed
+                pb_body = jina_pb2.DataRequestProto()
+                for segment in self._parameters_segments:
+                    pb_body.MergeFromString(segment)
+            self._parameters = json_format.MessageToDict(pb_body.parameters)
+        self._parameters_handed_out = True
+        return self._parameters
 
     @parameters.setter
     def parameters(self, value: Dict):
-        """Set the `parameters` field of this Request to a Python dict
+        """Set the `parameters` field of this Request to a Python dict, it is written to the proto on serialization
         :param value: a Python dict
         """
-        self.proto.parameters.Clear()
-        self.proto.parameters.update(value)
+        if not self.is_decompressed:
+            self._decompress()
+        self._parameters_segments = None
+        self._parameters = value
+        self._parameters_handed_out = True
+
+    def _flush_parameters(self):
+        # parameters never handed out are forwarded as they were received
+        if not self._parameters_handed_out:
+            return
+        self._parameters_handed_out = False
+        self._parameters_segments = None
+        self.proto_wo_data.parameters.Clear()
+        self.proto_wo_data.parameters.update(self._parameters)
 
     @property
     def response(self):
@@ -200,7 +324,68 @@ class DataRequest(Request):
 
         :return: the status object of this request
         """
-        return self.proto.header.status
+        return self.proto_wo_data.header.status
+
+    @property
+    def time_left(self) -> Optional[float]:
+        """
+        Returns the time left until the deadline given by the `deadline_ms` header field, or by the `timeout` field
+        in epoch seconds set by older clients
+
+        :return: the seconds left until the deadline, None if the request has no deadline
+        """
+        header = self.proto_wo_data.header
+        if header.HasField('deadline_ms'):
+            return header.deadline_ms / 1000 - time.time()
+        if header.HasField('timeout'):
+            return header.timeout - time.time()
+        return None
+
+    @property
+    def is_expired(self) -> bool:
+        """
+        Checks if the deadline of the request has passed
+
+        :return: True if the request should be dropped
+        """
+        time_left = self.time_left
+        return time_left is not None and time_left <= 0
+
+    def set_timeout_error(self, target: str) -> None:
+        """Mark the request as dropped because its deadline passed
+
+        :param target: the executor or address the request did not reach in time
+        """
+        d = self.header.status
+        d.code = jina_pb2.StatusProto.ERROR_TIMEOUT
+        d.description = f'the deadline of the request passed before it reached {target}'
+        d.exception.name = 'TimeoutError'
+
+    def set_resource_exhausted_error(self, reason: str) -> None:
+        """Mark the request as shed by a saturated gateway
+
+        :param reason: why the request could not be admitted
+        """
+        d = self.header.status
+        d.code = jina_pb2.StatusProto.ERROR_RESOURCE_EXHAUSTED
+        d.description = f'RESOURCE_EXHAUSTED: {reason}'
+        d.exception.name = 'ResourceExhausted'
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns the size of the serialized request, without serializing it
+
+        :return: the number of bytes of the request
+        """
+        self._flush_parameters()
+        if not self.is_decompressed:
+            return len(self.buffer)
+        return (
+            self._pb_body.ByteSize()
+            + sum(len(s) for s in self._parameters_segments or [])
+            + sum(len(s) for s in self._data_segments or [])
+        )
 
     @classmethod
     def from_proto(cls, request: 'jina_pb2.DataRequestProto'):
@@ -214,7 +399,16 @@ class DataRequest(Request):
         return DataRequest(request=self.proto)
 
     def __deepcopy__(self, _):
-        return DataRequest(request=copy.deepcopy(self.proto))
+        self._flush_parameters()
+        if not self.is_decompressed:
+            return DataRequest(request=self.buffer)
+        req = DataRequest(request=copy.deepcopy(self._pb_body))
+        # the serialized docs and parameters are immutable and can be shared
+        if self._data_segments is not None:
+            req._data_segments = list(self._data_segments)
+        if self._parameters_segments is not None:
+            req._parameters_segments = list(self._parameters_segments)
+        return req
 
 
 class Response(DataRequest):
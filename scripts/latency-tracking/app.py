@@ -151,6 +151,145 @@ def _benchmark_qps() -> Dict[str, float]:
     }
 
 
+def _benchmark_parameters_per_hop() -> Dict[str, float]:
+    """Benchmark reading large request parameters on one hop of the worker.
+
+    Returns:
+        A dict mapping of the average time per hop in seconds as float number.
+    """
+    from jina.proto.serializer import DataRequestProto
+    from jina.serve.runtimes.request_handlers.data_request_handler import (
+        DataRequestHandler,
+    )
+    from jina.types.request.data import DataRequest
+
+    req = DataRequest()
+    req.parameters = {
+        'filter': {'ids': [f'doc-{i}' for i in range(10000)]},
+        'top_k': 10,
+    }
+    data = DataRequestProto.SerializeToString(req)
+
+    num_hops = 100
+    log.info('Benchmarking parameters per hop')
+    st = time.perf_counter()
+    for _ in range(num_hops):
+        received = DataRequestProto.FromString(data)
+        # the worker reads the parameters for the Executor and forwards them unchanged
+        DataRequestHandler._parse_params(received.parameters, 'executor')
+        received.routes.add().executor = 'executor'
+        DataRequestProto.SerializeToString(received)
+    parameters_time = (time.perf_counter() - st) / num_hops
+    log.info('Parameters time per hop: %f seconds', parameters_time)
+
+    return {'parameters_time_per_hop': parameters_time}
+
+
+def _benchmark_gateway_overhead() -> Dict[str, float]:
+    """Benchmark the time the gateway spends routing one request through noop topologies.
+
+    Returns:
+        A dict mapping of the average time per request in seconds for 1, 5 and 20 deployments as float number.
+    """
+    import asyncio
+
+    from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
+    from jina.serve.runtimes.gateway.request_handling import (
+        handle_request,
+        handle_result,
+    )
+    from jina.types.request.data import DataRequest
+
+    class NoopConnectionPool:
+        async def send_requests_once(self, requests, deployment, head, endpoint):
+            return requests[0], {}
+
+    async def _route(num_deployments: int, num_requests: int) -> float:
+        names = [f'deployment{i}' for i in range(num_deployments)]
+        graph_description = {'start-gateway': [names[0]], names[-1]: ['end-gateway']}
+        for name, next_name in zip(names, names[1:]):
+            graph_description[name] = [next_name]
+        handle = handle_request(TopologyGraph(graph_description), NoopConnectionPool())
+
+        st = time.perf_counter()
+        for _ in range(num_requests):
+            handle_result(await handle(DataRequest()))
+        return (time.perf_counter() - st) / num_requests
+
+    stats = {}
+    for num_deployments in (1, 5, 20):
+        log.info('Benchmarking gateway overhead for %d deployments', num_deployments)
+        overhead = asyncio.run(_route(num_deployments, 1000))
+        log.info('Gateway overhead per request: %f seconds', overhead)
+        stats[f'gateway_overhead_{num_deployments}_deployments'] = overhead
+
+    return stats
+
+
+def _benchmark_head_bypass() -> Dict[str, float]:
+    """Benchmark the latency of one hop in a linear Flow of 5 Deployments with and without heads.
+
+    Returns:
+        A dict mapping of the average time per hop in seconds with and without head bypass as float number.
+    """
+    num_deployments = 5
+    num_requests = 200
+    stats = {}
+    for head_bypass in (False, True):
+        f = Flow(head_bypass=head_bypass)
+        for _ in range(num_deployments):
+            f = f.add()
+        log.info('Benchmarking hop latency with head_bypass=%s', head_bypass)
+        with f:
+            # the first request opens the connections
+            f.post(on='/', inputs=Document())
+            st = time.perf_counter()
+            # one request at a time, so the time of a request is its latency
+            f.post(
+                on='/',
+                inputs=(Document() for _ in range(num_requests)),
+                request_size=1,
+                prefetch=1,
+            )
+            hop_time = (time.perf_counter() - st) / num_requests / num_deployments
+        log.info('Hop latency: %f seconds', hop_time)
+        key = 'with_head_bypass' if head_bypass else 'without_head_bypass'
+        stats[f'hop_time_{key}'] = hop_time
+
+    return stats
+
+
+def _benchmark_streaming() -> Dict[str, float]:
+    """Benchmark the throughput of small requests through 3 Deployments with streamed and with unary calls.
+
+    Returns:
+        A dict mapping of the requests per second with streamed and with unary calls as float number.
+    """
+    num_deployments = 3
+    num_requests = 2000
+    stats = {}
+    for stream_window in (0, 64):
+        f = Flow(stream_window=stream_window)
+        for _ in range(num_deployments):
+            f = f.add(stream_window=stream_window)
+        log.info('Benchmarking small requests with stream_window=%s', stream_window)
+        with f:
+            # the first request opens the connections
+            f.post(on='/', inputs=Document())
+            st = time.perf_counter()
+            f.post(
+                on='/',
+                inputs=(Document() for _ in range(num_requests)),
+                request_size=1,
+            )
+            qps = num_requests / (time.perf_counter() - st)
+        log.info('Small request throughput: %f requests per second', qps)
+        key = 'streamed' if stream_window else 'unary'
+        stats[f'small_request_qps_{key}'] = qps
+
+    return stats
+
+
 def benchmark() -> Dict[str, str]:
     """Merge all benchmark results and return final stats.
 
@@ -161,6 +300,10 @@ def benchmark() -> Dict[str, str]:
     stats.update(_benchmark_import_time())
     stats.update(_benchmark_qps())
     stats.update(_benchmark_avg_flow_time())
+    stats.update(_benchmark_parameters_per_hop())
+    stats.update(_benchmark_gateway_overhead())
+    stats.update(_benchmark_head_bypass())
+    stats.update(_benchmark_streaming())
 
     return stats
 
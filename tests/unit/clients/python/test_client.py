@@ -161,3 +161,55 @@ def test_all_sync_clients(protocol, mocker):
     m2.assert_called()
     m3.assert_called_once()
     m4.assert_called()
+
+
+class SlowExec(Executor):
+    @req
+    def foo(self, docs, **kwargs):
+        import random
+
+        time.sleep(random.random() * 0.02)
+
+
+@pytest.mark.parametrize('load_balancing', ['ROUND_ROBIN', 'LEAST_OUTSTANDING'])
+@pytest.mark.parametrize('preserve_order', [False, True])
+def test_grpc_client_multiple_streams(load_balancing, preserve_order):
+    docs = [Document(text=f'doc{i}') for i in range(100)]
+    with Flow(prefetch=0).add(uses=SlowExec, replicas=2) as f:
+        c = Client(
+            host='localhost',
+            port=f.port_expose,
+            grpc_streams=4,
+            gateway_addresses=[f'localhost:{f.port_expose}'] * 2,
+            streams_load_balancing=load_balancing,
+            preserve_order=preserve_order,
+        )
+        responses = c.post('/foo', docs, request_size=5, return_results=True)
+
+    assert len(responses) == 20
+    texts = [doc.text for response in responses for doc in response.docs]
+    if preserve_order:
+        assert texts == [doc.text for doc in docs]
+    else:
+        assert sorted(texts) == sorted(doc.text for doc in docs)
+
+
+@pytest.mark.parametrize('pool', ['THREAD', 'PROCESS'])
+def test_client_request_builders(pool):
+    import numpy as np
+
+    inputs = np.random.random([50, 8])
+    with Flow().add(uses=MyExec) as f:
+        c = Client(
+            host='localhost',
+            port=f.port_expose,
+            request_builders=2,
+            request_builders_pool=pool,
+            request_queue_size=2,
+            preserve_order=True,
+        )
+        responses = c.post('/foo', inputs, request_size=10, return_results=True)
+
+    tensors = [doc.tensor for response in responses for doc in response.docs]
+    assert len(tensors) == 50
+    np.testing.assert_equal(np.stack(tensors), inputs)
@@ -1,5 +1,8 @@
+import asyncio
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -10,6 +13,7 @@ from jina import Flow
 from jina.clients.request import request_generator
 from jina.clients.request.helper import _new_doc_from_data
 from jina.enums import DataInputType
+from jina.types.request.data import DataRequest
 
 
 @pytest.mark.skipif(
@@ -104,6 +108,38 @@ def test_request_generate_bytes():
         assert doc.mime_type == 'text/plain'
 
 
+def test_request_generate_timeout():
+    req = next(request_generator('', data=[Document()], timeout=10))
+    assert time.time() + 9 < req.header.deadline_ms / 1000 <= time.time() + 11
+    assert not req.is_expired
+
+    req = next(request_generator('', data=[Document()]))
+    assert not req.header.HasField('deadline_ms')
+    assert req.time_left is None
+    assert not req.is_expired
+
+
+def test_request_generate_sub_second_timeout():
+    req = next(request_generator('', data=[Document()], timeout=0.2))
+    # the deadline is not rounded up to the next second
+    assert 0.1 < req.time_left <= 0.201
+    assert not req.is_expired
+
+    time.sleep(0.25)
+    assert req.is_expired
+
+
+def test_request_legacy_timeout():
+    # older clients set the deadline in epoch seconds
+    req = next(request_generator('', data=[Document()]))
+    req.header.timeout = int(time.time()) + 10
+    assert 8 < req.time_left <= 10
+    assert not req.is_expired
+
+    req.header.timeout = int(time.time()) - 1
+    assert req.is_expired
+
+
 def test_request_generate_docs():
     def random_docs(num_docs):
         for j in range(1, num_docs + 1):
@@ -220,3 +256,40 @@ def test_request_generate_numpy_arrays_iterator():
     assert len(request.docs) == 5
     for index, doc in enumerate(request.docs, 1):
         assert doc.tensor.shape == (10,)
+
+
+def test_request_generate_numpy_arrays_batched():
+    input_array = np.random.random([10, 4, 2]).astype('float32')
+
+    req = request_generator('', data=input_array, request_size=4)
+
+    docs = [doc for request in req for doc in DataRequest(request.to_bytes()).docs]
+    assert len(docs) == 10
+    assert len({doc.id for doc in docs}) == 10
+    for doc, row in zip(docs, input_array):
+        assert doc.tensor.dtype == np.float32
+        np.testing.assert_equal(doc.tensor, row)
+
+
+@pytest.mark.parametrize('pool_type', [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_request_generate_in_pool(pool_type):
+    from jina.clients.request.parallel import request_generator as pool_generator
+
+    async def _requests():
+        return [
+            request
+            async for request in pool_generator(
+                '/foo',
+                data=(Document(text=f'doc{i}') for i in range(100)),
+                pool=pool_type(max_workers=2),
+                request_queue_size=3,
+                request_size=7,
+            )
+        ]
+
+    requests = asyncio.run(_requests())
+    assert len(requests) == 15
+    assert all(request.header.exec_endpoint == '/foo' for request in requests)
+    assert [doc.text for request in requests for doc in request.docs] == [
+        f'doc{i}' for i in range(100)
+    ]
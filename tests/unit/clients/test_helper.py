@@ -1,6 +1,6 @@
 import aiohttp
 import pytest
-from jina import Flow, Executor, requests
+from jina import Flow, Executor, requests, __protobuf_media_type__
 from jina.logging.logger import JinaLogger
 from jina.clients.request.helper import _new_data_request
 from jina.clients.base.helper import HTTPClientlet, WebsocketClientlet
@@ -31,7 +31,8 @@ async def test_http_clientlet():
         ) as iolet:
             request = _new_data_request('/', None, {'a': 'b'})
             r = await iolet.send_message(request)
-            response = DataRequest(await r.json())
+            response = DataRequest(await r.read())
+    assert r.content_type == __protobuf_media_type__
     assert response.header.exec_endpoint == '/'
     assert response.parameters == {'a': 'b'}
 
@@ -609,6 +609,23 @@ def test_gateway_only_flows_no_error(capsys, protocol):
     assert not captured.err
 
 
+@pytest.mark.skipif(__windows__, reason='no Unix domain sockets on Windows')
+def test_flow_uds_dir():
+    f = Flow().add(shards=2)
+    with f:
+        uds_dir = f._uds_dir
+        assert os.stat(uds_dir).st_mode & 0o777 == 0o700
+        assert os.path.exists(
+            os.path.join(uds_dir, f'{f["executor0"].head_port_in}.sock')
+        )
+        da = f.post('/', inputs=Document(), return_results=True)
+        assert len(da) == 1
+    assert not os.path.exists(uds_dir)
+
+    with Flow(disable_uds=True).add() as f:
+        assert f._uds_dir is None
+
+
 def _validate_flow(f):
     graph_dict = f._get_graph_representation()
     addresses = f._get_deployments_addresses()
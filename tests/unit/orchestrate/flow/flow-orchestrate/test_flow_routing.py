@@ -144,3 +144,92 @@ def test_flow_default_custom_polling_endpoints(polling):
     assert len(docs_index) == 2
     assert len(docs_search) == 2
     assert len(docs_custom) == 3
+
+
+def test_head_bypass_routing():
+    f = (
+        Flow(head_bypass=True)
+        .add(name='foo', uses=SimplExecutor, replicas=2)
+        .add(name='bar', uses=MergeExecutor, shards=2)
+    )
+
+    with f:
+        worker_addresses = f._get_deployments_worker_addresses()
+        assert list(worker_addresses) == ['foo']
+        assert len(worker_addresses['foo']) == 2
+        assert list(f._get_deployments_addresses()) == ['bar']
+        for _ in range(3):
+            docs = f.post(on='/index', inputs=[Document()], return_results=True)
+            assert docs[0].text == 'Hello World!'
+        with pytest.raises(ValueError):
+            f.scale('foo', replicas=3)
+
+
+class AppendExecutor(Executor):
+    @requests
+    def append(self, docs, **kwargs):
+        docs.append(Document(text=self.metas.name))
+
+
+def test_in_process_routing():
+    f = (
+        Flow(in_process=True)
+        .add(name='foo', uses=SimplExecutor)
+        .add(name='bar', uses=AppendExecutor, uses_metas={'name': 'bar'})
+        .add(
+            name='baz',
+            uses=AppendExecutor,
+            uses_metas={'name': 'baz'},
+            needs='foo',
+        )
+        .add(name='sharded', uses=AppendExecutor, shards=2, needs='foo')
+        .needs(['bar', 'baz', 'sharded'])
+    )
+
+    with f:
+        assert set(f._get_deployments_in_process()) == {'foo', 'bar', 'baz', 'joiner'}
+        assert list(f._get_deployments_addresses()) == ['sharded']
+        for _ in range(3):
+            docs = f.post(on='/index', inputs=[Document()], return_results=True)
+            assert docs[0].text == 'Hello World!'
+            # the branches after foo get their own copy of its output
+            assert sorted(d.text for d in docs[1:]) == ['AppendExecutor', 'bar', 'baz']
+        with pytest.raises(ValueError):
+            f.scale('foo', replicas=2)
+
+
+def test_fused_routing():
+    f = (
+        Flow(fuse=True)
+        .add(name='foo', uses=AppendExecutor, uses_metas={'name': 'foo'})
+        .add(name='bar', uses=AppendExecutor, uses_metas={'name': 'bar'})
+        .add(name='sharded', uses=AppendExecutor, shards=2)
+        .add(name='baz', uses=AppendExecutor, uses_metas={'name': 'baz'})
+        .add(name='qux', uses=AppendExecutor, uses_metas={'name': 'qux'})
+    )
+
+    with f:
+        assert f._get_fused_deployments() == {'foo': ['bar'], 'baz': ['qux']}
+        assert list(f._get_deployments_addresses()) == ['foo', 'sharded', 'baz']
+        assert f._get_graph_representation()['foo'] == ['bar']
+        responses = []
+        f.post(on='/index', inputs=[Document()], on_done=responses.append)
+        assert [d.text for d in responses[0].docs] == [
+            '',
+            'foo',
+            'bar',
+            'AppendExecutor',
+            'baz',
+            'qux',
+        ]
+        # every logical Executor still reports its route, in the order of the Flow
+        assert [r.executor for r in responses[0].routes] == [
+            'gateway',
+            'foo',
+            'bar',
+            'sharded',
+            'baz',
+            'qux',
+        ]
+        with pytest.raises(ValueError):
+            f.scale('bar', replicas=2)
@@ -549,16 +549,9 @@ class DummyMockGatewayRuntime:
         self.graph = TopologyGraph(graph_representation)
 
     async def receive_from_client(self, client_id, msg: 'Message'):
-        graph = copy.deepcopy(self.graph)
-        # important that the gateway needs to have an instance of the graph per request
-        tasks_to_respond = []
-        tasks_to_ignore = []
-        for origin_node in graph.origin_nodes:
-            leaf_tasks = origin_node.get_leaf_tasks(self.connection_pool, msg, None)
-            # Every origin node returns a set of tasks that are the ones corresponding to the leafs of each of their subtrees that unwrap all the previous tasks.
-            # It starts like a chain of waiting for tasks from previous nodes
-            tasks_to_respond.extend([task for ret, task in leaf_tasks if ret])
-            tasks_to_ignore.extend([task for ret, task in leaf_tasks if not ret])
+        request_state = self.graph.create_request_state()
+        leaf_tasks = self.graph.get_leaf_tasks(self.connection_pool, msg, request_state)
+        tasks_to_respond = [task for ret, task in leaf_tasks if ret]
         resp = await asyncio.gather(*tasks_to_respond)
         response, _ = zip(*resp)
         return client_id, response
@@ -671,10 +664,9 @@ async def test_message_ordering_merge_in_gateway_graph(
     )
     assert len(resps) == 10
     for client_id, client_resps in resps:
-        assert len(client_resps) == 2
         assert (
-            None in client_resps
-        )  # at the merge branch, only responds to the last part
+            len(client_resps) == 1
+        )  # the merge branch responds once all its parts arrived
         filtered_client_resps = [resp for resp in client_resps if resp is not None]
         deployment2_path = (
             f'client{client_id}-Request-client{client_id}-deployment0-client{client_id}-deployment2-client{client_id}-merger'
@@ -709,10 +701,9 @@ async def test_message_ordering_merge_in_last_deployment_graph(
     )
     assert len(resps) == 10
     for client_id, client_resps in resps:
-        assert len(client_resps) == 2
         assert (
-            None in client_resps
-        )  # at the merge branch, only responds to the last part
+            len(client_resps) == 1
+        )  # the merge branch responds once all its parts arrived
         filtered_client_resps = [resp for resp in client_resps if resp is not None]
         deployment2_path = (
             f'client{client_id}-Request-client{client_id}-deployment0-client{client_id}-deployment2-client{client_id}-merger-client{client_id}-deployment_last'
@@ -744,10 +735,9 @@ async def test_message_ordering_complete_graph(complete_graph_dict):
     assert len(resps) == 10
     await asyncio.sleep(0.1)  # need to terminate the hanging deployments tasks
     for client_id, client_resps in resps:
-        assert len(client_resps) == 3
         assert (
-            None in client_resps
-        )  # at the merge branch, only responds to the last part
+            len(client_resps) == 2
+        )  # the merge branch responds once all its parts arrived
         filtered_client_resps = [resp for resp in client_resps if resp is not None]
         assert len(filtered_client_resps) == 2
         sorted_filtered_client_resps = list(
@@ -870,7 +860,7 @@ async def test_message_ordering_two_joins_graph(
     assert len(resps) == 10
     await asyncio.sleep(0.1)  # need to terminate the hanging deployments tasks
     for client_id, client_resps in resps:
-        assert len(client_resps) == 4
+        assert len(client_resps) == 1
         filtered_client_resps = [resp for resp in client_resps if resp is not None]
         assert len(filtered_client_resps) == 1
         path12 = (
@@ -230,3 +230,213 @@ def test_app_models_acceptance(docs_input):
         r = req.post(f'http://localhost:{f.port_expose}/index', json=docs_input)
 
     assert DocumentArray.from_dict(r.json()['data'])[0].text == 'text_input'
+
+
+def test_app_protobuf_content_type():
+    from jina import __protobuf_media_type__
+    from jina.clients.request import request_generator
+    from jina.enums import CompressAlgo
+    from jina.proto.serializer import compress_bytes
+    from jina.types.request.data import DataRequest
+
+    request = next(
+        request_generator('/index', DocumentArray([Document(text='text_input')]))
+    )
+    f = Flow(protocol='http').add()
+
+    with f:
+        r = req.post(
+            f'http://localhost:{f.port_expose}/post',
+            data=request.to_bytes(),
+            headers={'Content-Type': __protobuf_media_type__},
+        )
+        results = Client(port=f.port_expose, protocol='http').post(
+            '/index', Document(text='client_input'), return_results=True
+        )
+        # only the runtimes of the Flow send compressed requests
+        compressed_r = req.post(
+            f'http://localhost:{f.port_expose}/post',
+            data=compress_bytes(request.to_bytes(), CompressAlgo.ZLIB),
+            headers={'Content-Type': __protobuf_media_type__},
+        )
+
+    assert compressed_r.status_code == 400
+    assert r.status_code == 200
+    assert r.headers['content-type'] == __protobuf_media_type__
+    assert DataRequest(r.content).docs[0].text == 'text_input'
+    assert results[0].docs[0].text == 'client_input'
+
+
+def test_app_stats():
+    f = Flow(protocol='http', response_cache={'/search': 60}).add()
+
+    with f:
+        client = Client(port=f.port_expose, protocol='http')
+        # every call gives the Document a new random id
+        for _ in range(2):
+            results = client.post(
+                '/search', Document(text='query'), return_results=True
+            )
+        r = req.get(f'http://localhost:{f.port_expose}/stats')
+
+    assert results[0].docs[0].text == 'query'
+    assert r.status_code == 200
+    assert r.json()['response_cache']['hits'] == 1
+    assert r.json()['response_cache']['misses'] == 1
+    replicas = r.json()['connections']['executor0']['heads']['0']
+    assert [stats['in_flight'] for stats in replicas.values()] == [0]
+    assert sum(stats['num_requests'] for stats in replicas.values()) == 1
+
+
+class BulkExecutor(Executor):
+    @requests(on='/index')
+    def index(self, docs, **kwargs):
+        for doc in docs:
+            doc.tags['num_docs'] = len(docs)
+
+
+@pytest.mark.parametrize('binary', [False, True])
+def test_app_bulk_endpoint(binary):
+    import json
+    import struct
+
+    from jina import __protobuf_media_type__
+    from jina.types.request.data import DataRequest
+
+    num_docs = 1000
+
+    def _upload():
+        for i in range(num_docs):
+            if binary:
+                doc = Document(text=f'doc{i}').to_protobuf().SerializeToString()
+                yield struct.pack('>I', len(doc)) + doc
+            else:
+                yield json.dumps({'text': f'doc{i}'}).encode() + b'\n'
+
+    f = Flow(protocol='http').add(uses=BulkExecutor)
+
+    with f:
+        r = req.post(
+            f'http://localhost:{f.port_expose}/bulk?exec_endpoint=/index&request_size=30',
+            data=_upload(),
+            headers={
+                'Content-Type': __protobuf_media_type__
+                if binary
+                else 'application/x-ndjson'
+            },
+        )
+
+    assert r.status_code == 200
+    if binary:
+        assert r.headers['content-type'] == __protobuf_media_type__
+        responses, offset = [], 0
+        while offset < len(r.content):
+            (size,) = struct.unpack_from('>I', r.content, offset)
+            responses.append(DataRequest(r.content[offset + 4 : offset + 4 + size]))
+            offset += 4 + size
+        docs = [doc for response in responses for doc in response.docs]
+    else:
+        responses = [json.loads(line) for line in r.iter_lines() if line]
+        docs = [
+            doc
+            for response in responses
+            for doc in DocumentArray.from_dict(response['data'])
+        ]
+
+    assert len(responses) == 34
+    assert sorted(doc.text for doc in docs) == sorted(
+        f'doc{i}' for i in range(num_docs)
+    )
+    assert {doc.tags['num_docs'] for doc in docs} == {30, 10}
+
+
+@pytest.mark.parametrize('binary', [False, True])
+def test_app_bulk_document_too_large(binary):
+    import struct
+
+    from jina import __protobuf_media_type__
+
+    if binary:
+        # the size prefix announces a Document larger than the maximum, it is never buffered
+        body = struct.pack('>I', 1 << 30) + b'x' * 100
+    else:
+        # a body without any newline
+        body = b'x' * 10000
+
+    f = Flow(protocol='http', bulk_max_document_size=1024).add(uses=BulkExecutor)
+
+    with f:
+        r = req.post(
+            f'http://localhost:{f.port_expose}/bulk?exec_endpoint=/index',
+            data=body,
+            headers={
+                'Content-Type': __protobuf_media_type__
+                if binary
+                else 'application/x-ndjson'
+            },
+        )
+
+    assert r.status_code == 413
+    assert 'larger than 1024 bytes' in r.text
+
+
+@pytest.mark.parametrize('binary', [False, True])
+@pytest.mark.parametrize('num_valid_docs', [0, 200])
+def test_app_bulk_malformed_upload(binary, num_valid_docs):
+    import json
+    import struct
+
+    from jina import __protobuf_media_type__
+    from jina.proto import jina_pb2
+    from jina.types.request.data import DataRequest
+
+    def _upload():
+        for i in range(num_valid_docs):
+            if binary:
+                doc = Document(text=f'doc{i}').to_protobuf().SerializeToString()
+                yield struct.pack('>I', len(doc)) + doc
+            else:
+                yield json.dumps({'text': f'doc{i}'}).encode() + b'\n'
+        if binary:
+            # the stream ends in the middle of a Document
+            yield struct.pack('>I', 100) + b'x' * 10
+        else:
+            yield b'{"text": not json}\n'
+
+    f = Flow(protocol='http').add(uses=BulkExecutor)
+
+    with f:
+        r = req.post(
+            f'http://localhost:{f.port_expose}/bulk?exec_endpoint=/index&request_size=10',
+            data=_upload(),
+            headers={
+                'Content-Type': __protobuf_media_type__
+                if binary
+                else 'application/x-ndjson'
+            },
+        )
+
+    if not num_valid_docs:
+        # nothing was streamed back yet, the upload is rejected
+        assert r.status_code == 400
+        return
+
+    # the results were already streaming, the error is the last record
+    assert r.status_code == 200
+    if binary:
+        records, offset = [], 0
+        while offset < len(r.content):
+            (size,) = struct.unpack_from('>I', r.content, offset)
+            records.append(
+                DataRequest(r.content[offset + 4 : offset + 4 + size]).to_dict()
+            )
+            offset += 4 + size
+    else:
+        records = [json.loads(line) for line in r.iter_lines() if line]
+    assert len(records) > 1
+    codes = [
+        record['header'].get('status', {}).get('code', jina_pb2.StatusProto.SUCCESS)
+        for record in records
+    ]
+    assert codes[-1] == jina_pb2.StatusProto.ERROR
+    assert set(codes[:-1]) == {jina_pb2.StatusProto.SUCCESS}
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from jina import Document, DocumentArray
+from jina.clients.request import request_generator
+from jina.parsers import set_gateway_parser
+from jina.proto import jina_pb2
+from jina.serve.runtimes.gateway.admission import AdmissionController
+from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
+from jina.serve.runtimes.gateway.request_handling import handle_request
+
+
+class BlockingConnectionPool:
+    def __init__(self):
+        self.sent = []
+        self.unblock = asyncio.Event()
+
+    async def send_requests_once(self, requests, deployment, head, endpoint):
+        self.sent.append(requests[0].docs[0].text)
+        await self.unblock.wait()
+        return requests[0], {}
+
+
+def _create_request(text, priority=None):
+    return list(
+        request_generator('/', DocumentArray([Document(text=text)]), priority=priority)
+    )[0]
+
+
+def _get_handle(*args):
+    admission_controller = AdmissionController.from_args(
+        set_gateway_parser().parse_args(list(args))
+    )
+    connection_pool = BlockingConnectionPool()
+    graph = TopologyGraph(
+        {'start-gateway': ['deployment0'], 'deployment0': ['end-gateway']}
+    )
+    handle = handle_request(
+        graph, connection_pool, admission_controller=admission_controller
+    )
+    return handle, connection_pool, admission_controller
+
+
+async def _send(handle, request, client=''):
+    AdmissionController.set_client(client)
+    return await handle(request)
+
+
+def _is_shed(response):
+    return response.header.status.code == jina_pb2.StatusProto.ERROR_RESOURCE_EXHAUSTED
+
+
+def test_admission_disabled_by_default():
+    assert AdmissionController.from_args(set_gateway_parser().parse_args([])) is None
+
+
+@pytest.mark.asyncio
+async def test_admission_sheds_after_queue_timeout():
+    handle, connection_pool, admission_controller = _get_handle(
+        '--max-inflight-requests', '2', '--admission-queue-timeout', '0.05'
+    )
+    tasks = [
+        asyncio.create_task(_send(handle, _create_request(str(i)))) for i in range(4)
+    ]
+    await asyncio.sleep(0.2)
+    assert connection_pool.sent == ['0', '1']
+    connection_pool.unblock.set()
+    responses = await asyncio.gather(*tasks)
+
+    assert [_is_shed(r) for r in responses] == [False, False, True, True]
+    assert responses[2].header.status.description.startswith('RESOURCE_EXHAUSTED')
+    assert admission_controller.get_stats() == {
+        'in_flight_requests': 0,
+        'in_flight_bytes': 0,
+        'queue_depth': 0,
+        'admitted': 2,
+        'queued': 2,
+        'shed_queue_full': 0,
+        'shed_timeout': 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_admission_by_priority():
+    handle, connection_pool, admission_controller = _get_handle(
+        '--max-inflight-requests',
+        '1',
+        '--admission-queue-size',
+        '2',
+        '--admission-queue-timeout',
+        '5',
+    )
+    tasks = []
+    for text, priority in [('first', 0), ('low', 1), ('mid', 2), ('high', 3)]:
+        tasks.append(
+            asyncio.create_task(_send(handle, _create_request(text, priority)))
+        )
+        await asyncio.sleep(0.01)
+    assert admission_controller.get_stats()['queue_depth'] == 2
+
+    connection_pool.unblock.set()
+    responses = await asyncio.gather(*tasks)
+    # the queue was full, the request with the lowest priority made room for the last one
+    assert [_is_shed(r) for r in responses] == [False, True, False, False]
+    assert connection_pool.sent == ['first', 'high', 'mid']
+    assert admission_controller.get_stats()['shed_queue_full'] == 1
+
+
+@pytest.mark.asyncio
+async def test_admission_per_client():
+    handle, connection_pool, admission_controller = _get_handle(
+        '--max-inflight-requests-per-client', '1', '--admission-queue-timeout', '5'
+    )
+    tasks = [
+        asyncio.create_task(_send(handle, _create_request(text), client))
+        for text, client in [('a0', 'a'), ('a1', 'a'), ('b0', 'b')]
+    ]
+    await asyncio.sleep(0.1)
+    # the client at its cap does not hold back the other clients
+    assert connection_pool.sent == ['a0', 'b0']
+    assert admission_controller.get_stats()['queue_depth'] == 1
+
+    connection_pool.unblock.set()
+    responses = await asyncio.gather(*tasks)
+    assert not any(_is_shed(r) for r in responses)
+    assert connection_pool.sent == ['a0', 'b0', 'a1']
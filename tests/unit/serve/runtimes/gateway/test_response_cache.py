@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+
+from jina import Document, DocumentArray
+from jina.clients.request import request_generator
+from jina.parsers import set_gateway_parser
+from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
+from jina.serve.runtimes.gateway.request_handling import handle_request
+from jina.serve.runtimes.gateway.response_cache import ResponseCache
+
+
+class CountingConnectionPool:
+    def __init__(self):
+        self.sent = 0
+
+    async def send_requests_once(self, requests, deployment, head, endpoint):
+        self.sent += 1
+        response = requests[0]
+        docs = response.docs
+        for doc in docs:
+            doc.text = f'{doc.text}-{deployment}'
+        response.data.docs = docs
+        return response, {}
+
+
+def _create_request(endpoint, text, parameters=None):
+    # every request gets new random ids, like the requests of a client
+    req = list(
+        request_generator(
+            endpoint,
+            DocumentArray([Document(text=text, chunks=[Document(text=text)])]),
+        )
+    )[0]
+    if parameters:
+        req.parameters = parameters
+    return req
+
+
+@pytest.mark.asyncio
+async def test_response_cache():
+    args = set_gateway_parser().parse_args(
+        ['--response-cache', '/search:60', '--response-cache-size', '2']
+    )
+    response_cache = ResponseCache.from_args(args)
+    connection_pool = CountingConnectionPool()
+    graph = TopologyGraph(
+        {
+            'start-gateway': ['deployment0'],
+            'deployment0': ['deployment1'],
+            'deployment1': ['end-gateway'],
+        }
+    )
+    handle = handle_request(graph, connection_pool, response_cache=response_cache)
+
+    first = await handle(_create_request('/search', 'query'))
+    request = _create_request('/search', 'query')
+    ids = [request.docs[0].id, request.docs[0].chunks[0].id]
+    second = await handle(request)
+    assert connection_pool.sent == 2
+    assert second.header.request_id == request.header.request_id
+    assert second.docs[0].text == first.docs[0].text == 'query-deployment0-deployment1'
+    # the response carries the ids of the request it answers
+    assert first.docs[0].id != second.docs[0].id == ids[0]
+    assert second.docs[0].chunks[0].id == ids[1]
+    assert second.docs[0].chunks[0].parent_id == ids[0]
+    assert [route.executor for route in second.routes] == ['gateway']
+
+    # other parameters, other docs and not cached endpoints do not hit
+    await handle(_create_request('/search', 'query', {'top_k': 3}))
+    await handle(_create_request('/search', 'other query'))
+    await handle(_create_request('/foo', 'query'))
+    assert connection_pool.sent == 8
+    assert response_cache.get_stats() == {
+        'hits': 1,
+        'misses': 3,
+        'evictions': 1,
+        'invalidations': 0,
+        'size': 2,
+    }
+
+    await handle(_create_request('/index', 'doc'))
+    await handle(_create_request('/search', 'other query'))
+    assert connection_pool.sent == 12
+    assert response_cache.get_stats()['invalidations'] == 1
+
+
+def test_response_cache_ttl():
+    response_cache = ResponseCache({'/search': 0})
+    request = _create_request('/search', 'query')
+    key, ids = ResponseCache.get_key(request)
+    response_cache.put(key, '/search', request, ids=ids)
+    assert response_cache.get(key) is None
+    assert response_cache.get_stats()['size'] == 0
+
+
+def test_response_cache_disabled():
+    assert ResponseCache.from_args(set_gateway_parser().parse_args([])) is None
+
+
+@pytest.mark.asyncio
+async def test_response_cache_in_flight_invalidation():
+    class BlockingConnectionPool(CountingConnectionPool):
+        def __init__(self):
+            super().__init__()
+            self.release_search = asyncio.Event()
+
+        async def send_requests_once(self, requests, deployment, head, endpoint):
+            if endpoint == '/search':
+                await self.release_search.wait()
+            return await super().send_requests_once(
+                requests, deployment, head, endpoint
+            )
+
+    response_cache = ResponseCache({'/search': 60})
+    connection_pool = BlockingConnectionPool()
+    graph = TopologyGraph(
+        {'start-gateway': ['deployment0'], 'deployment0': ['end-gateway']}
+    )
+    handle = handle_request(graph, connection_pool, response_cache=response_cache)
+
+    # the search result is computed before the index runs, it is stale once the index is done
+    search = handle(_create_request('/search', 'query'))
+    await handle(_create_request('/index', 'doc'))
+    connection_pool.release_search.set()
+    await search
+    assert response_cache.get_stats()['size'] == 0
+
+
+def test_response_cache_rejects_errors():
+    response_cache = ResponseCache({'/search': 60})
+    request = _create_request('/search', 'query')
+    key, _ = ResponseCache.get_key(request)
+    response_cache.put(key, '/search', request, metadatas=[{'is-error': 'true'}])
+    assert response_cache.get(key) is None
+
+    response_cache.put(key, '/search', request, metadatas=[{}])
+    assert response_cache.get(key) is not None
+
+
+def test_response_cache_key_ignores_ids():
+    first = _create_request('/search', 'query')
+    second = _create_request('/search', 'query')
+    first_key, first_ids = ResponseCache.get_key(first)
+    second_key, second_ids = ResponseCache.get_key(second)
+    assert first_key == second_key
+    assert first_ids == [first.docs[0].id, first.docs[0].chunks[0].id]
+    assert second_ids != first_ids
+
+    # the same texts in Documents instead of chunks are another request
+    third = list(
+        request_generator(
+            '/search',
+            DocumentArray(
+                [Document(text='query'), Document(text='query'), Document(text='query')]
+            ),
+        )
+    )[0]
+    assert ResponseCache.get_key(third)[0] != first_key
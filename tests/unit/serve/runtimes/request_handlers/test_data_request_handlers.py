@@ -1,3 +1,8 @@
+import asyncio
+import os
+import threading
+import time
+
 import pytest
 
 from docarray import Document, DocumentArray
@@ -37,6 +42,48 @@ class MergeChangeDocsExecutor(Executor):
         return docs
 
 
+class DynamicBatchExecutor(Executor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_sizes = []
+
+    @requests(dynamic_batch=8, max_wait_ms=100)
+    def foo(self, docs, **kwargs):
+        self.batch_sizes.append(len(docs))
+        return DocumentArray([Document(text=f'{doc.text} encoded') for doc in docs])
+
+
+class ConcurrentExecutor(Executor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def _track(self):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.1)
+        with self.lock:
+            self.running -= 1
+
+    @requests(on='/safe', concurrency=2)
+    def safe(self, **kwargs):
+        self._track()
+
+    @requests(on='/unsafe')
+    def unsafe(self, **kwargs):
+        self._track()
+
+
+class ProcessExecutor(Executor):
+    @requests
+    def foo(self, docs, **kwargs):
+        for doc in docs:
+            doc.tags['pid'] = os.getpid()
+
+
 @pytest.fixture()
 def logger():
     return JinaLogger('data request handler')
@@ -112,3 +159,105 @@ async def test_data_request_handler_change_docs_from_partial_requests(logger):
     assert len(response.docs) == 10 * NUM_PARTIAL_REQUESTS
     for doc in response.docs:
         assert doc.text == 'changed document'
+
+
+@pytest.mark.asyncio
+async def test_data_request_handler_dynamic_batching(logger):
+    args = set_pod_parser().parse_args(['--uses', 'DynamicBatchExecutor'])
+    handler = DataRequestHandler(args, logger)
+
+    reqs = [
+        list(
+            request_generator(
+                '/', DocumentArray([Document(text=f'doc {i}') for _ in range(2)])
+            )
+        )[0]
+        for i in range(5)
+    ]
+    responses = await asyncio.gather(*[handler.handle(requests=[r]) for r in reqs])
+
+    # the first 4 requests fill a batch of 8 Documents, the last one is flushed after max_wait_ms
+    assert handler._executor.batch_sizes == [8, 2]
+    for i, response in enumerate(responses):
+        assert len(response.docs) == 2
+        assert response.docs.texts == [f'doc {i} encoded'] * 2
+
+    stats = handler.get_batching_stats()['/default']
+    assert stats['batch_size']['count'] == 2
+    assert stats['batch_size']['buckets']['8'] == 1
+    assert stats['queue_wait_ms']['count'] == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'endpoint, expected_max_running', [('/safe', 2), ('/unsafe', 1)]
+)
+async def test_data_request_handler_endpoint_concurrency(
+    logger, endpoint, expected_max_running
+):
+    args = set_pod_parser().parse_args(
+        ['--uses', 'ConcurrentExecutor', '--executor-pool-size', '4']
+    )
+    handler = DataRequestHandler(args, logger)
+
+    reqs = [
+        list(request_generator(endpoint, DocumentArray([Document()])))[0]
+        for _ in range(4)
+    ]
+    await asyncio.gather(*[handler.handle(requests=[r]) for r in reqs])
+
+    assert handler._executor.max_running == expected_max_running
+    handler.close()
+
+
+@pytest.mark.asyncio
+async def test_data_request_handler_process_pool(logger):
+    args = set_pod_parser().parse_args(
+        ['--uses', 'ProcessExecutor', '--executor-pool', 'PROCESS']
+    )
+    handler = DataRequestHandler(args, logger)
+
+    req = list(request_generator('/', DocumentArray([Document() for _ in range(3)])))[0]
+    response = await handler.handle(requests=[req])
+
+    assert len(response.docs) == 3
+    for doc in response.docs:
+        assert doc.tags['pid'] != os.getpid()
+    handler.close()
+
+
+def test_process_pool_starts_all_processes():
+    executor = ProcessExecutor(
+        runtime_args={'executor_pool': 'PROCESS', 'executor_pool_size': 3}
+    )
+    executor._start_process_pool()
+
+    # the processes are forked before the server starts, none of them is started on demand later
+    processes = executor._process_pool._processes
+    assert len(processes) == 3
+    assert all(p.is_alive() for p in processes.values())
+    executor._close_pools()
+
+
+@pytest.mark.parametrize('descending', [False, True])
+def test_reduce_requests_top_k(descending):
+    shard_scores = [[0.1, 0.4, 0.7], [0.2, 0.3, None], [0.9, 0.5, 0.6]]
+    reqs = []
+    for shard_id, scores in enumerate(shard_scores):
+        query = Document(id='query')
+        for i, score in enumerate(scores):
+            match = Document(id=f'{shard_id}-{i}')
+            if score is not None:
+                match.scores['cosine'].value = score
+            query.matches.append(match)
+        req = list(request_generator('/search', DocumentArray([query])))[0]
+        req.parameters = {'top_k': 4}
+        reqs.append(req)
+
+    response = DataRequestHandler.reduce_requests_top_k(
+        reqs, 'cosine', descending=descending
+    )
+
+    matches = response.docs[0].matches
+    expected_scores = [0.9, 0.7, 0.6, 0.5] if descending else [0.1, 0.2, 0.3, 0.4]
+    assert matches[:, 'scores__cosine__value'] == pytest.approx(expected_scores)
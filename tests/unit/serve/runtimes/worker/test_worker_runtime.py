@@ -144,6 +144,52 @@ async def test_worker_runtime_slow_async_exec(uses):
     assert not AsyncNewLoopRuntime.is_ready(f'{args.host}:{args.port_in}')
 
 
+@pytest.mark.slow
+@pytest.mark.timeout(10)
+def test_worker_runtime_drops_expired_request(monkeypatch):
+    args = set_pod_parser().parse_args([])
+
+    cancel_event = multiprocessing.Event()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError('expired requests must not reach the executor')
+
+    monkeypatch.setattr(DataRequestHandler, 'handle', fail)
+
+    def start_runtime(args, cancel_event):
+        with WorkerRuntime(args, cancel_event) as runtime:
+            runtime.run_forever()
+
+    runtime_thread = Process(
+        target=start_runtime,
+        args=(args, cancel_event),
+        daemon=True,
+    )
+    runtime_thread.start()
+
+    assert AsyncNewLoopRuntime.wait_for_ready_or_shutdown(
+        timeout=5.0,
+        ctrl_address=f'{args.host}:{args.port_in}',
+        ready_or_shutdown_event=Event(),
+    )
+
+    request = _create_test_data_message()
+    request.header.deadline_ms = int(time.time() * 1000) - 1000
+    target = f'{args.host}:{args.port_in}'
+    with grpc.insecure_channel(
+        target,
+        options=GrpcConnectionPool.get_default_grpc_options(),
+    ) as channel:
+        stub = jina_pb2_grpc.JinaSingleDataRequestRPCStub(channel)
+        response, call = stub.process_single_data.with_call(request)
+
+    cancel_event.set()
+    runtime_thread.join()
+
+    assert response.header.status.code == jina_pb2.StatusProto.ERROR_TIMEOUT
+    assert dict(call.trailing_metadata())['is-error'] == 'true'
+
+
 @pytest.mark.slow
 @pytest.mark.timeout(10)
 def test_error_in_worker_runtime(monkeypatch):
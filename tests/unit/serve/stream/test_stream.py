@@ -84,3 +84,129 @@ async def test_request_streamer(prefetch, num_requests, async_iterator):
         assert r.docs[0].tags['result_handled']
 
     assert num_responses == num_requests
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('prefetch', [0, 3])
+async def test_request_streamer_adaptive_prefetch(prefetch):
+    # the Flow serves 2 requests at once, the requests beyond that queue and their latency grows
+    capacity = 2
+    in_flight = 0
+    max_in_flight = 0
+
+    def request_handler_fn(request):
+        async def task():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01 * max(1, in_flight / capacity))
+            in_flight -= 1
+            return request
+
+        return asyncio.ensure_future(task())
+
+    def _get_sync_requests_iterator(num_requests):
+        for i in range(num_requests):
+            req = DataRequest()
+            req.header.request_id = random_identity()
+            yield req
+
+    args = Namespace()
+    args.prefetch = prefetch
+    args.prefetch_adaptive = True
+    streamer = RequestStreamer(
+        args=args,
+        request_handler=request_handler_fn,
+        result_handler=lambda result: result,
+    )
+
+    num_responses = 0
+    async for _ in streamer.stream(_get_sync_requests_iterator(200)):
+        num_responses += 1
+
+    assert num_responses == 200
+    stats = streamer.get_prefetch_stats()
+    assert stats['in_flight'] == 0
+    if prefetch:
+        assert max_in_flight <= prefetch
+    else:
+        # the window converges close to the capacity instead of letting all the requests in
+        assert 1 <= stats['window'] < 20
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('prefetch', [0, 3])
+@pytest.mark.parametrize('async_iterator', [False, True])
+async def test_request_streamer_results_in_order(prefetch, async_iterator):
+    buffer_size = 4
+    in_flight = 0
+    max_in_flight = 0
+
+    def request_handler_fn(request):
+        async def task():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # every third request is slow, the following ones complete before it
+            index = int(request.header.request_id)
+            await asyncio.sleep(0.05 if index % 3 == 0 else 0.001)
+            in_flight -= 1
+            return request
+
+        return asyncio.ensure_future(task())
+
+    def _get_sync_requests_iterator(num_requests):
+        for i in range(num_requests):
+            req = DataRequest()
+            req.header.request_id = str(i)
+            yield req
+
+    async def _get_async_requests_iterator(num_requests):
+        for req in _get_sync_requests_iterator(num_requests):
+            yield req
+
+    args = Namespace()
+    args.prefetch = prefetch
+    args.results_in_order = True
+    args.reorder_buffer_size = buffer_size
+    streamer = RequestStreamer(
+        args=args,
+        request_handler=request_handler_fn,
+        result_handler=lambda result: result,
+    )
+
+    it = (
+        _get_async_requests_iterator(20)
+        if async_iterator
+        else _get_sync_requests_iterator(20)
+    )
+    request_ids = [r.header.request_id async for r in streamer.stream(it)]
+
+    assert request_ids == [str(i) for i in range(20)]
+    assert max_in_flight <= buffer_size
+
+
+@pytest.mark.asyncio
+async def test_request_streamer_results_in_order_iterator_error():
+    async def _get_requests_iterator():
+        for i in range(2):
+            req = DataRequest()
+            req.header.request_id = str(i)
+            yield req
+        raise ValueError('bad input')
+
+    args = Namespace()
+    args.results_in_order = True
+    streamer = RequestStreamer(
+        args=args,
+        request_handler=lambda request: asyncio.ensure_future(
+            asyncio.sleep(0, request)
+        ),
+        result_handler=lambda result: result,
+    )
+
+    request_ids = []
+    with pytest.raises(ValueError):
+        async for response in streamer.stream(_get_requests_iterator()):
+            request_ids.append(response.header.request_id)
+    assert request_ids == ['0', '1']
@@ -9,10 +9,16 @@ import pytest
 
 from jina import DocumentArray, Document
 from jina.clients.request import request_generator
-from jina.enums import PollingType
+from jina.enums import PollingType, LoadBalancingType, CompressAlgo
 from jina.helper import random_port
-from jina.serve.networking import ReplicaList, GrpcConnectionPool
-from jina.proto import jina_pb2_grpc
+from jina.serve.networking import (
+    ReplicaList,
+    GrpcConnectionPool,
+    HealthPolicy,
+    HedgePolicy,
+)
+from jina.proto import jina_pb2_grpc, jina_pb2
+from jina.proto.serializer import DataRequestCompressor
 from jina.types.request.control import ControlRequest
 
 
@@ -58,6 +64,136 @@ async def test_connection_list(mocker, monkeypatch):
     await connection_list.close()
 
 
+@pytest.mark.asyncio
+async def test_connection_list_least_outstanding(mocker, monkeypatch):
+    _, _ = await _mock_grpc(mocker, monkeypatch)
+    connection_list = ReplicaList(LoadBalancingType.LEAST_OUTSTANDING)
+    for address in ['1.1.1.1', '1.1.1.2', '1.1.1.3']:
+        connection_list.add_connection(address=address)
+
+    busy = connection_list.get_next_connection()
+    busy.request_started()
+    busy.request_started()
+    second = connection_list.get_next_connection()
+    assert second is not busy
+    second.request_started()
+
+    # the only idle replica has to be picked
+    third = connection_list.get_next_connection()
+    assert third.in_flight == 0
+    assert third not in (busy, second)
+
+    stats = connection_list.get_stats()
+    assert stats[busy.address]['in_flight'] == 2
+    assert stats[second.address]['in_flight'] == 1
+    assert stats[third.address]['in_flight'] == 0
+
+    busy.request_finished(0.1)
+    busy.request_finished(0.1)
+    assert connection_list.get_stats()[busy.address]['in_flight'] == 0
+    await connection_list.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_list_ewma(mocker, monkeypatch):
+    _, _ = await _mock_grpc(mocker, monkeypatch)
+    connection_list = ReplicaList(LoadBalancingType.EWMA)
+    connection_list.add_connection(address='1.1.1.1')
+    connection_list.add_connection(address='1.1.1.2')
+
+    slow, fast = connection_list.get_all_connections()
+    for _ in range(5):
+        slow.request_started()
+        slow.request_finished(1.0)
+        fast.request_started()
+        fast.request_finished(0.01)
+
+    assert slow.ewma_latency > fast.ewma_latency
+    for _ in range(10):
+        assert connection_list.get_next_connection() is fast
+    await connection_list.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_list_channels_and_warm_up(mocker, monkeypatch):
+    _, create_mock = await _mock_grpc(mocker, monkeypatch)
+    connection_list = ReplicaList(channels_per_replica=2)
+    connection_list.add_connection(address='1.1.1.1')
+    connection_list.add_connection(address='1.1.1.2')
+    assert create_mock.call_count == 4
+    ready, connecting = connection_list.get_all_connections()
+    # the channels connect before the first request
+    ready.channels[0].channel.get_state.assert_called_with(try_to_connect=True)
+
+    def set_state(connection, state):
+        for channel in connection.channels:
+            channel.channel = mocker.Mock()
+            channel.channel.get_state.return_value = state
+            channel.channel.close = mocker.AsyncMock()
+
+    set_state(ready, grpc.ChannelConnectivity.READY)
+    set_state(connecting, grpc.ChannelConnectivity.CONNECTING)
+    for _ in range(4):
+        assert connection_list.get_next_connection() is ready
+    set_state(connecting, grpc.ChannelConnectivity.READY)
+    assert {connection_list.get_next_connection() for _ in range(2)} == {
+        ready,
+        connecting,
+    }
+
+    # the requests are spread over the channels of a replica
+    first, second = ready.channels
+    assert {ready.get_channel(), ready.get_channel()} == {first, second}
+    first.in_flight = 1
+    assert ready.get_channel() is second and ready.get_channel() is second
+    assert connection_list.get_stats()[ready.address]['channels_in_flight'] == [1, 0]
+    await connection_list.close()
+    first.channel.close.assert_awaited_once()
+
+
+def test_get_local_address(tmpdir):
+    port = random_port()
+    address = f'0.0.0.0:{port}'
+    uds_dir = str(tmpdir)
+    assert GrpcConnectionPool.get_local_address(address, uds_dir) == address
+
+    uds_address = GrpcConnectionPool.get_uds_address(port, uds_dir)
+    open(uds_address[len('unix://') :], 'w').close()
+    # without the directory of the Flow no socket is ever used
+    assert GrpcConnectionPool.get_local_address(address) == address
+    assert GrpcConnectionPool.get_local_address(address, uds_dir) == uds_address
+    assert (
+        GrpcConnectionPool.get_local_address(f'localhost:{port}', uds_dir)
+        == uds_address
+    )
+    assert (
+        GrpcConnectionPool.get_local_address(f'8.8.8.8:{port}', uds_dir)
+        == f'8.8.8.8:{port}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_drops_expired_request(mocker, monkeypatch):
+    _, _ = await _mock_grpc(mocker, monkeypatch)
+
+    pool = GrpcConnectionPool()
+    pool.add_connection(deployment='encoder', head=False, address='1.1.1.1:53')
+    request = list(request_generator('/', DocumentArray([Document()])))[0]
+    request.header.deadline_ms = int(time.time() * 1000) - 1000
+
+    response, metadata = await pool.send_request(
+        request=request, deployment='encoder', head=False
+    )[0]
+
+    assert response.header.status.code == jina_pb2.StatusProto.ERROR_TIMEOUT
+    assert 'is-error' in metadata
+    replica = pool._connections.get_replicas('encoder', False, 0)
+    replica.get_next_connection().channels[
+        0
+    ].single_data_stub.process_single_data.assert_not_called()
+    await pool.close()
+
+
 def mock_send(mock):
     mock()
     return None
@@ -215,6 +351,212 @@ async def test_connection_pool(mocker, monkeypatch):
     await pool.close()
 
 
+@pytest.mark.asyncio
+async def test_connection_list_outlier_ejection(mocker, monkeypatch):
+    _, _ = await _mock_grpc(mocker, monkeypatch)
+    connection_list = ReplicaList(
+        health_policy=HealthPolicy(outlier_failures=2, outlier_ejection_time=0.1)
+    )
+    for address in ['1.1.1.1', '1.1.1.2', '1.1.1.3', '1.1.1.4']:
+        connection_list.add_connection(address=address)
+    first, second, third, fourth = connection_list.get_all_connections()
+
+    connection_list.report_failure(first)
+    assert not first.ejected
+    connection_list.report_failure(first)
+    assert first.ejected
+    for _ in range(6):
+        assert connection_list.get_next_connection() is not first
+
+    # a replica far slower than its peers is ejected too
+    for connection, latency in [(second, 1.0), (third, 0.01), (fourth, 0.01)]:
+        for _ in range(HealthPolicy.MIN_LATENCY_SAMPLES):
+            connection.request_started()
+            connection.request_finished(latency)
+    connection_list.report_success(second)
+    assert second.ejected
+
+    # at most half of the replicas are ejected
+    for _ in range(2):
+        connection_list.report_failure(third)
+    assert not third.ejected
+
+    # after the ejection time the replicas are readmitted once they answer a STATUS probe
+    for connection in connection_list.get_all_connections():
+        connection.control_stub.process_control = mocker.AsyncMock()
+    await asyncio.sleep(0.1)
+    connection_list.get_next_connection()
+    await asyncio.sleep(0)
+    assert not first.ejected and not second.ejected
+    assert connection_list.get_stats()[first.address]['num_ejections'] == 1
+    await connection_list.close()
+
+
+class _DataCall:
+    def __init__(self, response, delay=0):
+        self._response = response
+        self._delay = delay
+
+    async def trailing_metadata(self):
+        await asyncio.sleep(self._delay)
+        return grpc.aio.Metadata()
+
+    def __await__(self):
+        yield from asyncio.sleep(0).__await__()
+        return self._response
+
+
+def _unavailable_rpc(request, **kwargs):
+    raise grpc.aio.AioRpcError(
+        grpc.StatusCode.UNAVAILABLE, grpc.aio.Metadata(), grpc.aio.Metadata()
+    )
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_retries_and_circuit_breaker(mocker, monkeypatch):
+    _, _ = await _mock_grpc(mocker, monkeypatch)
+    pool = GrpcConnectionPool(
+        health_policy=HealthPolicy(
+            retry_backoff=0,
+            outlier_failures=0,
+            circuit_breaker_failures=2,
+            circuit_breaker_reset_time=60,
+        )
+    )
+    pool.add_connection(deployment='encoder', head=False, address='1.1.1.1:53')
+    pool.add_connection(deployment='encoder', head=False, address='1.1.1.2:53')
+    replicas = pool._connections.get_replicas('encoder', False, 0)
+    broken, working = replicas.get_all_connections()
+    broken.channels[0].single_data_stub = mocker.Mock()
+    broken.channels[0].single_data_stub.process_single_data = mocker.Mock(
+        side_effect=_unavailable_rpc
+    )
+    working.channels[0].single_data_stub = mocker.Mock()
+    working.channels[0].single_data_stub.process_single_data = mocker.Mock(
+        side_effect=lambda request, **kwargs: _DataCall(request)
+    )
+
+    # the retry goes to the other replica
+    for _ in range(2):
+        request = list(request_generator('/', DocumentArray([Document()])))[0]
+        response, _ = await pool.send_request(
+            request=request, deployment='encoder', head=False
+        )[0]
+        assert response is request
+    assert broken.num_failures >= 1
+    assert working.get_stats()['num_requests'] == 2
+
+    working.channels[
+        0
+    ].single_data_stub.process_single_data.side_effect = _unavailable_rpc
+    for _ in range(2):
+        with pytest.raises(grpc.aio.AioRpcError):
+            await pool.send_request(request=request, deployment='encoder', head=False)[
+                0
+            ]
+    stats = pool.get_connection_stats()['encoder']['circuit_breaker']
+    assert stats['open'] and stats['num_opened'] == 1
+
+    # the open circuit fails fast without sending
+    num_calls = working.channels[0].single_data_stub.process_single_data.call_count
+    with pytest.raises(grpc.aio.AioRpcError):
+        await pool.send_request(request=request, deployment='encoder', head=False)[0]
+    assert (
+        working.channels[0].single_data_stub.process_single_data.call_count == num_calls
+    )
+    await pool.close()
+
+
+def _deadline_exceeded_rpc(request, **kwargs):
+    raise grpc.aio.AioRpcError(
+        grpc.StatusCode.DEADLINE_EXCEEDED, grpc.aio.Metadata(), grpc.aio.Metadata()
+    )
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_deadline_and_backoff(mocker, monkeypatch):
+    _, _ = await _mock_grpc(mocker, monkeypatch)
+    pool = GrpcConnectionPool(
+        health_policy=HealthPolicy(max_attempts=3, retry_backoff=10, outlier_failures=1)
+    )
+    pool.add_connection(deployment='encoder', head=False, address='1.1.1.1:53')
+    replicas = pool._connections.get_replicas('encoder', False, 0)
+    (connection,) = replicas.get_all_connections()
+    connection.channels[0].single_data_stub = mocker.Mock()
+    connection.channels[0].single_data_stub.process_single_data = mocker.Mock(
+        side_effect=_deadline_exceeded_rpc
+    )
+
+    # the client deadline passing does not count as a failure of the replica
+    request = list(request_generator('/', DocumentArray([Document()]), timeout=1))[0]
+    response, _ = await pool.send_request(
+        request=request, deployment='encoder', head=False
+    )[0]
+    assert response.header.status.code == jina_pb2.StatusProto.ERROR_TIMEOUT
+    assert connection.num_failures == 0
+    assert not connection.ejected
+
+    # the backoff before a retry does not outlast the deadline of the request
+    connection.channels[
+        0
+    ].single_data_stub.process_single_data.side_effect = _unavailable_rpc
+    request = list(request_generator('/', DocumentArray([Document()]), timeout=0.2))[0]
+    start = time.perf_counter()
+    response, _ = await pool.send_request(
+        request=request, deployment='encoder', head=False
+    )[0]
+    assert time.perf_counter() - start < 1
+    assert response.header.status.code == jina_pb2.StatusProto.ERROR_TIMEOUT
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_hedging(mocker, monkeypatch):
+    _, _ = await _mock_grpc(mocker, monkeypatch)
+    pool = GrpcConnectionPool(hedge_policy=HedgePolicy(['/search'], budget=0.05))
+    pool.add_connection(deployment='encoder', head=False, address='1.1.1.1:53')
+    pool.add_connection(deployment='encoder', head=False, address='1.1.1.2:53')
+    replicas = pool._connections.get_replicas('encoder', False, 0)
+    hedger = replicas.hedger
+    for _ in range(HedgePolicy.MIN_SAMPLES):
+        hedger.observe(0.01)
+    # the budget allows one duplicate every 20 requests
+    for _ in range(19):
+        hedger.get_delay('/search')
+    slow, fast = replicas.get_all_connections()
+    for connection, delay in [(slow, 10), (fast, 0)]:
+        connection.channels[0].single_data_stub = mocker.Mock()
+        connection.channels[0].single_data_stub.process_single_data = mocker.Mock(
+            side_effect=lambda request, delay=delay, **kwargs: _DataCall(request, delay)
+        )
+
+    request = list(request_generator('/search', DocumentArray([Document()])))[0]
+    start = time.perf_counter()
+    response, _ = await pool.send_request(
+        request=request, deployment='encoder', head=False, endpoint='/search'
+    )[0]
+    assert response is request
+    assert time.perf_counter() - start < 1
+    await asyncio.sleep(0)
+    # the call to the slow replica is cancelled
+    assert slow.in_flight == 0
+
+    # other endpoints are not hedged
+    slow.channels[0].single_data_stub = fast.channels[0].single_data_stub
+    await pool.send_request(
+        request=request, deployment='encoder', head=False, endpoint='/index'
+    )[0]
+    assert not hedger.acquire()
+    assert pool.get_connection_stats()['encoder']['hedging'] == {
+        'delay': 0.01,
+        'num_requests': 20,
+        'num_hedged': 1,
+        'num_hedge_wins': 1,
+        'num_over_budget': 1,
+    }
+    await pool.close()
+
+
 async def _mock_grpc(mocker, monkeypatch):
     create_mock = mocker.Mock()
     close_mock_object = mocker.Mock()
@@ -321,6 +663,164 @@ async def test_grpc_connection_pool_real_sending():
     server_process2.join()
 
 
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.timeout(5)
+async def test_grpc_connection_pool_compression():
+    server_ready_event = multiprocessing.Event()
+
+    def listen(port, event: multiprocessing.Event):
+        class DummyServer:
+            async def process_single_data(self, request, *args):
+                assert len(request.docs) == 100
+                return request
+
+        async def start_grpc_server():
+            grpc_server = grpc.aio.server(
+                options=[
+                    ('grpc.max_send_request_length', -1),
+                    ('grpc.max_receive_message_length', -1),
+                ]
+            )
+
+            jina_pb2_grpc.add_JinaSingleDataRequestRPCServicer_to_server(
+                DummyServer(), grpc_server
+            )
+            grpc_server.add_insecure_port(f'localhost:{port}')
+
+            await grpc_server.start()
+            event.set()
+            await grpc_server.wait_for_termination()
+
+        asyncio.run(start_grpc_server())
+
+    port = random_port()
+    server_process = Process(
+        target=listen,
+        args=(
+            port,
+            server_ready_event,
+        ),
+    )
+    server_process.start()
+
+    time.sleep(0.1)
+    server_ready_event.wait()
+
+    pool = GrpcConnectionPool(
+        compressor=DataRequestCompressor(CompressAlgo.ZLIB, min_bytes=0)
+    )
+    pool.add_connection(deployment='encoder', head=False, address=f'localhost:{port}')
+    sent_msg = list(
+        request_generator(
+            '/',
+            DocumentArray([Document(text='compress me' * 10) for _ in range(100)]),
+        )
+    )[0]
+
+    response, meta = await pool.send_request(
+        request=sent_msg, deployment='encoder', head=False
+    )[0]
+    assert len(response.docs) == 100
+    assert response.docs[0].text == 'compress me' * 10
+
+    stats = pool.get_connection_stats()['encoder']['shards'][0][f'localhost:{port}']
+    assert stats['compression']['num_compressed'] == 1
+    assert stats['compression']['bytes_saved'] > 0
+
+    await pool.close()
+    server_process.kill()
+    server_process.join()
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.timeout(5)
+async def test_grpc_connection_pool_streaming():
+    server_ready_event = multiprocessing.Event()
+
+    def listen(port, event: multiprocessing.Event, streaming: bool):
+        class StreamingServer:
+            async def Call(self, request_iterator, *args):
+                # the responses of every pair of requests are sent back in reverse order
+                pending = []
+                async for request in request_iterator:
+                    docs = request.docs
+                    docs[0].text = 'streamed'
+                    request.data.docs = docs
+                    pending.append(request)
+                    if len(pending) == 2:
+                        yield pending.pop()
+                        yield pending.pop()
+
+        class UnaryServer:
+            async def process_single_data(self, request, *args):
+                docs = request.docs
+                docs[0].text = 'unary'
+                request.data.docs = docs
+                return request
+
+        async def start_grpc_server():
+            grpc_server = grpc.aio.server()
+            if streaming:
+                jina_pb2_grpc.add_JinaRPCServicer_to_server(
+                    StreamingServer(), grpc_server
+                )
+            jina_pb2_grpc.add_JinaSingleDataRequestRPCServicer_to_server(
+                UnaryServer(), grpc_server
+            )
+            grpc_server.add_insecure_port(f'localhost:{port}')
+
+            await grpc_server.start()
+            event.set()
+            await grpc_server.wait_for_termination()
+
+        asyncio.run(start_grpc_server())
+
+    server_processes = []
+    ports = {}
+    for deployment, streaming in (('streaming', True), ('unary', False)):
+        server_ready_event.clear()
+        ports[deployment] = random_port()
+        server_process = Process(
+            target=listen, args=(ports[deployment], server_ready_event, streaming)
+        )
+        server_process.start()
+        server_ready_event.wait()
+        server_processes.append(server_process)
+
+    pool = GrpcConnectionPool(stream_window=4)
+    for deployment, port in ports.items():
+        pool.add_connection(
+            deployment=deployment, head=False, address=f'localhost:{port}'
+        )
+
+    sent_msgs = list(request_generator('/', DocumentArray.empty(4), request_size=1))
+    results = await asyncio.gather(
+        *[
+            pool.send_request(request=msg, deployment='streaming', head=False)[0]
+            for msg in sent_msgs
+        ]
+    )
+    # the responses are correlated to the requests by their request id
+    for msg, (response, metadata) in zip(sent_msgs, results):
+        assert response.header.request_id == msg.header.request_id
+        assert response.docs[0].text == 'streamed'
+        assert 'is-error' not in dict(metadata)
+
+    # a replica without the stream gets unary calls
+    for msg in sent_msgs[:2]:
+        response, _ = await pool.send_request(
+            request=msg, deployment='unary', head=False
+        )[0]
+        assert response.docs[0].text == 'unary'
+
+    await pool.close()
+    for server_process in server_processes:
+        server_process.kill()
+        server_process.join()
+
+
 @pytest.mark.asyncio
 @pytest.mark.slow
 @pytest.mark.timeout(5)
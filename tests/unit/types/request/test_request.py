@@ -4,11 +4,18 @@ import pytest
 from google.protobuf.json_format import MessageToDict, MessageToJson
 
 from docarray.proto.docarray_pb2 import DocumentProto
-from jina.excepts import BadRequestType
+from jina.excepts import BadRequestCompression, BadRequestType
 from jina.helper import random_identity
 from jina.proto import jina_pb2
 from docarray import DocumentArray, Document
-from jina.proto.serializer import DataRequestProto
+from jina.enums import CompressAlgo
+from jina.proto.serializer import (
+    DataRequestProto,
+    DataRequestCompressor,
+    DataRequestListProto,
+    compress_bytes,
+    decompress_bytes,
+)
 from jina.types.request.control import ControlRequest
 from jina.types.request.data import DataRequest, Response
 from tests import random_docs
@@ -124,6 +131,148 @@ def test_lazy_serialization_bytes():
     assert deserialized_request.is_decompressed
 
 
+def test_pass_through_serialization():
+    r = DataRequest()
+    r.data.docs = DocumentArray([Document(text='hello') for _ in range(10)])
+    r.parameters = {'limit': 3}
+    byte_array = DataRequestProto.SerializeToString(r)
+
+    forwarded = DataRequestProto.FromString(byte_array)
+    forwarded.routes.add().executor = 'executor0'
+    forwarded.header.exec_endpoint = '/search'
+    assert forwarded.parameters == {'limit': 3}
+    assert not forwarded.proto_wo_data.HasField('data')
+    forwarded_bytes = DataRequestProto.SerializeToString(forwarded)
+    # the docs were never deserialized
+    assert not forwarded.proto_wo_data.HasField('data')
+
+    received = DataRequestProto.FromString(forwarded_bytes)
+    assert received.header.exec_endpoint == '/search'
+    assert received.routes[0].executor == 'executor0'
+    assert received.parameters == {'limit': 3}
+    assert received.docs.texts == ['hello'] * 10
+    assert copy.deepcopy(forwarded).docs.texts == ['hello'] * 10
+
+
+def test_parameters_cache():
+    r = DataRequest()
+    r.parameters = {'filter': {'ids': ['a', 'b']}}
+    # the parameters are only written to the proto when serializing
+    assert not r.proto_wo_data.HasField('parameters')
+    assert r.parameters is r.parameters
+
+    received = DataRequestProto.FromString(DataRequestProto.SerializeToString(r))
+    params = received.parameters
+    assert params == {'filter': {'ids': ['a', 'b']}}
+    assert received.parameters is params
+
+    params['top_k'] = 3
+    received.parameters = params
+    assert DataRequestProto.FromString(
+        DataRequestProto.SerializeToString(received)
+    ).parameters == {'filter': {'ids': ['a', 'b']}, 'top_k': 3}
+    assert received.proto.parameters['top_k'] == 3
+
+
+def test_parameters_changed_in_place():
+    r = DataRequest()
+    r.parameters = {'filter': {'ids': ['a']}}
+    received = DataRequestProto.FromString(DataRequestProto.SerializeToString(r))
+
+    # the parameters are not assigned back, the changes are still serialized
+    received.parameters['top_k'] = 3
+    received.parameters['filter']['ids'].append('b')
+    assert DataRequestProto.FromString(received.to_bytes()).parameters == {
+        'filter': {'ids': ['a', 'b']},
+        'top_k': 3,
+    }
+
+    received.parameters['top_k'] = 5
+    assert received.proto.parameters['top_k'] == 5
+
+
+def test_list_serialization():
+    requests = []
+    for i in range(3):
+        r = DataRequest()
+        r.data.docs = DocumentArray([Document(text=f'{i}')])
+        requests.append(r)
+
+    received = DataRequestListProto.FromString(
+        DataRequestListProto.SerializeToString(requests)
+    )
+    assert len(received) == 3
+    for i, r in enumerate(received):
+        assert r.header.request_id == requests[i].header.request_id
+        assert r.docs.texts == [f'{i}']
+
+    received = DataRequestListProto.FromString(
+        DataRequestListProto.SerializeToString(requests[0])
+    )
+    assert len(received) == 1
+    assert received[0].docs.texts == ['0']
+
+
+@pytest.mark.parametrize(
+    'algo',
+    [CompressAlgo.ZLIB, CompressAlgo.GZIP, CompressAlgo.BZ2, CompressAlgo.LZMA],
+)
+def test_compressed_serialization(algo):
+    doc_count = 1000
+    r = DataRequest()
+    r.data.docs = DocumentArray(
+        [Document(text='534534534er5yr5y645745675675675345')] * doc_count
+    )
+    compressor = DataRequestCompressor(algo)
+    byte_array = DataRequestProto.SerializeToString(compressor.compress(r))
+    assert len(byte_array) < len(DataRequestProto.SerializeToString(r))
+
+    deserialized_request = DataRequestProto.FromString(byte_array)
+    assert not deserialized_request.is_decompressed
+    assert len(deserialized_request.docs) == doc_count
+    assert deserialized_request.docs == r.docs
+    assert compressor.num_compressed == 1
+    assert compressor.bytes_saved > 0
+
+    # already compressed requests are passed through
+    recompressed = compressor.compress(DataRequestProto.FromString(byte_array))
+    assert recompressed.buffer == byte_array
+
+
+def test_compression_thresholds():
+    r = DataRequest()
+    r.data.docs = DocumentArray([Document(text='hello')])
+    compressor = DataRequestCompressor(CompressAlgo.ZLIB, min_bytes=1024)
+    assert compressor.compress(r) is r
+
+    compressor = DataRequestCompressor(CompressAlgo.ZLIB, min_bytes=0, min_ratio=100)
+    byte_array = DataRequestProto.SerializeToString(compressor.compress(r))
+    assert byte_array == DataRequestProto.SerializeToString(r)
+    assert compressor.get_stats()['num_skipped'] == 1
+    assert compressor.get_stats()['num_compressed'] == 0
+
+
+@pytest.mark.parametrize(
+    'algo',
+    [CompressAlgo.ZLIB, CompressAlgo.GZIP, CompressAlgo.BZ2, CompressAlgo.LZMA],
+)
+def test_decompression_limits(algo):
+    payload = b'\x0a' * 10000
+    compressed = compress_bytes(payload, algo)
+    assert decompress_bytes(compressed, max_size=10000) == payload
+    with pytest.raises(BadRequestCompression):
+        decompress_bytes(compressed, max_size=9999)
+    with pytest.raises(BadRequestCompression):
+        decompress_bytes(compressed[: len(compressed) // 2])
+
+
+def test_decompression_unknown_algo():
+    with pytest.raises(BadRequestCompression):
+        decompress_bytes(bytes([0, 42]) + b'payload')
+    with pytest.raises(BadRequestCompression):
+        DataRequest(bytes([0, int(CompressAlgo.NONE)]) + b'payload').header
+
+
 def test_status():
     r = DataRequest()
     r.docs.extend([Document()])